@@ -0,0 +1,149 @@
+"""Buy-entry reveal templates validated once when the gamestate is built, stored ready to place on the board."""
+
+from typing import Dict, List
+
+from src.calculations.position import Position
+from src.calculations.scatter import Scatter
+from src.events.events import json_ready_sym
+
+# (regular scatters, super scatters) every reveal template of a buy mode must show
+BUY_TEMPLATE_SCATTERS = {"regular_buy": (4, 0), "super_buy": (3, 1)}
+
+
+class BuyTemplate:
+    """Int-coded board, special-symbol index, anticipation and serialised reveal columns of one template."""
+
+    __slots__ = ("board", "special_syms_on_board", "anticipation", "reveal_board")
+
+    def __init__(
+        self, board: tuple, special_syms_on_board: Dict[str, List[Position]], anticipation: list, reveal_board: list
+    ):
+        self.board = board
+        self.special_syms_on_board = special_syms_on_board
+        self.anticipation = anticipation
+        self.reveal_board = reveal_board
+
+    def get_special_symbols(self) -> Dict[str, List[Position]]:
+        return {key: list(positions) for key, positions in self.special_syms_on_board.items()}
+
+
+class BuyTemplateBank:
+    """
+    Reveal templates for each buy mode, checked at start-up for board shape, scatter counts,
+    one scatter per reel and a zero reveal win. An invalid template raises before any book is simulated.
+    """
+
+    def __init__(self, gamestate: object, templates: Dict[str, list], filler_symbol: str = "L1"):
+        self.symbol_codes = {}
+        self.symbol_names = []
+        self.symbols = []
+        self.templates = {}
+        for betmode, layouts in templates.items():
+            assert len(layouts) > 0, f"{betmode} has no buy reveal templates"
+            self.templates[betmode] = [
+                self.build_template(gamestate, betmode, idx, layout, filler_symbol)
+                for idx, layout in enumerate(layouts)
+            ]
+
+    def choose(self, betmode: str, rng: object) -> BuyTemplate:
+        return rng.choice(self.templates[betmode])
+
+    def get_board(self, template: BuyTemplate) -> list:
+        """Fresh reel lists of the bank's shared symbols, which carry no random or mutable attributes."""
+        symbols = self.symbols
+        return [[symbols[code] for code in reel] for reel in template.board]
+
+    def get_padding_symbol(self, gamestate: object, name: str) -> object:
+        """Shared symbol for reveal padding, symbols with special functions are created to draw their attributes."""
+        if name in gamestate.special_symbol_functions:
+            return gamestate.create_symbol(name)
+        return self.symbols[self.get_code(gamestate, name)]
+
+    def get_code(self, gamestate: object, name: str) -> int:
+        """Int code of a symbol name, creating the shared symbol the first time it is seen."""
+        code = self.symbol_codes.get(name)
+        if code is None:
+            code = self.symbol_codes[name] = len(self.symbols)
+            self.symbol_names.append(name)
+            self.symbols.append(gamestate.create_symbol(name))
+        return code
+
+    @staticmethod
+    def get_symbol_names(config: object, layout: list, filler_symbol: str) -> List[List[str]]:
+        """Symbol names of a template given either as reel columns or as {"reel", "row", "symbol"} placements."""
+        if not layout:
+            raise ValueError("buy entry layout is empty")
+        if isinstance(layout[0], dict):
+            names = [[filler_symbol] * config.num_rows[reel] for reel in range(config.num_reels)]
+            for placement in layout:
+                names[placement["reel"]][placement["row"]] = placement["symbol"]
+            return names
+        return [list(column) for column in layout]
+
+    def build_template(
+        self, gamestate: object, betmode: str, idx: int, layout: list, filler_symbol: str
+    ) -> BuyTemplate:
+        config = gamestate.config
+        label = f"{betmode} template {idx}"
+        names = BuyTemplateBank.get_symbol_names(config, layout, filler_symbol)
+        if len(names) != config.num_reels:
+            raise ValueError(f"{label}: expected {config.num_reels} reels, found {len(names)}")
+        for reel, column in enumerate(names):
+            if len(column) != config.num_rows[reel]:
+                raise ValueError(f"{label}: reel {reel} must have {config.num_rows[reel]} rows, found {len(column)}")
+            for name in column:
+                if name in gamestate.special_symbol_functions:
+                    raise ValueError(f"{label}: symbol {name} draws attributes when created and cannot be pre-built")
+
+        codes = tuple(tuple(self.get_code(gamestate, name) for name in column) for column in names)
+        special_syms_on_board = {key: [] for key in config.special_symbols}
+        for reel, column in enumerate(names):
+            for row, name in enumerate(column):
+                for key, positions in special_syms_on_board.items():
+                    if name in config.special_symbols[key]:
+                        positions.append(Position(reel, row))
+
+        scatter_names = set(config.special_symbols.get("scatter", [])) | set(
+            config.special_symbols.get("super_scatter", [])
+        )
+        for reel, column in enumerate(names):
+            if sum(1 for name in column if name in scatter_names) > 1:
+                raise ValueError(f"{label}: reel {reel} shows more than one scatter")
+        scatters = (
+            len(special_syms_on_board.get("scatter", [])),
+            len(special_syms_on_board.get("super_scatter", [])),
+        )
+        if betmode in BUY_TEMPLATE_SCATTERS and scatters != BUY_TEMPLATE_SCATTERS[betmode]:
+            raise ValueError(
+                f"{label}: expected (scatters, super scatters) {BUY_TEMPLATE_SCATTERS[betmode]}, found {scatters}"
+            )
+
+        # Evaluated on separate symbols, the scatter evaluator marks winning symbols to explode
+        board = [[gamestate.create_symbol(name) for name in column] for column in names]
+        total_win = round(Scatter.get_scatterpay_wins(config, board)["totalWin"], 5)
+        if total_win != 0:
+            raise ValueError(f"{label}: reveal board produced payout {total_win}x")
+        for column in board:
+            for symbol in column:
+                if symbol.check_attribute("explode"):
+                    raise ValueError(f"{label}: reveal board marks symbols to explode")
+
+        special_attributes = list(config.special_symbols.keys())
+        reveal_board = [[json_ready_sym(symbol, special_attributes) for symbol in column] for column in board]
+        anticipation = self.get_anticipation(config, special_syms_on_board.get("scatter", []))
+        return BuyTemplate(codes, special_syms_on_board, anticipation, reveal_board)
+
+    @staticmethod
+    def get_anticipation(config: object, scatter_positions: List[Position]) -> list:
+        """Basegame anticipation of a template, worked out as create_board_reelstrips does for a drawn board."""
+        anticipation = [0] * config.num_reels
+        trigger = config.anticipation_triggers[config.basegame_type]
+        first_scatter_reel = -1
+        for count, (reel, _) in enumerate(sorted(scatter_positions), start=1):
+            if count >= trigger:
+                first_scatter_reel = reel + 1
+                break
+        if first_scatter_reel > -1 and first_scatter_reel != config.num_reels:
+            for count, reel in enumerate(range(first_scatter_reel, config.num_reels), start=1):
+                anticipation[reel] = count
+        return anticipation
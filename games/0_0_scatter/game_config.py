@@ -2,6 +2,7 @@ import os
 from src.config.config import Config
 from src.config.distributions import Distribution
 from src.config.betmode import BetMode
+from src.calculations.statistics import WeightedSampler
 
 
 class GameConfig(Config):
@@ -70,22 +71,21 @@ class GameConfig(Config):
         self.paytable = self.convert_range_table(pay_group)
 
         base_multiplier_weights = {
-            2:   1700,
-            3:   1300,
-            4:   950,
-            5:   650,
-            6:   500,
-            8:   250,
-            10:  150,
-
-            12:  110,
-            15:  75,
-            20:  35,
-            25:  30,
-            50:  14,
+            2: 1700,
+            3: 1300,
+            4: 950,
+            5: 650,
+            6: 500,
+            8: 250,
+            10: 150,
+            12: 110,
+            15: 75,
+            20: 35,
+            25: 30,
+            50: 14,
             100: 10,
             500: 3,
-            1000:1,
+            1000: 1,
         }
         self.multiplier_weights = {
             self.basegame_type: base_multiplier_weights,
@@ -99,6 +99,7 @@ class GameConfig(Config):
             500: 2,
             1000: 1,
         }
+        self._multiplier_samplers = {}
 
         self.include_padding = True
         self.special_symbols = {
@@ -107,6 +108,7 @@ class GameConfig(Config):
             "multiplier": ["M"],
             "wild": [],
         }
+        self.symbol_aliases = {"BS": "S"}
 
         self.freespin_triggers = {
             self.basegame_type: {
@@ -311,3 +313,13 @@ class GameConfig(Config):
         if super_bonus_active and gametype == self.freegame_type:
             return self.super_multiplier_weights
         return self.multiplier_weights[gametype]
+
+    def get_multiplier_sampler(self, gametype: str, super_bonus_active: bool = False) -> WeightedSampler:
+        """Sampler over get_multiplier_pool weights, compiled once per pool."""
+        key = (gametype, super_bonus_active and gametype == self.freegame_type)
+        sampler = self._multiplier_samplers.get(key)
+        if sampler is None:
+            sampler = self._multiplier_samplers[key] = WeightedSampler(
+                self.get_multiplier_pool(gametype, super_bonus_active)
+            )
+        return sampler
@@ -1,23 +1,19 @@
+from src.events.events import skip_in_stats_mode, get_event_cents
+
 BOARD_MULT_INFO = "boardMultiplierInfo"
 
 
+@skip_in_stats_mode
 def send_mult_info_event(gamestate, board_mult: int, mult_info: dict, base_win: float, updatedWin: float):
     multiplier_info, winInfo = {}, {}
-    multiplier_info["positions"] = []
-    if gamestate.config.include_padding:
-        for m in range(len(mult_info)):
-            multiplier_info["positions"].append(
-                {"reel": mult_info[m]["reel"], "row": mult_info[m]["row"] + 1, "multiplier": mult_info[m]["value"]}
-            )
-    else:
-        for m in range(mult_info):
-            multiplier_info["positions"].append(
-                {"reel": mult_info[m]["reel"], "row": mult_info[m]["row"], "multiplier": mult_info[m]["value"]}
-            )
+    row_offset = 1 if gamestate.config.include_padding else 0
+    multiplier_info["positions"] = [
+        {"reel": reel, "row": row + row_offset, "multiplier": value} for (reel, row), value in mult_info
+    ]
 
-    winInfo["tumbleWin"] = int(round(min(base_win, gamestate.config.wincap) * 100))
+    winInfo["tumbleWin"] = get_event_cents(gamestate, base_win)
     winInfo["boardMult"] = board_mult
-    winInfo["totalWin"] = int(round(min(updatedWin, gamestate.config.wincap) * 100))
+    winInfo["totalWin"] = get_event_cents(gamestate, updatedWin)
 
     assert round(updatedWin, 1) == round(base_win * board_mult, 1)
     event = {
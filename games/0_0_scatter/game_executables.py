@@ -1,6 +1,4 @@
-"""
-
-"""
+""" """
 
 from copy import copy
 
@@ -65,16 +63,12 @@ class GameExecutables(GameCalculations):
 
     def get_scatterpays_update_wins(self):
         """Return the board since we are assigning the 'explode' attribute."""
-        aliased_syms = self._alias_super_scatter_symbols()
-        try:
-            self.win_data = Scatter.get_scatterpay_wins(
-                self.config, self.board
-            )  # Evaluate wins, self.board is modified in-place
-            Scatter.record_scatter_wins(self)
-            self.win_manager.tumble_win = self.win_data["totalWin"]
-            self.win_manager.update_spinwin(self.win_data["totalWin"])  # Update wallet
-        finally:
-            self._revert_super_scatter_symbols(aliased_syms)
+        self.win_data = Scatter.get_scatterpay_wins(
+            self.config, self.board, win_scale=self.win_scale, return_data=self.spin_pool.reset_win_data()
+        )  # Evaluate wins, self.board is modified in-place, BS pays as S through config.symbol_aliases
+        Scatter.record_scatter_wins(self)
+        self.win_manager.tumble_win = self.win_data["totalWin"]
+        self.win_manager.update_spinwin(self.win_data["totalWin"])  # Update wallet
 
     def update_freespin(self) -> None:
         """Called before a new reveal during freegame."""
@@ -82,7 +76,7 @@ class GameExecutables(GameCalculations):
         update_freespin_event(self)
         self.win_manager.reset_spin_win()
         self.tumblewin_mult = 0
-        self.win_data = {}
+        self.win_data = self.spin_pool.reset_win_data()
 
     def run_freespin_from_base(self, scatter_key: str = "scatter") -> None:
         """Trigger the freespin function, then scale payouts."""
@@ -100,13 +94,27 @@ class GameExecutables(GameCalculations):
             }
         )
         self.update_super_bonus_amount(scatter_key=scatter_key, super_scatter_key=super_scatter_key)
-        self.run_freespin()
+        self.run_bonus("super")
+        self.super_bonus_active = False
+
+    def get_bank_bonus_entries(self) -> list:
+        """Both bonus types always award the same initial spins, see update_freespin_amount."""
+        initial_spins = min(10, self.config.max_free_spins_per_round)
+        return [("freegame", initial_spins), ("super", initial_spins)]
+
+    def start_banked_bonus(self, bonus_type: str, tot_fs: int) -> None:
+        super().start_banked_bonus(bonus_type, tot_fs)
+        self.super_bonus_active = bonus_type == "super"
+
+    def end_banked_bonus(self, bonus_type: str) -> None:
         self.super_bonus_active = False
 
     def evaluate_finalwin(self) -> None:
         """Ensure running bet win matches scaled base+free sums before final evaluation."""
-        total = round(self.win_manager.basegame_wins + self.win_manager.freegame_wins, 2)
-        total = min(total, self.config.wincap)
+        total = self.win_manager.basegame_wins + self.win_manager.freegame_wins
+        if self.win_scale is None:
+            total = round(total, 2)
+        total = min(total, self.wincap_win)
         self.win_manager.running_bet_win = total
         try:
             super().evaluate_finalwin()
@@ -127,9 +135,7 @@ class GameExecutables(GameCalculations):
         """Count scatter symbols currently visible on the board."""
         scatter_set = {scatter_name}
         scatter_set.update(self.config.special_symbols.get("scatter", []))
-        return sum(
-            1 for reel in self.board for symbol in reel if getattr(symbol, "name", "") in scatter_set
-        )
+        return sum(1 for reel in self.board for symbol in reel if getattr(symbol, "name", "") in scatter_set)
 
     def get_scatter_totals(self) -> tuple[int, int]:
         """Return counts of regular and super scatters on the current board."""
@@ -150,9 +156,7 @@ class GameExecutables(GameCalculations):
         """Check whether retrigger criteria is satisfied."""
         scatter_count = self._count_regular_bonus_scatters()
         if scatter_count >= 3:
-            print(
-                f"[RetriggerCheck] mode={self.betmode} gametype={self.gametype} scatters={scatter_count}"
-            )
+            self.sim_log.event("RetriggerCheck", mode=self.betmode, gametype=self.gametype, scatters=scatter_count)
             return True
         return False
 
@@ -161,23 +165,4 @@ class GameExecutables(GameCalculations):
         scatter_names = set(self.config.special_symbols.get("scatter", []))
         if not scatter_names:
             scatter_names = {"S"}
-        return sum(
-            1 for reel in self.board for symbol in reel if getattr(symbol, "name", "") in scatter_names
-        )
-
-    def _alias_super_scatter_symbols(self):
-        aliased_symbols = []
-        for reel in range(len(self.board)):
-            for row in range(len(self.board[reel])):
-                symbol = self.board[reel][row]
-                if getattr(symbol, "name", None) == "BS":
-                    aliased_symbols.append(symbol)
-                    setattr(symbol, "_original_name", symbol.name)
-                    symbol.name = "S"
-        return aliased_symbols
-
-    def _revert_super_scatter_symbols(self, aliased_symbols):
-        for symbol in aliased_symbols:
-            symbol.name = getattr(symbol, "_original_name", "BS")
-            if hasattr(symbol, "_original_name"):
-                delattr(symbol, "_original_name")
+        return sum(1 for reel in self.board for symbol in reel if getattr(symbol, "name", "") in scatter_names)
@@ -1,8 +1,5 @@
-import random
-
 from game_executables import *
 from src.events.events import update_freespin_event, reveal_event
-from src.calculations.statistics import get_random_outcome
 
 
 class GameStateOverride(GameExecutables):
@@ -27,7 +24,6 @@ class GameStateOverride(GameExecutables):
 
     def draw_board(self, emit_event: bool = True, trigger_symbol: str = "scatter"):
         super().draw_board(emit_event=False, trigger_symbol=trigger_symbol)
-        self.get_special_symbols_on_board()
         distribution_conditions = self.get_current_distribution_conditions()
         if distribution_conditions.get("force_super_bonus") and self.gametype == self.config.basegame_type:
             self._ensure_super_bonus_mix()
@@ -48,8 +44,7 @@ class GameStateOverride(GameExecutables):
     def assign_mult_property(self, symbol):
         """Use betmode conditions to assign multiplier attribute to multiplier symbol."""
         super_bonus_active = getattr(self, "super_bonus_active", False)
-        multiplier_weights = self.config.get_multiplier_pool(self.gametype, super_bonus_active)
-        multiplier_value = get_random_outcome(multiplier_weights)
+        multiplier_value = self.config.get_multiplier_sampler(self.gametype, super_bonus_active).sample(self.rng)
         symbol.assign_attribute({"multiplier": multiplier_value})
 
     def check_game_repeat(self):
@@ -67,10 +62,9 @@ class GameStateOverride(GameExecutables):
             return
         if not scatter_positions:
             return
-        target = random.choice(scatter_positions)
-        reel, row = target["reel"], target["row"]
-        self.board[reel][row] = self.create_symbol("BS")
-        self.get_special_symbols_on_board()
+        target = self.rng.choice(scatter_positions)
+        reel, row = target
+        self.set_board_symbol(reel, row, self.create_symbol("BS"))
 
     def _clamp_super_bonus_multipliers(self):
         """Replace any low-tier multipliers during super bonus spins."""
@@ -82,17 +76,16 @@ class GameStateOverride(GameExecutables):
                     mult_value = symbol.get_attribute("multiplier")
                     if mult_value < min_super_mult:
                         adjusted += 1
-                        replacement = get_random_outcome(self.config.super_multiplier_weights)
+                        replacement = self.config.get_multiplier_sampler(self.config.freegame_type, True).sample(
+                            self.rng
+                        )
                         symbol.assign_attribute({"multiplier": replacement})
         if adjusted > 0:
-            print(
-                f"[SuperMultSanitize] mode={self.betmode} adjusted {adjusted} multipliers below {min_super_mult}x."
-            )
+            self.sim_log.event("SuperMultSanitize", mode=self.betmode, adjusted=adjusted, below=min_super_mult)
 
     def _enforce_scatter_per_reel_limit(self):
         """Ensure no reel ever shows more than one scatter-family symbol."""
         scatter_symbols = {"S", "BS"}
-        replacements_made = False
         for reel_idx in range(self.config.num_reels):
             entries = [
                 {"row": row_idx, "name": symbol.name}
@@ -108,11 +101,8 @@ class GameStateOverride(GameExecutables):
                 if entry is keep_entry:
                     continue
                 replacement_name = self._get_scatter_blocker_symbol()
-                self.board[reel_idx][entry["row"]] = self.create_symbol(replacement_name)
-                replacements_made = True
-        if replacements_made:
-            self.get_special_symbols_on_board()
+                self.set_board_symbol(reel_idx, entry["row"], self.create_symbol(replacement_name))
 
     def _get_scatter_blocker_symbol(self) -> str:
         """Return a filler symbol to replace illegal duplicate scatters."""
-        return random.choice(self.SCATTER_BLOCKER_SYMBOLS)
+        return self.rng.choice(self.SCATTER_BLOCKER_SYMBOLS)
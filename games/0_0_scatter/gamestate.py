@@ -1,10 +1,11 @@
-import random
-from typing import Dict, List, Optional, Tuple
+from typing import Optional, Tuple
 
 from game_override import GameStateOverride
-from src.calculations.scatter import Scatter
 from src.events.events import reveal_event
+from src.state.early_rejection import SpinRejected
+from src.config.validation import should_validate
 from buy_templates import REGULAR_BUY_REVEAL_TEMPLATES, SUPER_BUY_REVEAL_TEMPLATES
+from buy_template_bank import BuyTemplateBank
 
 
 class GameState(GameStateOverride):
@@ -12,6 +13,13 @@ class GameState(GameStateOverride):
 
     BUY_MODES = {"regular_buy", "super_buy"}
 
+    def __init__(self, config):
+        super().__init__(config)
+        self.buy_template_bank = BuyTemplateBank(
+            self,
+            {"regular_buy": REGULAR_BUY_REVEAL_TEMPLATES, "super_buy": SUPER_BUY_REVEAL_TEMPLATES},
+        )
+
     def run_spin(self, sim: int, simulation_seed=None):
         self.reset_seed(sim)
         if self.betmode in self.BUY_MODES:
@@ -21,35 +29,11 @@ class GameState(GameStateOverride):
         self.repeat = True
         while self.repeat:
             self.reset_book()
-            self.draw_board()
-
-            self.get_scatterpays_update_wins()
-            self.emit_tumble_win_events()  # Transmit win information
-
-            pending_bonus_type = self._determine_pending_bonus_type()
-
-            if pending_bonus_type is None:
-                while self.win_data["totalWin"] > 0 and not (self.wincap_triggered):
-                    self.tumble_game_board()
-                    self.get_scatterpays_update_wins()
-                    self.emit_tumble_win_events()  # Transmit win information
-            else:
-                self._log_scatter_bonus_debug(pending_bonus_type)
-
-            self.set_end_tumble_event()
-            self.win_manager.update_gametype_wins(self.gametype)
-
-            if pending_bonus_type == "super":
-                if self.check_super_bonus_entry():
-                    self.run_super_bonus_from_base()
-            elif pending_bonus_type == "regular":
-                if self.check_freespin_entry():
-                    self.run_freespin_from_base()
-            else:
-                if self.should_trigger_super_bonus() and self.check_super_bonus_entry():
-                    self.run_super_bonus_from_base()
-                elif self.check_fs_condition() and self.check_freespin_entry():
-                    self.run_freespin_from_base()
+            try:
+                self._run_base_attempt()
+            except SpinRejected as rejection:
+                self.reject_attempt(rejection)
+                continue
 
             self.evaluate_finalwin()
             self.check_repeat()
@@ -58,21 +42,20 @@ class GameState(GameStateOverride):
 
     def run_freespin(self):
         self.reset_fs_spin()
-        while (
-            self.fs < self.tot_fs
-            and self.fs < self.config.max_free_spins_per_round
-        ):
+        while self.fs < self.tot_fs and self.fs < self.config.max_free_spins_per_round:
             self.update_freespin()
             self.draw_board()
 
             self.get_scatterpays_update_wins()
             self.emit_tumble_win_events()  # Transmit win information
+            self.check_early_rejection("freegame")
 
             while self.win_data["totalWin"] > 0 and not (self.wincap_triggered):
                 self.tumble_game_board()
 
                 self.get_scatterpays_update_wins()
                 self.emit_tumble_win_events()  # Transmit win information
+                self.check_early_rejection("tumble")
 
             self.set_end_tumble_event()
             retrigger_ready = self.grant_bonus_retrigger_if_needed()
@@ -83,6 +66,40 @@ class GameState(GameStateOverride):
 
         self.end_freespin()
 
+    def _run_base_attempt(self) -> None:
+        """Play one attempt of a basegame spin, including any bonus it triggers."""
+        self.draw_board()
+
+        self.get_scatterpays_update_wins()
+        self.emit_tumble_win_events()  # Transmit win information
+        self.check_early_rejection("reveal")
+
+        pending_bonus_type = self._determine_pending_bonus_type()
+
+        if pending_bonus_type is None:
+            while self.win_data["totalWin"] > 0 and not (self.wincap_triggered):
+                self.tumble_game_board()
+                self.get_scatterpays_update_wins()
+                self.emit_tumble_win_events()  # Transmit win information
+                self.check_early_rejection("tumble")
+        else:
+            self._log_scatter_bonus_debug(pending_bonus_type)
+
+        self.set_end_tumble_event()
+        self.win_manager.update_gametype_wins(self.gametype)
+
+        if pending_bonus_type == "super":
+            if self.check_super_bonus_entry():
+                self.run_super_bonus_from_base()
+        elif pending_bonus_type == "regular":
+            if self.check_freespin_entry():
+                self.run_freespin_from_base()
+        else:
+            if self.should_trigger_super_bonus() and self.check_super_bonus_entry():
+                self.run_super_bonus_from_base()
+            elif self.check_fs_condition() and self.check_freespin_entry():
+                self.run_freespin_from_base()
+
     def should_trigger_super_bonus(self) -> bool:
         """Check if the board qualifies for a super bonus trigger."""
         if self.repeat:
@@ -109,48 +126,44 @@ class GameState(GameStateOverride):
         total_scatter = scatter_count + super_count
         scatter_symbol_names = set(self.config.special_symbols.get("scatter", []))
         scatter_symbol_names.update(self.config.special_symbols.get("super_scatter", []))
-        scatter_win = sum(
-            win["win"] for win in self.win_data["wins"] if win["symbol"] in scatter_symbol_names
-        )
+        scatter_win = sum(win["win"] for win in self.win_data["wins"] if win["symbol"] in scatter_symbol_names)
         scatter_positions = list(self.special_syms_on_board.get("scatter", [])) + list(
             self.special_syms_on_board.get("super_scatter", [])
         )
-        assert not any(
-            self.board[pos["reel"]][pos["row"]].check_attribute("explode") for pos in scatter_positions
-        ), "Scatter symbols must remain on board during a bonus trigger spin."
+        if should_validate(self.sim, self.config.validation):
+            assert not any(
+                self.board[reel][row].check_attribute("explode") for reel, row in scatter_positions
+            ), "Scatter symbols must remain on board during a bonus trigger spin."
 
         if total_scatter >= 4 or getattr(self, "scatter_debug_logging", False):
-            print(
-                "[ScatterDebug] mode={mode} bonus={bonus} scatters={count} scatter_win={scatter_win:.2f} "
-                "spin_total={spin_total:.2f}".format(
-                    mode=self.betmode,
-                    bonus=pending_bonus_type,
-                    count=total_scatter,
-                    scatter_win=scatter_win,
-                    spin_total=self.win_data["totalWin"],
-                )
+            self.sim_log.event(
+                "ScatterDebug",
+                mode=self.betmode,
+                bonus=pending_bonus_type,
+                scatters=total_scatter,
+                scatter_win=scatter_win,
+                spin_total=self.win_data["totalWin"],
             )
 
     def _run_buy_entry_spin(self, betmode: str) -> None:
+        """
+        Reveal a pre-validated buy template and play the bonus. Only reel stops are drawn, for the reveal
+        padding and reel positions, the anticipation comes with the template.
+        """
         self.reset_book()
-        self.draw_board(emit_event=False)
-        template = self._select_buy_template(betmode)
-        self._build_buy_entry_board(template)
-        self.get_special_symbols_on_board()
-        self._assert_no_buy_reveal_win(betmode)
-        reveal_event(self)
+        template = self.buy_template_bank.choose(betmode, self.rng)
+        self._draw_buy_entry_stops()
+        self.board = self.buy_template_bank.get_board(template)
+        self.special_syms_on_board = template.get_special_symbols()
+        self.anticipation = list(template.anticipation)
+        reveal_event(self, board_client=template.reveal_board)
         scatter_count, super_count = self._get_scatter_counts()
+        self.sim_log.event("BuyEntry", mode=betmode, scatters=scatter_count, super_scatters=super_count)
 
         if betmode == "regular_buy":
-            assert scatter_count == 4 and super_count == 0, "regular_buy requires exactly 4 scatters."
-            print(f"[BuyEntry] regular_buy scatters={scatter_count} super_scatters={super_count}")
             if self.check_freespin_entry():
                 self.run_freespin_from_base()
         else:
-            assert (
-                scatter_count == 3 and super_count == 1
-            ), "super_buy requires 3 scatters plus exactly 1 BS."
-            print(f"[BuyEntry] super_buy scatters={scatter_count} super_scatters={super_count}")
             if self.check_super_bonus_entry():
                 self.run_super_bonus_from_base()
 
@@ -158,43 +171,27 @@ class GameState(GameStateOverride):
         self.check_repeat()
         self.imprint_wins()
 
-    def _build_buy_entry_board(self, layout: List[Dict[str, object]] | List[List[str]]) -> None:
-        if not layout:
-            raise ValueError("buy entry layout is empty")
-
-        if isinstance(layout[0], dict):
-            filler_symbol = getattr(self, "buy_entry_filler_symbol", "L1")
-            self.board = [
-                [self.create_symbol(filler_symbol) for _ in range(self.config.num_rows[reel_idx])]
-                for reel_idx in range(self.config.num_reels)
+    def _draw_buy_entry_stops(self) -> None:
+        """Draw a reelstrip and a stop per reel around a buy template, without building a board from them."""
+        self.reelstrip_id = self.get_criteria_context().get_sampler("reel_weights", self.gametype).sample(self.rng)
+        self.reelstrip = self.config.reels[self.reelstrip_id]
+        self.reel_positions = [self.rng.randrange(len(strip)) for strip in self.reelstrip]
+        self.padding_position = [
+            (pos + self.config.num_rows[reel] + 1) % len(self.reelstrip[reel])
+            for reel, pos in enumerate(self.reel_positions)
+        ]
+        if self.config.include_padding:
+            bank = self.buy_template_bank
+            self.top_symbols = [
+                bank.get_padding_symbol(self, strip[(pos - 1) % len(strip)])
+                for strip, pos in zip(self.reelstrip, self.reel_positions)
+            ]
+            self.bottom_symbols = [
+                bank.get_padding_symbol(self, strip[(pos + self.config.num_rows[reel]) % len(strip)])
+                for reel, (strip, pos) in enumerate(zip(self.reelstrip, self.reel_positions))
             ]
-            for placement in layout:
-                reel = placement["reel"]
-                row = placement["row"]
-                symbol_name = placement["symbol"]
-                self.board[reel][row] = self.create_symbol(symbol_name)
-            return
-
-        assert len(layout) == self.config.num_reels, "buy template reel count mismatch"
-        new_board: List[List[object]] = []
-        for reel_idx, column in enumerate(layout):
-            assert len(column) == self.config.num_rows[reel_idx], "buy template row count mismatch"
-            new_board.append([self.create_symbol(symbol_name) for symbol_name in column])
-        self.board = new_board
 
     def _get_scatter_counts(self) -> Tuple[int, int]:
         regular = len(self.special_syms_on_board.get("scatter", []))
         super_scatter = len(self.special_syms_on_board.get("super_scatter", []))
         return regular, super_scatter
-
-    def _select_buy_template(self, betmode: str) -> List[List[str]]:
-        templates = (
-            REGULAR_BUY_REVEAL_TEMPLATES if betmode == "regular_buy" else SUPER_BUY_REVEAL_TEMPLATES
-        )
-        template = random.choice(templates)
-        return [list(column) for column in template]
-
-    def _assert_no_buy_reveal_win(self, betmode: str) -> None:
-        win_data = Scatter.get_scatterpay_wins(self.config, self.board)
-        total_win = round(win_data["totalWin"], 5)
-        assert total_win == 0, f"{betmode} reveal board produced payout {total_win}x"
@@ -10,11 +10,12 @@ Constraints enforced here:
 
 from __future__ import annotations
 
+import argparse
 import csv
 import random
 from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 ROWS_PER_REEL = 60
 NUM_REELS = 6
@@ -41,9 +42,7 @@ def place_symbol(column: SymbolColumn, row: int, symbol: str) -> None:
     column[row] = symbol
 
 
-def validate_columns(
-    columns: List[SymbolColumn], *, allow_super_scatter: bool, mode_name: str
-) -> None:
+def validate_columns(columns: List[SymbolColumn], *, allow_super_scatter: bool, mode_name: str) -> None:
     for reel_idx, column in enumerate(columns):
         scatter_count = column.count("S")
         super_scatter_count = column.count("BS")
@@ -62,7 +61,7 @@ def write_reel_file(mode: str, columns: List[SymbolColumn]) -> None:
     output_path = REELS_DIR / f"{mode}.csv"
     with output_path.open("w", newline="") as handle:
         writer = csv.writer(handle)
-        for row_idx in range(ROWS_PER_REEL):
+        for row_idx in range(len(columns[0])):
             writer.writerow([columns[reel_idx][row_idx] for reel_idx in range(NUM_REELS)])
 
 
@@ -74,7 +73,7 @@ def summarize(columns: List[SymbolColumn]) -> str:
     return ordered
 
 
-def build_mode(mode_name: str, config: dict) -> None:
+def build_columns(mode_name: str, config: dict) -> List[SymbolColumn]:
     rng = random.Random(config["seed"])
     columns = [build_weighted_column(config["weights"], rng) for _ in range(NUM_REELS)]
 
@@ -85,108 +84,119 @@ def build_mode(mode_name: str, config: dict) -> None:
     for reel_idx, rows in config.get("multiplier_rows", {}).items():
         for row in rows:
             if columns[reel_idx][row] in {"S", "BS"}:
-                raise ValueError(
-                    f"{mode_name}: multiplier row {row} on reel {reel_idx} conflicts with a scatter."
-                )
+                raise ValueError(f"{mode_name}: multiplier row {row} on reel {reel_idx} conflicts with a scatter.")
             place_symbol(columns[reel_idx], row, "M")
 
     validate_columns(columns, allow_super_scatter=config["allow_super_scatter"], mode_name=mode_name)
-    write_reel_file(mode_name, columns)
+    return columns
+
+
+def build_mode(mode_name: str, config: dict, write: bool = True) -> None:
+    columns = build_columns(mode_name, config)
+    if write:
+        write_reel_file(mode_name, columns)
     print(f"{mode_name}: {summarize(columns)}")
 
 
-def main():
-    modes = {
-        "BASE": {
-            "seed": 73,
-            "weights": {
-                "H1": 6,
-                "H2": 5,
-                "H3": 4,
-                "H4": 4,
-                "L1": 10,
-                "L2": 9,
-                "L3": 8,
-                "L4": 8,
-                "L5": 6,
-            },
-            "scatter_map": {
-                0: {"symbol": "S", "row": 5},
-                1: {"symbol": "S", "row": 15},
-                2: {"symbol": "S", "row": 25},
-                3: {"symbol": "S", "row": 35},
-                4: {"symbol": "S", "row": 45},
-                5: {"symbol": "BS", "row": 10},
-            },
-            "allow_super_scatter": True,
+MODES = {
+    "BASE": {
+        "seed": 73,
+        "weights": {
+            "H1": 6,
+            "H2": 5,
+            "H3": 4,
+            "H4": 4,
+            "L1": 10,
+            "L2": 9,
+            "L3": 8,
+            "L4": 8,
+            "L5": 6,
+        },
+        "scatter_map": {
+            0: {"symbol": "S", "row": 5},
+            1: {"symbol": "S", "row": 15},
+            2: {"symbol": "S", "row": 25},
+            3: {"symbol": "S", "row": 35},
+            4: {"symbol": "S", "row": 45},
+            5: {"symbol": "BS", "row": 10},
+        },
+        "allow_super_scatter": True,
+    },
+    "REG": {
+        "seed": 907,
+        "weights": {
+            "H1": 5,
+            "H2": 5,
+            "H3": 5,
+            "H4": 4,
+            "L1": 6,
+            "L2": 6,
+            "L3": 5,
+            "L4": 5,
+            "L5": 4,
+        },
+        "scatter_map": {
+            0: {"symbol": "S", "row": 6},
+            1: {"symbol": "S", "row": 16},
+            2: {"symbol": "S", "row": 26},
+            3: {"symbol": "S", "row": 36},
+            4: {"symbol": "S", "row": 46},
+            5: {"symbol": "S", "row": 56},
         },
-        "REG": {
-            "seed": 907,
-            "weights": {
-                "H1": 5,
-                "H2": 5,
-                "H3": 5,
-                "H4": 4,
-                "L1": 6,
-                "L2": 6,
-                "L3": 5,
-                "L4": 5,
-                "L5": 4,
-            },
-            "scatter_map": {
-                0: {"symbol": "S", "row": 6},
-                1: {"symbol": "S", "row": 16},
-                2: {"symbol": "S", "row": 26},
-                3: {"symbol": "S", "row": 36},
-                4: {"symbol": "S", "row": 46},
-                5: {"symbol": "S", "row": 56},
-            },
-            "multiplier_rows": {
-                0: [12, 42],
-                2: [8, 32],
-                3: [22],
-                4: [18, 48],
-                5: [28],
-            },
-            "allow_super_scatter": False,
+        "multiplier_rows": {
+            0: [12, 42],
+            2: [8, 32],
+            3: [22],
+            4: [18, 48],
+            5: [28],
         },
-        "SUPER": {
-            "seed": 1337,
-            "weights": {
-                "H1": 5,
-                "H2": 5,
-                "H3": 4,
-                "H4": 4,
-                "L1": 5,
-                "L2": 5,
-                "L3": 5,
-                "L4": 4,
-                "L5": 4,
-            },
-            "scatter_map": {
-                0: {"symbol": "S", "row": 5},
-                1: {"symbol": "S", "row": 15},
-                2: {"symbol": "S", "row": 25},
-                3: {"symbol": "S", "row": 35},
-                4: {"symbol": "S", "row": 45},
-                5: {"symbol": "S", "row": 55},
-            },
-            "multiplier_rows": {
-                0: [9, 33, 49],
-                1: [13, 39],
-                2: [23, 53],
-                3: [17, 37],
-                4: [27, 47],
-                5: [31, 51],
-            },
-            "allow_super_scatter": False,
+        "allow_super_scatter": False,
+    },
+    "SUPER": {
+        "seed": 1337,
+        "weights": {
+            "H1": 5,
+            "H2": 5,
+            "H3": 4,
+            "H4": 4,
+            "L1": 5,
+            "L2": 5,
+            "L3": 5,
+            "L4": 4,
+            "L5": 4,
         },
-    }
+        "scatter_map": {
+            0: {"symbol": "S", "row": 5},
+            1: {"symbol": "S", "row": 15},
+            2: {"symbol": "S", "row": 25},
+            3: {"symbol": "S", "row": 35},
+            4: {"symbol": "S", "row": 45},
+            5: {"symbol": "S", "row": 55},
+        },
+        "multiplier_rows": {
+            0: [9, 33, 49],
+            1: [13, 39],
+            2: [23, 53],
+            3: [17, 37],
+            4: [27, 47],
+            5: [31, 51],
+        },
+        "allow_super_scatter": False,
+    },
+}
+
 
-    for mode_name, config in modes.items():
-        build_mode(mode_name, config)
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", action="append", choices=list(MODES), help="mode to build, repeatable (default: all)")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only print summaries, do not overwrite reels/<MODE>.csv"
+    )
+    args = parser.parse_args(argv)
+
+    for mode_name in args.mode or MODES:
+        build_mode(mode_name, MODES[mode_name], write=not args.dry_run)
 
 
 if __name__ == "__main__":
     main()
-
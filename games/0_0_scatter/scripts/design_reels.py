@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Search BASE reel strips for target natural trigger rates and base-game tumble RTP, without a full monte_report.py run.
+
+Starts from the build_reels.py BASE layout and anneals over symbol counts, placements and scatter rows.
+Candidates are checked with validate_columns, then scored from:
+* exact first-reveal window statistics (src.calculations.reveal_distribution) for natural trigger rates,
+* a batched first-reveal and tumble estimate on fixed stop positions for the base-game tumble RTP.
+  This is a multiplier-free, wild-free estimate of paying-symbol wins without bonuses: base spins apply no board
+  multipliers in this game and BASE strips carry neither M nor wilds, so candidates containing them are rejected.
+Runs longer than MAX_VERTICAL_RUN are penalised rather than rejected, so the search can repair the start layout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+GAME_DIR = Path(__file__).resolve().parents[1]
+ROOT_DIR = GAME_DIR.parents[1]
+for path in (GAME_DIR, ROOT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from build_reels import MODES, NUM_REELS, SymbolColumn, build_columns, summarize, validate_columns, write_reel_file
+from game_config import GameConfig
+from rebuild_base_reel import HIGH_SYMBOLS, LOW_SYMBOLS, MAX_VERTICAL_RUN
+from reveal_report import classify_natural_bonus
+from sim_utils import MODE_TRIGGER_CONFIG
+from src.calculations.reveal_distribution import get_reelstrip_distribution
+
+PAYING_SYMBOLS = HIGH_SYMBOLS + LOW_SYMBOLS
+SCATTER_NAMES = {"S", "BS"}
+# Share of the mode RTP targeted for base-game tumble wins without bonuses, see "RTP Slice Intent" in DEV_NOTES.md
+BASE_GAME_SHARE = 0.60
+SCORE_WEIGHTS = {"regular_rate": 1.0, "super_rate": 0.5, "tumble_rtp": 4.0, "vertical_runs": 0.05}
+
+
+def count_long_runs(columns: List[SymbolColumn]) -> int:
+    """Number of cells extending a run of identical symbols beyond MAX_VERTICAL_RUN."""
+    excess = 0
+    for column in columns:
+        run = 1
+        for row in range(1, len(column)):
+            run = run + 1 if column[row] == column[row - 1] else 1
+            if run > MAX_VERTICAL_RUN:
+                excess += 1
+    return excess
+
+
+class ReelEvaluator:
+    """Scores BASE candidates, the same stop positions are reused for every candidate so scores compare directly."""
+
+    def __init__(self, config: GameConfig, targets: Dict[str, float], num_boards: int = 2_000, seed: int = 0):
+        self.config = config
+        self.targets = targets
+        self.symbol_aliases = getattr(config, "symbol_aliases", {})
+        self.unmodelled_symbols = set(config.special_symbols.get("wild", [])) | set(
+            config.special_symbols.get("multiplier", [])
+        )
+        rng = random.Random(seed)
+        self.stops = [[rng.random() for _ in range(config.num_reels)] for _ in range(num_boards)]
+
+    def evaluate(self, columns: List[SymbolColumn]) -> dict:
+        distribution = get_reelstrip_distribution(self.config, columns)
+        bonuses = distribution.get_bonus_probabilities(classify_natural_bonus)
+        stats = {
+            "regular_rate": bonuses.get("regular", 0.0),
+            "super_rate": bonuses.get("super", 0.0),
+            "reveal_rtp": distribution.get_rtp(),
+            "tumble_rtp": self.estimate_tumble_rtp(columns),
+            "vertical_runs": count_long_runs(columns),
+        }
+        stats["score"] = self.score(stats)
+        return stats
+
+    def score(self, stats: dict) -> float:
+        score = SCORE_WEIGHTS["vertical_runs"] * stats["vertical_runs"]
+        for key in ("regular_rate", "super_rate"):
+            score += SCORE_WEIGHTS[key] * math.log(max(stats[key], 1e-9) / self.targets[key]) ** 2
+        score += (
+            SCORE_WEIGHTS["tumble_rtp"]
+            * ((stats["tumble_rtp"] - self.targets["tumble_rtp"]) / self.targets["tumble_rtp"]) ** 2
+        )
+        return score
+
+    def estimate_tumble_rtp(self, columns: List[SymbolColumn]) -> float:
+        """
+        Mean first-reveal plus tumble win, windows drawn as create_board_reelstrips draws them.
+        Wilds and multiplier symbols are not modelled, so strips containing them raise ValueError.
+        """
+        for reel, column in enumerate(columns):
+            unmodelled = self.unmodelled_symbols.intersection(column)
+            if unmodelled:
+                raise ValueError(
+                    f"reel {reel} contains {sorted(unmodelled)}, the tumble estimate has no wilds or multipliers"
+                )
+        num_rows = self.config.num_rows
+        windows = []
+        for reel, column in enumerate(columns):
+            starts = []
+            for start in range(len(column)):
+                names = [column[(start + row) % len(column)] for row in range(num_rows[reel])]
+                if sum(1 for name in names if name in SCATTER_NAMES) <= 1:
+                    starts.append((start, "BS" in names))
+            windows.append((starts, [start for start in starts if not start[1]]))
+
+        total_win = 0.0
+        for stops in self.stops:
+            positions = []
+            super_used = False
+            for reel, u in enumerate(stops):
+                starts, no_super = windows[reel]
+                options = no_super if super_used else starts
+                start, has_super = options[int(u * len(options))]
+                positions.append(start)
+                super_used = super_used or has_super
+            total_win += self.play_tumbles(columns, positions)
+        return total_win / len(self.stops)
+
+    def play_tumbles(self, columns: List[SymbolColumn], positions: List[int]) -> float:
+        """Scatter-pay the board and tumble until nothing pays, refilling from the strip above each window."""
+        paytable = self.config.paytable
+        board = [
+            [column[(positions[reel] + row) % len(column)] for row in range(self.config.num_rows[reel])]
+            for reel, column in enumerate(columns)
+        ]
+        win = 0.0
+        while True:
+            counts = Counter(self.symbol_aliases.get(name, name) for reel in board for name in reel)
+            step_win = sum(paytable.get((count, symbol), 0) for symbol, count in counts.items())
+            if step_win <= 0:
+                return win
+            win += step_win
+            exploding = {symbol for symbol, count in counts.items() if (count, symbol) in paytable}
+            tumbled = False
+            for reel, column in enumerate(columns):
+                kept = [name for name in board[reel] if name in SCATTER_NAMES or name not in exploding]
+                removed = len(board[reel]) - len(kept)
+                if removed:
+                    tumbled = True
+                    positions[reel] = (positions[reel] - removed) % len(column)
+                    board[reel] = [column[(positions[reel] + row) % len(column)] for row in range(removed)] + kept
+            if not tumbled:
+                return win
+
+
+def resize_columns(columns: List[SymbolColumn], rows: int, rng: random.Random) -> List[SymbolColumn]:
+    """Drop or insert random paying symbols until every reel has rows symbols, scatters are kept."""
+    resized = []
+    for column in columns:
+        column = list(column)
+        while len(column) > rows:
+            del column[rng.choice([row for row, name in enumerate(column) if name not in SCATTER_NAMES])]
+        while len(column) < rows:
+            column.insert(rng.randrange(len(column) + 1), rng.choice(PAYING_SYMBOLS))
+        resized.append(column)
+    return resized
+
+
+def propose(columns: List[SymbolColumn], rng: random.Random, allow_super_scatter: bool) -> List[SymbolColumn]:
+    """Copy of columns with one reel changed by a count, placement or scatter move."""
+    reel = rng.randrange(NUM_REELS)
+    column = list(columns[reel])
+    paying_rows = [row for row, name in enumerate(column) if name not in SCATTER_NAMES]
+    scatter_rows = [row for row, name in enumerate(column) if name in SCATTER_NAMES]
+    move = rng.random()
+    if move < 0.4:
+        # count: trade one paying symbol for another
+        row = rng.choice(paying_rows)
+        column[row] = rng.choice([name for name in PAYING_SYMBOLS if name != column[row]])
+    elif move < 0.8:
+        # placement: swap two rows of the reel
+        row_a, row_b = rng.sample(range(len(column)), 2)
+        column[row_a], column[row_b] = column[row_b], column[row_a]
+    elif scatter_rows and rng.random() < 0.5:
+        # move the reel's scatter, switch S and BS, or remove it
+        row = scatter_rows[0]
+        choice = rng.random()
+        if choice < 0.6:
+            target = rng.choice(paying_rows)
+            column[row], column[target] = column[target], column[row]
+        elif choice < 0.8 and allow_super_scatter:
+            column[row] = "BS" if column[row] == "S" else "S"
+        else:
+            column[row] = rng.choice(PAYING_SYMBOLS)
+    else:
+        # add a scatter, validate_columns rejects a second one on this reel
+        column[rng.choice(paying_rows)] = "BS" if allow_super_scatter and rng.random() < 0.2 else "S"
+    candidate = list(columns)
+    candidate[reel] = column
+    return candidate
+
+
+def anneal(
+    columns: List[SymbolColumn],
+    evaluator: ReelEvaluator,
+    iterations: int,
+    rng: random.Random,
+    allow_super_scatter: bool = True,
+    temperature: float = 0.05,
+    cooling: float = 0.995,
+    report_every: int = 50,
+) -> tuple:
+    """Simulated annealing from columns, returns the best valid candidate and its stats."""
+    validate_columns(columns, allow_super_scatter=allow_super_scatter, mode_name="start")
+    current, current_stats = columns, evaluator.evaluate(columns)
+    best, best_stats = current, current_stats
+    rejected = 0
+    for iteration in range(1, iterations + 1):
+        candidate = propose(current, rng, allow_super_scatter)
+        try:
+            validate_columns(candidate, allow_super_scatter=allow_super_scatter, mode_name="candidate")
+        except ValueError:
+            rejected += 1
+            continue
+        stats = evaluator.evaluate(candidate)
+        delta = stats["score"] - current_stats["score"]
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            current, current_stats = candidate, stats
+            if stats["score"] < best_stats["score"]:
+                best, best_stats = candidate, stats
+        temperature *= cooling
+        if iteration % report_every == 0:
+            print(f"[{iteration}] best {format_stats(best_stats)}, rejected {rejected}")
+    return best, best_stats
+
+
+def format_stats(stats: dict) -> str:
+    def rate(prob: float) -> str:
+        return f"1 in {1.0 / prob:,.0f}" if prob > 0 else "never"
+
+    return (
+        f"score {stats['score']:.4f}: regular {rate(stats['regular_rate'])}, super {rate(stats['super_rate'])},"
+        f" tumble rtp {stats['tumble_rtp']:.4f} (reveal {stats['reveal_rtp']:.4f}), long runs {stats['vertical_runs']}"
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", default="base", choices=sorted(MODE_TRIGGER_CONFIG), help="trigger-rate targets")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--boards", type=int, default=2_000, help="boards per tumble estimate")
+    parser.add_argument("--rows", type=int, help="strip length, with one scatter per reel this sets the trigger rates")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write", metavar="NAME", help="write the best strip to reels/NAME.csv")
+    args = parser.parse_args(argv)
+
+    config = GameConfig()
+    trigger_targets = MODE_TRIGGER_CONFIG[args.mode]
+    targets = {
+        "regular_rate": trigger_targets["target_regular_rate"],
+        "super_rate": trigger_targets["target_super_rate"],
+        "tumble_rtp": BASE_GAME_SHARE * config.rtp,
+    }
+    evaluator = ReelEvaluator(config, targets, num_boards=args.boards, seed=args.seed)
+    start = build_columns("BASE", MODES["BASE"])
+    if args.rows:
+        start = resize_columns(start, args.rows, random.Random(args.seed))
+    print(f"start {format_stats(evaluator.evaluate(start))}")
+
+    best, best_stats = anneal(start, evaluator, args.iterations, random.Random(args.seed))
+    print(f"best {format_stats(best_stats)}")
+    print(f"symbols {summarize(best)}")
+    if args.write:
+        write_reel_file(args.write, best)
+        print(f"wrote reels/{args.write}.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,8 @@ if str(GAME_DIR) not in sys.path:
 import sim_utils as s
 
 
-def summarize_spin_mode(mode: str, spins: int = 200_000, include_bonuses: bool = True):
-    res = s.run_monte_carlo(num_spins=spins, mode=mode, include_bonuses=include_bonuses)
+def summarize_spin_mode(service: s.MonteCarloService, mode: str, spins: int = 200_000, include_bonuses: bool = True):
+    res = service.run_spins(spins, mode=mode, include_bonuses=include_bonuses)
     total_bet = res["total_bet"] or 1.0
     buckets = {
         label: {
@@ -24,6 +24,7 @@ def summarize_spin_mode(mode: str, spins: int = 200_000, include_bonuses: bool =
         "spins": res["num_spins"],
         "bet_per_spin": res["bet_per_spin"],
         "total_rtp": res["total_return"] / total_bet,
+        "rtp_std_error": res["rtp_std_error"],
         "base_rtp": res["sum_base_win_no_bonus"] / total_bet,
         "regular_bonus_rtp": res["sum_regular_bonus_win"] / total_bet,
         "super_bonus_rtp": res["sum_super_bonus_win"] / total_bet,
@@ -42,24 +43,27 @@ def summarize_spin_mode(mode: str, spins: int = 200_000, include_bonuses: bool =
     return data
 
 
-def summarize_buy_mode(mode: str, runs: int = 50_000):
-    res = s.measure_buy_mode_rtp(runs, mode=mode)
+def summarize_buy_mode(service: s.MonteCarloService, mode: str, runs: int = 50_000):
+    res = service.measure_buy_mode(runs, mode)
     return {
         "mode": mode,
-        "runs": runs,
+        "runs": res["runs"],
         "rtp": res["rtp"],
+        "rtp_std_error": res["rtp_std_error"],
         "avg_win": res["avg_win"],
         "bucket_counts": res["bucket_counts"],
     }
 
 
 def main():
-    summaries = [
-        summarize_spin_mode("base"),
-        summarize_spin_mode("bonus_hunt"),
-        summarize_buy_mode("regular_buy"),
-        summarize_buy_mode("super_buy"),
-    ]
+    # One warmed pool serves all four modes
+    with s.MonteCarloService() as service:
+        summaries = [
+            summarize_spin_mode(service, "base"),
+            summarize_spin_mode(service, "bonus_hunt"),
+            summarize_buy_mode(service, "regular_buy"),
+            summarize_buy_mode(service, "super_buy"),
+        ]
     for summary in summaries:
         print(f"=== {summary['mode']} ===")
         print(json.dumps(summary, indent=2))
@@ -67,4 +71,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
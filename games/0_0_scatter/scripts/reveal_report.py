@@ -0,0 +1,69 @@
+"""Exact first-reveal scatter counts, natural trigger rates and scatter-pay RTP for every base-game reel_weights mix."""
+
+import sys
+from pathlib import Path
+
+GAME_DIR = Path(__file__).resolve().parents[1]
+ROOT_DIR = GAME_DIR.parents[1]
+for path in (GAME_DIR, ROOT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from game_config import GameConfig
+from sim_utils import MODE_TRIGGER_CONFIG
+from src.calculations.reveal_distribution import get_reveal_distributions, get_mix_distribution
+
+
+def classify_natural_bonus(scatters: int, super_scatters: int):
+    """Natural bonus of a reveal, as GameState.get_natural_bonus_type decides it."""
+    if super_scatters == 1 and scatters >= 3:
+        return "super"
+    if super_scatters == 0 and scatters >= 4:
+        return "regular"
+    return None
+
+
+def get_base_mixes(config: GameConfig) -> dict:
+    """Distinct base-game reel_weights mixes of natural (non-forced) distributions, with the bet modes using them."""
+    mixes = {}
+    for betmode in config.bet_modes:
+        for distribution in betmode.get_distributions():
+            conditions = betmode.get_distribution_conditions(distribution.get_criteria())
+            if conditions.get("force_freegame") or betmode.get_buybonus():
+                continue
+            reel_weights = conditions["reel_weights"][config.basegame_type]
+            key = tuple(sorted(reel_weights.items()))
+            mixes.setdefault(key, set()).add(betmode.get_name())
+    return mixes
+
+
+def format_rate(prob: float) -> str:
+    return f"1 in {1.0 / prob:,.1f}" if prob > 0 else "never"
+
+
+def main():
+    config = GameConfig()
+    distributions = get_reveal_distributions(config)
+    for key, betmodes in get_base_mixes(config).items():
+        mix = get_mix_distribution(distributions, dict(key))
+        bonuses = mix.get_bonus_probabilities(classify_natural_bonus)
+        print(f"=== reel_weights {dict(key)} ({', '.join(sorted(betmodes))}) ===")
+        for total, prob in mix.get_scatter_totals().items():
+            print(f"  {total} scatters: {prob:.6f}")
+        for mode in sorted(betmodes):
+            if mode in MODE_TRIGGER_CONFIG:
+                targets = MODE_TRIGGER_CONFIG[mode]
+                print(
+                    f"  {mode} targets: regular {format_rate(targets['target_regular_rate'])},"
+                    f" super {format_rate(targets['target_super_rate'])}"
+                )
+        print(f"  natural regular: {format_rate(bonuses.get('regular', 0.0))}")
+        print(f"  natural super: {format_rate(bonuses.get('super', 0.0))}")
+        print(f"  first-reveal scatter-pay RTP: {mix.get_rtp():.4f}")
+        hit_rates = mix.get_symbol_hit_rates()
+        for symbol, rtp in sorted(mix.get_symbol_rtp().items(), key=lambda item: -item[1]):
+            print(f"    {symbol}: rtp {rtp:.5f}, hit {hit_rates[symbol]:.5f}")
+
+
+if __name__ == "__main__":
+    main()
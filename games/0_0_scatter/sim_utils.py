@@ -2,11 +2,12 @@ import argparse
 import json
 import multiprocessing as mp
 import os
+import math
 import random
 import sys
-from collections import Counter
+from collections import Counter, deque
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 GAME_DIR = Path(__file__).resolve().parent
 PARENT_DIR = GAME_DIR.parent
@@ -17,9 +18,12 @@ if str(PARENT_DIR) not in sys.path:
 
 from game_config import GameConfig
 from gamestate import GameState
+from src.wins.fixed_point import units_to_multiplier
+from src.calculations.position import Position
 
 CONFIG = GameConfig()
 GAMESTATE = GameState(CONFIG)
+GAMESTATE.stats_only = True  # monte carlo reports only need payouts, skip event construction
 
 WIN_BUCKET_LABELS: Iterable[str] = [
     "0",
@@ -70,6 +74,11 @@ MODE_BET_MULTIPLIER = {
     "bonus_hunt": 3.0,
 }
 
+FORCING_MODES = ("local", "deterministic", "shared")
+
+# Trigger counters (spins, regular, super) shared by the workers of a MonteCarloService in "shared" forcing mode
+_SHARED_FORCING = None
+
 
 def _split_work(total: int, parts: int) -> list[int]:
     """Divide work into roughly equal integer chunks."""
@@ -83,6 +92,15 @@ def _split_work(total: int, parts: int) -> list[int]:
     return sizes
 
 
+def _std_error(total: float, sum_sq: float, count: int) -> float:
+    """Standard error of the mean of count samples, from their sum and sum of squares."""
+    if count < 2:
+        return float("inf")
+    mean = total / count
+    variance = max(0.0, sum_sq / count - mean * mean) * count / (count - 1)
+    return math.sqrt(variance / count)
+
+
 def get_trigger_config(mode: str) -> dict:
     """Return trigger configuration for the requested mode."""
     return MODE_TRIGGER_CONFIG.get(mode, MODE_TRIGGER_CONFIG["base"])
@@ -120,6 +138,62 @@ def _classify_bonus_bucket(win: float) -> str:
     return "25000x"
 
 
+class AdaptiveForcingController:
+    """
+    Running spin and bonus trigger counts behind the forcing decisions of _execute_spin.
+    Counts are the base totals (other chunks or workers, as of the last sync) plus this chunk's own spins.
+    With shared counters this chunk's spins are added to them, and the base re-read, every sync_every spins.
+    """
+
+    def __init__(self, base: Tuple[int, int, int] = (0, 0, 0), shared: object = None, sync_every: int = 500):
+        self.shared = shared
+        self.sync_every = max(1, sync_every)
+        self.base = list(base) if shared is None else list(shared[:])
+        self.pending = [0, 0, 0]
+
+    def get_forced_context(self) -> Dict[str, int]:
+        """Forcing context of the next spin, which counts towards total_spins."""
+        return {
+            "total_spins": self.base[0] + self.pending[0] + 1,
+            "actual_regular_count": self.base[1] + self.pending[1],
+            "actual_super_count": self.base[2] + self.pending[2],
+        }
+
+    def record(self, actual_bonus_type: Optional[str]) -> None:
+        self.pending[0] += 1
+        if actual_bonus_type == "regular":
+            self.pending[1] += 1
+        elif actual_bonus_type == "super":
+            self.pending[2] += 1
+        if self.shared is not None and self.pending[0] >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Add this chunk's unsynced counts to the shared counters and pick up everyone else's."""
+        if self.shared is None:
+            return
+        with self.shared.get_lock():
+            for idx, count in enumerate(self.pending):
+                self.shared[idx] += count
+            self.base = list(self.shared[:])
+        self.pending = [0, 0, 0]
+
+
+def _init_forcing_worker(shared: object) -> None:
+    global _SHARED_FORCING
+    _SHARED_FORCING = shared
+
+
+def _forcing_totals(results: Iterable[Dict[str, object]]) -> Tuple[int, int, int]:
+    """Spin and actual trigger totals of finished chunks, the deterministic forcing base of a later chunk."""
+    spins, regular, super_count = 0, 0, 0
+    for res in results:
+        spins += res["num_spins"]
+        regular += res["actual_regular_triggers"]
+        super_count += res["actual_super_triggers"]
+    return spins, regular, super_count
+
+
 def choose_forced_bonus_type(
     mode: str,
     total_spins: int,
@@ -142,7 +216,7 @@ def choose_forced_bonus_type(
         return "regular"
 
     if super_below_target and not reg_below_target:
-        if random.random() < config["force_super_weight"]:
+        if GAMESTATE.rng.random() < config["force_super_weight"]:
             return "super"
         return "regular"
 
@@ -150,7 +224,7 @@ def choose_forced_bonus_type(
     if total_weight <= 0:
         return "regular"
     threshold = config["force_super_weight"] / total_weight
-    if random.random() < threshold:
+    if GAMESTATE.rng.random() < threshold:
         return "super"
     return "regular"
 
@@ -183,7 +257,7 @@ def maybe_force_bonus_globally(
         return None
 
     p_force = config["global_force_base_prob"] * force_factor
-    if random.random() >= p_force:
+    if GAMESTATE.rng.random() >= p_force:
         return None
 
     return choose_forced_bonus_type(
@@ -209,20 +283,25 @@ def simulate_single_spin(
     GAMESTATE.gametype = CONFIG.basegame_type
     GAMESTATE.reset_seed(random.randint(0, 1_000_000_000))
 
-    result = _execute_spin(
-        mode=mode, debug=debug, include_bonuses=include_bonuses, forced_context=forced_context
-    )
+    result = _execute_spin(mode=mode, debug=debug, include_bonuses=include_bonuses, forced_context=forced_context)
     return result
 
 
 def run_monte_carlo(
-    num_spins: int, mode: str = "base", include_bonuses: bool = True, processes: Optional[int] = None
+    num_spins: int,
+    mode: str = "base",
+    include_bonuses: bool = True,
+    processes: Optional[int] = None,
+    service: Optional["MonteCarloService"] = None,
 ) -> Dict[str, object]:
     """Run many single spins and aggregate statistics for the requested mode.
 
     When `processes` is greater than 1 (or left as None, which defaults to CPU count),
     the workload is distributed across multiple processes for faster execution.
+    Passing a `MonteCarloService` runs the spins on its long-lived pool instead.
     """
+    if service is not None:
+        return service.run_spins(num_spins, mode=mode, include_bonuses=include_bonuses)
     if processes is None:
         processes = max(1, min(os.cpu_count() or 1, num_spins))
     processes = max(1, processes)
@@ -232,14 +311,33 @@ def run_monte_carlo(
 
     chunk_sizes = _split_work(num_spins, processes)
     with mp.Pool(len(chunk_sizes)) as pool:
-        chunk_results = pool.starmap(
-            _run_monte_carlo_chunk, [(chunk, mode, include_bonuses) for chunk in chunk_sizes]
-        )
+        chunk_results = pool.starmap(_run_monte_carlo_chunk, [(chunk, mode, include_bonuses) for chunk in chunk_sizes])
     return _finalize_monte_carlo_result(chunk_results, mode)
 
 
-def _run_monte_carlo_chunk(num_spins: int, mode: str, include_bonuses: bool) -> Dict[str, object]:
+def _run_monte_carlo_chunk(
+    num_spins: int,
+    mode: str,
+    include_bonuses: bool,
+    seed: Optional[int] = None,
+    forcing: str = "local",
+    forcing_base: Tuple[int, int, int] = (0, 0, 0),
+    sync_every: int = 500,
+) -> Dict[str, object]:
+    """
+    Spin statistics of one chunk. Forcing decisions use this chunk's counts ("local"), counts of earlier chunks
+    passed as forcing_base ("deterministic") or the counters shared by all service workers ("shared").
+    """
+    if seed is not None:
+        random.seed(seed)
+    assert forcing in FORCING_MODES, f"forcing must be one of {FORCING_MODES}"
+    controller = AdaptiveForcingController(
+        base=forcing_base if forcing == "deterministic" else (0, 0, 0),
+        shared=_SHARED_FORCING if forcing == "shared" else None,
+        sync_every=sync_every,
+    )
     total_return = 0.0
+    sum_sq_return = 0.0
     sum_base_win_no_bonus = 0.0
     sum_regular_bonus_win = 0.0
     sum_super_bonus_win = 0.0
@@ -253,19 +351,16 @@ def _run_monte_carlo_chunk(num_spins: int, mode: str, include_bonuses: bool) ->
     actual_super_triggers = 0
     hits = 0
 
-    for spin_index in range(num_spins):
-        forced_context = {
-            "total_spins": spin_index + 1,
-            "actual_regular_count": actual_regular_triggers,
-            "actual_super_count": actual_super_triggers,
-        }
+    for _ in range(num_spins):
         outcome = simulate_single_spin(
             mode=mode,
             include_bonuses=include_bonuses,
-            forced_context=forced_context,
+            forced_context=controller.get_forced_context(),
         )
+        controller.record(outcome.get("actual_bonus_type"))
         total_win = outcome["total_win"]
         total_return += total_win
+        sum_sq_return += total_win * total_win
         sum_base_win_no_bonus += outcome["base_win_no_bonus"]
         sum_regular_bonus_win += outcome["regular_bonus_win"]
         sum_super_bonus_win += outcome["super_bonus_win"]
@@ -286,6 +381,7 @@ def _run_monte_carlo_chunk(num_spins: int, mode: str, include_bonuses: bool) ->
         elif actual_type == "super":
             actual_super_triggers += 1
 
+    controller.sync()
     zero_rate = wins_by_bucket["0"] / num_spins
     hit_rate = hits / num_spins
     total_bonus_triggers = regular_bonus_triggers + super_bonus_triggers
@@ -303,6 +399,7 @@ def _run_monte_carlo_chunk(num_spins: int, mode: str, include_bonuses: bool) ->
         "num_spins": num_spins,
         "bet_per_spin": bet_per_spin,
         "total_return": total_return,
+        "sum_sq_return": sum_sq_return,
         "total_bet": total_bet,
         "wins_by_bucket": wins_by_bucket,
         "regular_bonus_triggers": regular_bonus_triggers,
@@ -332,6 +429,7 @@ def _finalize_monte_carlo_result(results: Iterable[Dict[str, object]], mode: str
         "num_spins": 0,
         "bet_per_spin": MODE_BET_MULTIPLIER.get(mode, 1.0),
         "total_return": 0.0,
+        "sum_sq_return": 0.0,
         "wins_by_bucket": {label: 0 for label in WIN_BUCKET_LABELS},
         "regular_bonus_triggers": 0,
         "super_bonus_triggers": 0,
@@ -357,6 +455,7 @@ def _finalize_monte_carlo_result(results: Iterable[Dict[str, object]], mode: str
         aggregate["num_spins"] += res["num_spins"]
         aggregate["bet_per_spin"] = res["bet_per_spin"]
         aggregate["total_return"] += res["total_return"]
+        aggregate["sum_sq_return"] += res.get("sum_sq_return", 0.0)
         aggregate["regular_bonus_triggers"] += res["regular_bonus_triggers"]
         aggregate["super_bonus_triggers"] += res["super_bonus_triggers"]
         aggregate["bonus_triggers"] += res["bonus_triggers"]
@@ -380,6 +479,8 @@ def _finalize_monte_carlo_result(results: Iterable[Dict[str, object]], mode: str
         "bet_per_spin": aggregate["bet_per_spin"],
         "total_return": aggregate["total_return"],
         "total_bet": total_bet,
+        "rtp_std_error": _std_error(aggregate["total_return"], aggregate["sum_sq_return"], aggregate["num_spins"])
+        / aggregate["bet_per_spin"],
         "wins_by_bucket": aggregate["wins_by_bucket"],
         "regular_bonus_triggers": aggregate["regular_bonus_triggers"],
         "super_bonus_triggers": aggregate["super_bonus_triggers"],
@@ -390,9 +491,7 @@ def _finalize_monte_carlo_result(results: Iterable[Dict[str, object]], mode: str
             else None
         ),
         "super_bonus_rate": (
-            aggregate["num_spins"] / aggregate["super_bonus_triggers"]
-            if aggregate["super_bonus_triggers"]
-            else None
+            aggregate["num_spins"] / aggregate["super_bonus_triggers"] if aggregate["super_bonus_triggers"] else None
         ),
         "natural_regular_triggers": aggregate["natural_regular_triggers"],
         "natural_super_triggers": aggregate["natural_super_triggers"],
@@ -414,9 +513,7 @@ def _finalize_monte_carlo_result(results: Iterable[Dict[str, object]], mode: str
             else None
         ),
         "actual_super_rate": (
-            aggregate["num_spins"] / aggregate["actual_super_triggers"]
-            if aggregate["actual_super_triggers"]
-            else None
+            aggregate["num_spins"] / aggregate["actual_super_triggers"] if aggregate["actual_super_triggers"] else None
         ),
         "scatter_counts": dict(aggregate["scatter_counts"]),
         "hit_rate": aggregate["hit_count"] / aggregate["num_spins"] if aggregate["num_spins"] else 0.0,
@@ -557,11 +654,7 @@ def _execute_spin(
             actual_super_count=forced_context.get("actual_super_count", 0),
         )
 
-    if (
-        bonus_type_to_run is None
-        and forced_context is not None
-        and natural_bonus_type is None
-    ):
+    if bonus_type_to_run is None and forced_context is not None and natural_bonus_type is None:
         global_forced_type = maybe_force_bonus_globally(
             mode=mode,
             total_spins=max(forced_context.get("total_spins", 0), 1),
@@ -595,8 +688,8 @@ def _execute_spin(
     GAMESTATE.library.clear()
     GAMESTATE.recorded_events = {}
 
-    base_win = GAMESTATE.win_manager.basegame_wins
-    bonus_win = GAMESTATE.win_manager.freegame_wins
+    base_win = units_to_multiplier(GAMESTATE.win_manager.basegame_wins, GAMESTATE.win_scale)
+    bonus_win = units_to_multiplier(GAMESTATE.win_manager.freegame_wins, GAMESTATE.win_scale)
     total_win = base_win + (bonus_win if include_bonuses else 0.0)
 
     result = {
@@ -671,17 +764,17 @@ def _play_bonus_round(bonus_type: str, mode: str = "base") -> dict:
     GAMESTATE.criteria = "freegame"
     GAMESTATE.refresh_special_syms()
     if bonus_type == "super":
-        GAMESTATE.special_syms_on_board["scatter"] = [{"reel": i, "row": 0} for i in range(3)]
-        GAMESTATE.special_syms_on_board["super_scatter"] = [{"reel": 3, "row": 0}]
+        GAMESTATE.special_syms_on_board["scatter"] = [Position(i, 0) for i in range(3)]
+        GAMESTATE.special_syms_on_board["super_scatter"] = [Position(3, 0)]
         GAMESTATE.super_bonus_active = True
         GAMESTATE.update_super_bonus_amount()
     else:
-        GAMESTATE.special_syms_on_board["scatter"] = [{"reel": i, "row": 0} for i in range(4)]
+        GAMESTATE.special_syms_on_board["scatter"] = [Position(i, 0) for i in range(4)]
         GAMESTATE.special_syms_on_board["super_scatter"] = []
         GAMESTATE.super_bonus_active = False
         GAMESTATE.update_freespin_amount()
     GAMESTATE.run_freespin()
-    win_amount = GAMESTATE.win_manager.freegame_wins
+    win_amount = units_to_multiplier(GAMESTATE.win_manager.freegame_wins, GAMESTATE.win_scale)
     spins_played = GAMESTATE.fs
     retriggers = getattr(GAMESTATE, "fs_retrigger_count", 0)
     GAMESTATE.super_bonus_active = False
@@ -697,17 +790,29 @@ def simulate_freegame_only(num_triggers: int, mode: str = "regular") -> float:
     return total / num_triggers if num_triggers else 0.0
 
 
-def measure_regular_bonus_ev(num_runs: int = 5000, processes: Optional[int] = None) -> dict:
+def measure_regular_bonus_ev(
+    num_runs: int = 5000, processes: Optional[int] = None, service: Optional["MonteCarloService"] = None
+) -> dict:
     """Run standalone regular bonuses (equivalent to the regular buy) and report EV."""
-    return _measure_bonus_ev("regular", num_runs, 100.0, processes)
+    return _measure_bonus_ev("regular", num_runs, 100.0, processes, service)
 
 
-def measure_super_bonus_ev(num_runs: int = 3000, processes: Optional[int] = None) -> dict:
+def measure_super_bonus_ev(
+    num_runs: int = 3000, processes: Optional[int] = None, service: Optional["MonteCarloService"] = None
+) -> dict:
     """Run standalone super bonuses (equivalent to the super buy) and report EV."""
-    return _measure_bonus_ev("super", num_runs, 500.0, processes)
-
-
-def _measure_bonus_ev(bonus_type: str, num_runs: int, cost: float, processes: Optional[int]) -> dict:
+    return _measure_bonus_ev("super", num_runs, 500.0, processes, service)
+
+
+def _measure_bonus_ev(
+    bonus_type: str,
+    num_runs: int,
+    cost: float,
+    processes: Optional[int],
+    service: Optional["MonteCarloService"] = None,
+) -> dict:
+    if service is not None:
+        return service.measure_bonus_ev(bonus_type, num_runs, cost)
     if processes is None:
         processes = max(1, min(os.cpu_count() or 1, num_runs))
     processes = max(1, processes)
@@ -723,43 +828,54 @@ def _measure_bonus_ev(bonus_type: str, num_runs: int, cost: float, processes: Op
     return _finalize_bonus_ev_results(chunks, num_runs, cost)
 
 
-def _measure_bonus_chunk(bonus_type: str, num_runs: int, chunk_index: int = 0) -> dict:
+def _measure_bonus_chunk(bonus_type: str, num_runs: int, chunk_index: int = 0, seed: Optional[int] = None) -> dict:
+    if seed is not None:
+        random.seed(seed)
     mode = "regular_buy" if bonus_type == "regular" else "super_buy"
     total_win = 0.0
+    sum_sq_win = 0.0
     bucket_counts = {key: 0 for key in BONUS_BUCKET_KEYS}
     for idx in range(num_runs):
         result = _play_bonus_round(bonus_type, mode=mode)
         win = result["win"]
         total_win += win
+        sum_sq_win += win * win
         bucket_counts[_classify_bonus_bucket(win)] += 1
         if chunk_index == 0 and ((idx + 1) % 1000 == 0 or (idx + 1) == num_runs):
             # Only the main process logs progress to avoid noisy output
             label = "regular_bonus_ev" if bonus_type == "regular" else "super_bonus_ev"
             print(f"[{label}] {idx + 1}/{num_runs} runs completed", flush=True)
-    return {"runs": num_runs, "total_win": total_win, "bucket_counts": bucket_counts}
+    return {"runs": num_runs, "total_win": total_win, "sum_sq_win": sum_sq_win, "bucket_counts": bucket_counts}
 
 
 def _finalize_bonus_ev_results(chunks: Iterable[dict], total_runs: int, cost: float) -> dict:
     bucket_counts = {key: 0 for key in BONUS_BUCKET_KEYS}
     total_win = 0.0
+    sum_sq_win = 0.0
     runs_accum = 0
     for chunk in chunks:
         runs_accum += chunk["runs"]
         total_win += chunk["total_win"]
+        sum_sq_win += chunk.get("sum_sq_win", 0.0)
         for key in bucket_counts:
             bucket_counts[key] += chunk["bucket_counts"].get(key, 0)
     avg_win = total_win / total_runs if total_runs else 0.0
     return {
         "avg_win": avg_win,
         "rtp": (avg_win / cost) if total_runs else 0.0,
+        "rtp_std_error": _std_error(total_win, sum_sq_win, runs_accum) / cost,
         "buckets": bucket_counts,
         "runs": total_runs,
     }
 
 
-def measure_buy_mode_rtp(num_buys: int, mode: str, processes: Optional[int] = None) -> dict:
+def measure_buy_mode_rtp(
+    num_buys: int, mode: str, processes: Optional[int] = None, service: Optional["MonteCarloService"] = None
+) -> dict:
     """Measure RTP for a buy mode by simulating standalone bonuses."""
     assert mode in {"regular_buy", "super_buy"}
+    if service is not None:
+        return service.measure_buy_mode(num_buys, mode)
     if processes is None:
         processes = max(1, min(os.cpu_count() or 1, num_buys))
     processes = max(1, processes)
@@ -773,34 +889,221 @@ def measure_buy_mode_rtp(num_buys: int, mode: str, processes: Optional[int] = No
     return _finalize_buy_results(chunks, mode)
 
 
-def _measure_buy_mode_chunk(num_buys: int, mode: str) -> dict:
+def _measure_buy_mode_chunk(num_buys: int, mode: str, seed: Optional[int] = None) -> dict:
+    if seed is not None:
+        random.seed(seed)
     bonus_type = "super" if mode == "super_buy" else "regular"
     bet_cost = 500.0 if bonus_type == "super" else 100.0
     total_win = 0.0
+    sum_sq_win = 0.0
     bucket_counts = {key: 0 for key in BONUS_BUCKET_KEYS}
     for _ in range(num_buys):
         result = _play_bonus_round(bonus_type, mode=mode)
         win = result["win"]
         total_win += win
+        sum_sq_win += win * win
         bucket_counts[_classify_bonus_bucket(win)] += 1
-    return {"runs": num_buys, "total_win": total_win, "bet_cost": bet_cost, "bucket_counts": bucket_counts}
+    return {
+        "runs": num_buys,
+        "total_win": total_win,
+        "sum_sq_win": sum_sq_win,
+        "bet_cost": bet_cost,
+        "bucket_counts": bucket_counts,
+    }
 
 
 def _finalize_buy_results(chunks: Iterable[dict], mode: str) -> dict:
     total_runs = 0
     total_win = 0.0
+    sum_sq_win = 0.0
     bet_cost = None
     bucket_counts = {key: 0 for key in BONUS_BUCKET_KEYS}
     for chunk in chunks:
         total_runs += chunk["runs"]
         total_win += chunk["total_win"]
+        sum_sq_win += chunk.get("sum_sq_win", 0.0)
         bet_cost = chunk["bet_cost"]
         for key in bucket_counts:
             bucket_counts[key] += chunk["bucket_counts"].get(key, 0)
     total_bet = total_runs * (bet_cost or 0.0)
     rtp = total_win / total_bet if total_bet else 0.0
     avg_win = total_win / total_runs if total_runs else 0.0
-    return {"mode": mode, "rtp": rtp, "avg_win": avg_win, "bucket_counts": bucket_counts}
+    rtp_std_error = _std_error(total_win, sum_sq_win, total_runs) / bet_cost if bet_cost else float("inf")
+    return {
+        "mode": mode,
+        "runs": total_runs,
+        "rtp": rtp,
+        "rtp_std_error": rtp_std_error,
+        "avg_win": avg_win,
+        "bucket_counts": bucket_counts,
+    }
+
+
+class MonteCarloService:
+    """
+    Long-lived worker pool for repeated Monte Carlo runs, workers keep the CONFIG and GAMESTATE built when the pool
+    starts.
+    Each call is split into fixed-size chunks with their own seeds and aggregated in chunk order, so results do not
+    depend on the number of processes. on_partial receives the running aggregate after every chunk, a run stops
+    submitting chunks once the RTP standard error reaches target_std_error or on_partial returns True.
+
+    Bonus forcing in run_spins is steered by trigger counts across chunks. "deterministic" passes each chunk the totals
+    of all chunks at least sync_lag places before it, which keeps results independent of the process count but allows
+    at most sync_lag chunks ahead of the oldest unfinished one. "shared" syncs workers through shared-memory counters
+    every sync_every spins, converging faster at the cost of timing-dependent results. "local" keeps per-chunk counts.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        spin_chunk: int = 2_000,
+        bonus_chunk: int = 100,
+        seed: Optional[int] = None,
+        forcing: str = "deterministic",
+        sync_lag: int = 8,
+        sync_every: int = 500,
+    ):
+        assert forcing in FORCING_MODES, f"forcing must be one of {FORCING_MODES}"
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.spin_chunk = spin_chunk
+        self.bonus_chunk = bonus_chunk
+        self.seed_rng = random.Random(seed)
+        self.forcing = forcing
+        self.sync_lag = max(0, sync_lag)
+        self.sync_every = sync_every
+        self.shared_forcing = mp.Array("q", 3) if forcing == "shared" else None
+        self.pool = mp.Pool(self.processes, initializer=_init_forcing_worker, initargs=(self.shared_forcing,))
+
+    def __enter__(self) -> "MonteCarloService":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.pool.close()
+        self.pool.join()
+
+    def _chunks(self, total: int, chunk: int) -> list[int]:
+        return [min(chunk, total - start) for start in range(0, total, chunk)]
+
+    def _stream(
+        self,
+        func: Callable,
+        chunk_args: list[tuple],
+        finalize: Callable[[list], dict],
+        target_std_error: Optional[float],
+        on_partial: Optional[Callable[[dict], Optional[bool]]],
+        max_ahead: Optional[int] = None,
+        extra_args: Optional[Callable[[int, list], tuple]] = None,
+    ) -> dict:
+        """
+        Run chunks with at most two per worker in flight, aggregating results in submission order.
+        A chunk is only submitted once no more than max_ahead chunks before it are unfinished,
+        extra_args(chunk index, finished results) appends arguments which depend on earlier chunks.
+        """
+        pending = deque()
+        results = []
+        next_chunk = 0
+        stopped = False
+
+        def submit_ready() -> None:
+            nonlocal next_chunk
+            while (
+                next_chunk < len(chunk_args)
+                and len(pending) < 2 * self.processes
+                and (max_ahead is None or next_chunk - len(results) <= max_ahead)
+            ):
+                args = chunk_args[next_chunk] + (self.seed_rng.randrange(2**32),)
+                if extra_args is not None:
+                    args += extra_args(next_chunk, results)
+                pending.append(self.pool.apply_async(func, args))
+                next_chunk += 1
+
+        submit_ready()
+        partial = finalize(results)
+        while pending:
+            results.append(pending.popleft().get())
+            partial = finalize(results)
+            if on_partial is not None and on_partial(partial) is True:
+                stopped = True
+            if target_std_error is not None and partial["rtp_std_error"] <= target_std_error:
+                stopped = True
+            if not stopped:
+                submit_ready()
+        return partial
+
+    def run_spins(
+        self,
+        num_spins: int,
+        mode: str = "base",
+        include_bonuses: bool = True,
+        target_std_error: Optional[float] = None,
+        on_partial: Optional[Callable[[dict], Optional[bool]]] = None,
+    ) -> Dict[str, object]:
+        """Spin statistics as returned by run_monte_carlo, plus rtp_std_error."""
+        chunk_args = [(chunk, mode, include_bonuses) for chunk in self._chunks(num_spins, self.spin_chunk)]
+        max_ahead = None
+        if self.forcing == "deterministic":
+            max_ahead = self.sync_lag
+
+            def extra_args(chunk_index: int, results: list) -> tuple:
+                return "deterministic", _forcing_totals(results[: max(0, chunk_index - self.sync_lag)]), self.sync_every
+
+        else:
+            if self.shared_forcing is not None:
+                with self.shared_forcing.get_lock():
+                    self.shared_forcing[:] = [0, 0, 0]
+
+            def extra_args(chunk_index: int, results: list) -> tuple:
+                return self.forcing, (0, 0, 0), self.sync_every
+
+        return self._stream(
+            _run_monte_carlo_chunk,
+            chunk_args,
+            lambda results: _finalize_monte_carlo_result(results, mode),
+            target_std_error,
+            on_partial,
+            max_ahead,
+            extra_args,
+        )
+
+    def measure_bonus_ev(
+        self,
+        bonus_type: str,
+        num_runs: int,
+        cost: float,
+        target_std_error: Optional[float] = None,
+        on_partial: Optional[Callable[[dict], Optional[bool]]] = None,
+    ) -> dict:
+        # chunk_index 1 onwards keeps workers from printing progress lines
+        chunk_args = [
+            (bonus_type, chunk, idx) for idx, chunk in enumerate(self._chunks(num_runs, self.bonus_chunk), start=1)
+        ]
+        return self._stream(
+            _measure_bonus_chunk,
+            chunk_args,
+            lambda results: _finalize_bonus_ev_results(results, sum(res["runs"] for res in results), cost),
+            target_std_error,
+            on_partial,
+        )
+
+    def measure_buy_mode(
+        self,
+        num_buys: int,
+        mode: str,
+        target_std_error: Optional[float] = None,
+        on_partial: Optional[Callable[[dict], Optional[bool]]] = None,
+    ) -> dict:
+        assert mode in {"regular_buy", "super_buy"}
+        chunk_args = [(chunk, mode) for chunk in self._chunks(num_buys, self.bonus_chunk)]
+        return self._stream(
+            _measure_buy_mode_chunk,
+            chunk_args,
+            lambda results: _finalize_buy_results(results, mode),
+            target_std_error,
+            on_partial,
+        )
 
 
 def _cli():
@@ -832,15 +1135,20 @@ def _format_trigger_rate(rate: float | None, num_spins: int) -> str:
     return f"{rate:.1f}"
 
 
-def run_full_math_report() -> None:
-    """Print a concise RTP summary for base, hunt, and buy modes."""
+def run_full_math_report(service: Optional[MonteCarloService] = None) -> None:
+    """Print a concise RTP summary for base, hunt, and buy modes, sharing one worker pool across all of them."""
+    if service is None:
+        with MonteCarloService() as service:
+            run_full_math_report(service)
+        return
+
     modes = [
         ("base", True, 20_000),
         ("bonus_hunt", True, 20_000),
     ]
     print("=== Candy Carnage 1000 – Monte Carlo Summary ===")
     for mode, include_bonuses, spins in modes:
-        results = run_monte_carlo(num_spins=spins, mode=mode, include_bonuses=include_bonuses)
+        results = service.run_spins(spins, mode=mode, include_bonuses=include_bonuses)
         bet_mult = MODE_BET_MULTIPLIER.get(mode, 1.0)
         base_slice = results["sum_base_win_no_bonus"] / results["total_bet"]
         regular_slice = results["sum_regular_bonus_win"] / results["total_bet"]
@@ -860,9 +1168,7 @@ def run_full_math_report() -> None:
         print(f"  Hit rate:        {results['hit_rate']:.2%}")
         print(f"  Zero-win:        {results['zero_rate']:.2%}")
         print("")
-        print(
-            f"  Natural regular: 1 in {_format_trigger_rate(natural_reg, spins)}"
-        )
+        print(f"  Natural regular: 1 in {_format_trigger_rate(natural_reg, spins)}")
         print(f"  Natural super:   1 in {_format_trigger_rate(natural_sup, spins)}")
         print(f"  Actual regular:  1 in {_format_trigger_rate(actual_reg, spins)}")
         print(f"  Actual super:    1 in {_format_trigger_rate(actual_sup, spins)}")
@@ -873,12 +1179,8 @@ def run_full_math_report() -> None:
         ("super_buy", 5_000, 500.0),
     ]
     for mode, num_buys, cost in buy_modes:
-        stats = measure_buy_mode_rtp(num_buys=num_buys, mode=mode)
-        buckets = {key: 0 for key in BONUS_BUCKET_KEYS}
-        bonus_type = "super" if mode == "super_buy" else "regular"
-        for _ in range(num_buys):
-            result = _play_bonus_round(bonus_type, mode=mode)
-            buckets[_classify_bonus_bucket(result["win"])] += 1
+        stats = service.measure_buy_mode(num_buys, mode)
+        buckets = stats["bucket_counts"]
         print(f"\nMode: {mode}")
         print(f"  Buy cost:    {cost:.0f}x")
         print(f"  RTP:         {stats['rtp']:.4f}")
@@ -888,4 +1190,3 @@ def run_full_math_report() -> None:
             count = buckets[key]
             pct = count / num_buys if num_buys else 0.0
             print(f"    {key:<8} {count:>5} ({pct:>6.2%})")
-
@@ -1,10 +1,11 @@
 """Handles generating game-boards from reelstrips"""
 
-import random
+from bisect import bisect_left, insort
 from typing import List
 from src.state.state import GeneralGameState
-from src.calculations.statistics import get_random_outcome
 from src.events.events import reveal_event
+from src.calculations.position import Position
+from src.config.validation import should_validate
 
 
 class Board(GeneralGameState):
@@ -16,14 +17,10 @@ class Board(GeneralGameState):
             top_symbols = []
             bottom_symbols = []
         self.refresh_special_syms()
-        self.reelstrip_id = get_random_outcome(
-            self.get_current_distribution_conditions()["reel_weights"][self.gametype]
-        )
+        self.reelstrip_id = self.get_criteria_context().get_sampler("reel_weights", self.gametype).sample(self.rng)
         self.reelstrip = self.config.reels[self.reelstrip_id]
-        anticipation = [0] * self.config.num_reels
-        board = [[]] * self.config.num_reels
-        for i in range(self.config.num_reels):
-            board[i] = [0] * self.config.num_rows[i]
+        anticipation = self.spin_pool.reset_anticipation()
+        board = self.spin_pool.get_board()
         reel_positions = [0] * self.config.num_reels
         padding_positions = [0] * self.config.num_reels
         first_scatter_reel = -1
@@ -34,9 +31,7 @@ class Board(GeneralGameState):
             reel_strip = self.reelstrip[reel]
             reel_len = len(reel_strip)
             for start in range(reel_len):
-                column_symbols = [
-                    reel_strip[(start + row) % reel_len] for row in range(self.config.num_rows[reel])
-                ]
+                column_symbols = [reel_strip[(start + row) % reel_len] for row in range(self.config.num_rows[reel])]
                 scatter_count = sum(1 for sym in column_symbols if sym in scatter_symbols)
                 if scatter_count <= 1:
                     reel_valid.append(
@@ -57,11 +52,11 @@ class Board(GeneralGameState):
             filtered = [c for c in candidates if not c["has_bs"]] if bs_used else candidates
             options = filtered if filtered else candidates
             # Attempt to select a candidate that respects the BS constraint.
-            choice = random.choice(options)
+            choice = self.rng.choice(options)
             if bs_used and choice["has_bs"]:
                 non_bs = [c for c in candidates if not c["has_bs"]]
                 if non_bs:
-                    choice = random.choice(non_bs)
+                    choice = self.rng.choice(non_bs)
                 else:
                     raise RuntimeError("Unable to satisfy BS constraint with available reel windows.")
             selected_columns.append(choice)
@@ -73,13 +68,9 @@ class Board(GeneralGameState):
             reel_pos = meta["start"]
             reel_positions[reel] = reel_pos
             if self.config.include_padding:
-                top_symbols.append(
-                    self.create_symbol(self.reelstrip[reel][(reel_pos - 1) % len(self.reelstrip[reel])])
-                )
+                top_symbols.append(self.create_symbol(self.reelstrip[reel][(reel_pos - 1) % len(self.reelstrip[reel])]))
                 bottom_symbols.append(
-                    self.create_symbol(
-                        self.reelstrip[reel][(reel_pos + len(board[reel])) % len(self.reelstrip[reel])]
-                    )
+                    self.create_symbol(self.reelstrip[reel][(reel_pos + len(board[reel])) % len(self.reelstrip[reel])])
                 )
             for row in range(self.config.num_rows[reel]):
                 sym_id = meta["symbols"][row]
@@ -89,7 +80,7 @@ class Board(GeneralGameState):
                     for special_symbol in self.special_syms_on_board:
                         for s in self.config.special_symbols[special_symbol]:
                             if board[reel][row].name == s:
-                                self.special_syms_on_board[special_symbol] += [{"reel": reel, "row": row}]
+                                self.special_syms_on_board[special_symbol].append(Position(reel, row))
                                 if (
                                     board[reel][row].check_attribute("scatter")
                                     and len(self.special_syms_on_board[special_symbol])
@@ -105,12 +96,12 @@ class Board(GeneralGameState):
                 anticipation[reel] = count
                 count += 1
 
-        for r in range(1, self.config.num_reels):
-            if anticipation[r - 1] > anticipation[r]:
-                raise RuntimeError
+        if should_validate(self.sim, self.config.validation):
+            for r in range(1, self.config.num_reels):
+                if anticipation[r - 1] > anticipation[r]:
+                    raise RuntimeError
 
         self.board = board
-        self.get_special_symbols_on_board()
         self.reel_positions = reel_positions
         self.padding_position = padding_positions
         self.anticipation = anticipation
@@ -126,30 +117,24 @@ class Board(GeneralGameState):
         self.refresh_special_syms()
         self.reelstrip_id = reelstrip_id
         self.reelstrip = self.config.reels[self.reelstrip_id]
-        anticipation = [0] * self.config.num_reels
-        board = [[]] * self.config.num_reels
-        for i in range(self.config.num_reels):
-            board[i] = [0] * self.config.num_rows[i]
+        anticipation = self.spin_pool.reset_anticipation()
+        board = self.spin_pool.get_board()
 
         reel_positions = [None] * self.config.num_reels
         for r, s in force_stop_positions.items():
-            reel_positions[r] = s - random.randint(0, self.config.num_rows[r] - 1)
+            reel_positions[r] = s - self.rng.randint(0, self.config.num_rows[r] - 1)
         for r, _ in enumerate(reel_positions):
             if reel_positions[r] is None:
-                reel_positions[r] = random.randrange(0, len(self.reelstrip[r]))
+                reel_positions[r] = self.rng.randrange(0, len(self.reelstrip[r]))
 
         padding_positions = [0] * self.config.num_reels
         first_scatter_reel = -1
         for reel in range(self.config.num_reels):
             reel_pos = reel_positions[reel]
             if self.config.include_padding:
-                top_symbols.append(
-                    self.create_symbol(self.reelstrip[reel][(reel_pos - 1) % len(self.reelstrip[reel])])
-                )
+                top_symbols.append(self.create_symbol(self.reelstrip[reel][(reel_pos - 1) % len(self.reelstrip[reel])]))
                 bottom_symbols.append(
-                    self.create_symbol(
-                        self.reelstrip[reel][(reel_pos + len(board[reel])) % len(self.reelstrip[reel])]
-                    )
+                    self.create_symbol(self.reelstrip[reel][(reel_pos + len(board[reel])) % len(self.reelstrip[reel])])
                 )
             for row in range(self.config.num_rows[reel]):
                 sym_id = self.reelstrip[reel][(reel_pos + row) % len(self.reelstrip[reel])]
@@ -160,7 +145,7 @@ class Board(GeneralGameState):
                     for special_symbol in self.special_syms_on_board:
                         for s in self.config.special_symbols[special_symbol]:
                             if board[reel][row].name == s:
-                                self.special_syms_on_board[special_symbol] += [{"reel": reel, "row": row}]
+                                self.special_syms_on_board[special_symbol].append(Position(reel, row))
                                 if (
                                     board[reel][row].check_attribute("scatter")
                                     and len(self.special_syms_on_board[special_symbol])
@@ -209,7 +194,32 @@ class Board(GeneralGameState):
                 if self.board[reel][row].special:
                     for specialType in list(self.special_syms_on_board.keys()):
                         if self.board[reel][row].check_attribute(specialType):
-                            self.special_syms_on_board[specialType].append({"reel": reel, "row": row})
+                            self.special_syms_on_board[specialType].append(Position(reel, row))
+
+    def set_board_symbol(self, reel: int, row: int, symbol: object) -> None:
+        """Place a symbol on the board, updating special_syms_on_board for that cell instead of rescanning the board."""
+        position = Position(reel, row)
+        previous = self.board[reel][row]
+        if previous.special:
+            for special_type, positions in self.special_syms_on_board.items():
+                if previous.check_attribute(special_type):
+                    positions.remove(position)
+        self.board[reel][row] = symbol
+        if symbol.special:
+            for special_type, positions in self.special_syms_on_board.items():
+                if symbol.check_attribute(special_type):
+                    insort(positions, position)
+
+    def reindex_reel(self, reel: int) -> None:
+        """Rebuild the special_syms_on_board entries of a single reel, e.g. after symbols on it tumbled."""
+        for special_type, positions in self.special_syms_on_board.items():
+            start = bisect_left(positions, (reel,))
+            end = bisect_left(positions, (reel + 1,))
+            positions[start:end] = [
+                Position(reel, row)
+                for row, symbol in enumerate(self.board[reel])
+                if symbol.special and symbol.check_attribute(special_type)
+            ]
 
     def transpose_board_string(self, board_string: List[List[str]]) -> List[List[str]]:
         """Transpose symbol names in the format displayed to the player during the game."""
@@ -238,11 +248,9 @@ class Board(GeneralGameState):
     def draw_board(self, emit_event: bool = True, trigger_symbol: str = "scatter") -> None:
         """Instead of retrying to draw a board, force the initial revel to have a
         specific number of scatters, if the betmode criteria specifies this."""
-        if (
-            self.get_current_distribution_conditions()["force_freegame"]
-            and self.gametype == self.config.basegame_type
-        ):
-            num_scatters = get_random_outcome(self.get_current_distribution_conditions()["scatter_triggers"])
+        context = self.get_criteria_context()
+        if context.conditions["force_freegame"] and self.gametype == self.config.basegame_type:
+            num_scatters = context.get_sampler("scatter_triggers").sample(self.rng)
             self.force_special_board(trigger_symbol, num_scatters)
         else:
             self.create_board_reelstrips()
@@ -280,9 +288,7 @@ class Board(GeneralGameState):
         """
         Helper function for forcing special (or name specific) symbols
         """
-        reelstrip_id = get_random_outcome(
-            self.get_current_distribution_conditions()["reel_weights"][self.gametype]
-        )
+        reelstrip_id = self.get_criteria_context().get_sampler("reel_weights", self.gametype).sample(self.rng)
         reelstops = self.get_syms_on_reel(reelstrip_id, force_criteria)
 
         sym_prob = []
@@ -293,8 +299,8 @@ class Board(GeneralGameState):
         possible_probs = [p for p in sym_prob if p > 0]
 
         while len(force_stop_positions) != num_force_syms and len(possible_reels) > 0:
-            chosen_reel = random.choices(possible_reels, possible_probs)[0]
-            chosen_stop = random.choice(reelstops[chosen_reel])
+            chosen_reel = self.rng.choices(possible_reels, possible_probs)[0]
+            chosen_stop = self.rng.choice(reelstops[chosen_reel])
             sym_prob[chosen_reel] = 0
             force_stop_positions[int(chosen_reel)] = int(chosen_stop)
             possible_reels = [i for i in range(self.config.num_reels) if sym_prob[i] > 0]
@@ -339,7 +345,7 @@ class Board(GeneralGameState):
         for idx, _ in enumerate(self.board):
             for idy, _ in enumerate(self.board[idx]):
                 if self.board[idx][idy].name == target_symbol:
-                    symbol_positions[target_symbol].append({"reel": idx, "row": idy})
+                    symbol_positions[target_symbol].append(Position(idx, idy))
 
         return symbol_positions
 
@@ -353,7 +359,7 @@ class Board(GeneralGameState):
 
         assert len(free_positions) >= additional_count, "not enough free place for additional symbols"
 
-        new_positions = random.choices(free_positions, additional_count)[0]
-        random.shuffle(new_positions)
+        new_positions = self.rng.choices(free_positions, additional_count)[0]
+        self.rng.shuffle(new_positions)
         for np in new_positions:
             self.board[np[0]][np[1]] = self.create_symbol(symbol_name)
@@ -1,28 +1,30 @@
 from collections import defaultdict
 from abc import ABC
-from typing import List, Dict
+from typing import List
 from src.calculations.board import Board
 from src.calculations.symbol import Symbol
+from src.calculations.position import Position
 from src.config.config import Config
 from src.wins.multiplier_strategy import apply_mult
+from src.wins.fixed_point import get_scaled_paytable
 
 
 class Cluster:
     """Collection of cluster-evaluation functions."""
 
     @staticmethod
-    def get_central_cluster_position(winning_positions: List[Dict]) -> tuple:
+    def get_central_cluster_position(winning_positions: List[Position]) -> Position:
         """Return position on screen to display win amount."""
         all_reels = []
         all_rows = []
-        for pos in winning_positions:
-            all_reels.append(pos["reel"])
-            all_rows.append(pos["row"])
+        for reel, row in winning_positions:
+            all_reels.append(reel)
+            all_rows.append(row)
 
         reel_to_overlay = int(round(sum(all_reels) / len(all_rows)))
         row_to_overlay = int(round(sum(all_rows) / len(all_rows)))
 
-        return (reel_to_overlay, row_to_overlay)
+        return Position(reel_to_overlay, row_to_overlay)
 
     @staticmethod
     def get_neighbours(board: list[list[Symbol]], reel: int, row: int, local_checked: list) -> list:
@@ -67,7 +69,7 @@ class Cluster:
         neighbours = Cluster.get_neighbours(board, reel, row, local_checked)
         for reel_, row_ in neighbours:
             if Cluster.in_cluster(board, reel_, row_, og_symbol, wild_key):
-                potential_cluster += [(reel_, row_)]
+                potential_cluster.append(Position(reel_, row_))
                 already_checked += [(reel_, row_)]
                 Cluster.check_all_neighbours(
                     board,
@@ -88,7 +90,7 @@ class Cluster:
         for reel, _ in enumerate(board):
             for row, _ in enumerate(board[reel]):
                 if (reel, row) not in already_checked and not (board[reel][row].check_attribute(wild_key)):
-                    potential_cluster = [(reel, row)]
+                    potential_cluster = [Position(reel, row)]
                     already_checked += [(reel, row)]
                     local_checked = [(reel, row)]
                     symbol = board[reel][row].name
@@ -114,48 +116,45 @@ class Cluster:
         global_multiplier: int = 1,
         multiplier_key: str = "multiplier",
         return_data: dict = {"totalWin": 0, "wins": []},
+        win_scale: int = None,
     ) -> type:
         """Determine payout amount from cluster, including symbol multiplier and global multiplier value."""
+        paytable = get_scaled_paytable(config, win_scale)
         exploding_symbols = []
         total_win = 0
         for sym in clusters:
             for cluster in clusters[sym]:
                 syms_in_cluster = len(cluster)
-                if (syms_in_cluster, sym) in config.paytable:
+                if (syms_in_cluster, sym) in paytable:
                     cluster_mult = 0
                     for positions in cluster:
                         if board[positions[0]][positions[1]].check_attribute(multiplier_key):
                             if int(board[positions[0]][positions[1]].get_attribute(multiplier_key)) > 0:
                                 cluster_mult += board[positions[0]][positions[1]].get_attribute(multiplier_key)
                     cluster_mult = max(cluster_mult, 1)
-                    sym_win = config.paytable[(syms_in_cluster, sym)]
+                    sym_win = paytable[(syms_in_cluster, sym)]
                     symwin_mult = sym_win * cluster_mult * global_multiplier
                     total_win += symwin_mult
-                    json_positions = [{"reel": p[0], "row": p[1]} for p in cluster]
-
-                    central_pos = Cluster.get_central_cluster_position(json_positions)
+                    central_pos = Cluster.get_central_cluster_position(cluster)
                     return_data["wins"] += [
                         {
                             "symbol": sym,
                             "clusterSize": syms_in_cluster,
                             "win": symwin_mult,
-                            "positions": json_positions,
+                            "positions": cluster,
                             "meta": {
                                 "globalMult": global_multiplier,
                                 "clusterMult": cluster_mult,
                                 "winWithoutMult": sym_win,
-                                "overlay": {"reel": central_pos[0], "row": central_pos[1]},
+                                "overlay": central_pos,
                             },
                         }
                     ]
 
-                    for positions in cluster:
-                        board[positions[0]][positions[1]].explode = True
-                        if {
-                            "reel": positions[0],
-                            "row": positions[1],
-                        } not in exploding_symbols:
-                            exploding_symbols.append({"reel": positions[0], "row": positions[1]})
+                    for position in cluster:
+                        board[position.reel][position.row].explode = True
+                        if position not in exploding_symbols:
+                            exploding_symbols.append(position)
 
         return board, return_data, total_win
 
@@ -166,8 +165,9 @@ class Cluster:
         global_multiplier: int,
         multiplier_key: str = "multiplier",
         wild_key: str = "wild",
+        win_scale: int = None,
     ) -> None:
-        """Event-ready win information."""
+        """Event-ready win information, wins are integer units when win_scale is set."""
         clusters = Cluster.get_clusters(board, wild_key)
         return_data = {
             "totalWin": 0,
@@ -180,6 +180,7 @@ class Cluster:
             global_multiplier=global_multiplier,
             multiplier_key=multiplier_key,
             return_data=return_data,
+            win_scale=win_scale,
         )
 
         return_data["totalWin"] += total_win
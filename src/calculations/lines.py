@@ -1,7 +1,9 @@
 """Evaluates and records winds for lines games."""
 
 from src.calculations.symbol import Symbol
+from src.calculations.position import Position
 from src.config.config import Config
+from src.wins.fixed_point import get_scaled_paytable
 from src.wins.multiplier_strategy import apply_mult
 from src.events.events import (
     win_info_event,
@@ -32,8 +34,10 @@ class Lines:
         wild_sym: str = "W",
         multiplier_method: str = "symbol",
         global_multiplier: int = 1,
+        win_scale: int = None,
     ):
-        """More efficient lines calculation"""
+        """More efficient lines calculation, wins are integer units when win_scale is set."""
+        paytable = get_scaled_paytable(config, win_scale)
         return_data = {
             "totalWin": 0,
             "wins": [],
@@ -68,17 +72,21 @@ class Lines:
                         break
                 potential_line.append(sym)
 
-            if (wild_matches, wild_sym) in config.paytable:
-                wild_win = config.paytable[(wild_matches, wild_sym)]
+            if (wild_matches, wild_sym) in paytable:
+                wild_win = paytable[(wild_matches, wild_sym)]
             if first_non_wild is not None:
-                if (wild_matches + matches, first_non_wild.name) in config.paytable:
-                    base_win = config.paytable[(wild_matches + matches, first_non_wild.name)]
+                if (wild_matches + matches, first_non_wild.name) in paytable:
+                    base_win = paytable[(wild_matches + matches, first_non_wild.name)]
 
             if base_win > 0 or wild_win > 0:
                 if wild_win > base_win:
-                    positions = [{"reel": idx, "row": line[idx]} for idx in range(0, wild_matches)]
+                    positions = [Position(idx, line[idx]) for idx in range(0, wild_matches)]
                     line_win, applied_mult = apply_mult(
-                        board, multiplier_method, global_multiplier=global_multiplier, win_amount=wild_win, positions=positions
+                        board,
+                        multiplier_method,
+                        global_multiplier=global_multiplier,
+                        win_amount=wild_win,
+                        positions=positions,
                     )
                     win_dict = Lines.line_win_info(
                         potential_line[0].name,
@@ -94,9 +102,13 @@ class Lines:
                         },
                     )
                 else:
-                    positions = [{"reel": idx, "row": line[idx]} for idx in range(0, matches + wild_matches)]
+                    positions = [Position(idx, line[idx]) for idx in range(0, matches + wild_matches)]
                     line_win, applied_mult = apply_mult(
-                        board, multiplier_method, global_multiplier=global_multiplier, win_amount=base_win, positions=positions
+                        board,
+                        multiplier_method,
+                        global_multiplier=global_multiplier,
+                        win_amount=base_win,
+                        positions=positions,
                     )
                     win_dict = Lines.line_win_info(
                         first_non_wild.name,
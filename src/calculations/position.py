@@ -0,0 +1,19 @@
+"""Compact board positions used by win calculations, converted to {"reel", "row"} dicts only when events are built."""
+
+from typing import Iterable, List, NamedTuple
+
+
+class Position(NamedTuple):
+    """Immutable (reel, row) board position."""
+
+    reel: int
+    row: int
+
+
+def position_json(position: Position, row_offset: int = 0) -> dict:
+    """Event format of a position, row_offset accounts for padding symbols above the board."""
+    return {"reel": position[0], "row": position[1] + row_offset}
+
+
+def positions_json(positions: Iterable[Position], row_offset: int = 0) -> List[dict]:
+    return [{"reel": reel, "row": row + row_offset} for reel, row in positions]
@@ -0,0 +1,187 @@
+"""
+Exact first-reveal statistics of create_board_reelstrips, convolved from each reel's window set instead of sampled.
+"""
+
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class RevealDistribution:
+    """
+    Exact first-reveal distribution of one reelstrip or of a reel_weights mix.
+    scatter_counts maps (scatters, super scatters) on the board to a probability. symbol_counts maps each
+    paying symbol, after config.symbol_aliases and with wilds counted, to {count on board: probability}.
+    """
+
+    __slots__ = ("scatter_counts", "symbol_counts", "paytable")
+
+    def __init__(
+        self,
+        scatter_counts: Dict[Tuple[int, int], float],
+        symbol_counts: Dict[str, Dict[int, float]],
+        paytable: Dict[Tuple[int, str], float],
+    ):
+        self.scatter_counts = scatter_counts
+        self.symbol_counts = symbol_counts
+        self.paytable = paytable
+
+    @staticmethod
+    def mix(weighted: List[Tuple["RevealDistribution", float]]) -> "RevealDistribution":
+        """Weighted average of distributions, as drawn by a reel_weights sampler."""
+        total_weight = sum(weight for _, weight in weighted)
+        assert total_weight > 0, "reel weights must sum to a positive value"
+        scatter_counts = defaultdict(float)
+        symbol_counts = defaultdict(lambda: defaultdict(float))
+        for distribution, weight in weighted:
+            share = weight / total_weight
+            for key, prob in distribution.scatter_counts.items():
+                scatter_counts[key] += prob * share
+            for symbol, counts in distribution.symbol_counts.items():
+                for count, prob in counts.items():
+                    symbol_counts[symbol][count] += prob * share
+        return RevealDistribution(
+            dict(scatter_counts),
+            {symbol: dict(counts) for symbol, counts in symbol_counts.items()},
+            weighted[0][0].paytable,
+        )
+
+    def get_scatter_totals(self) -> Dict[int, float]:
+        """Probability of each number of scatter-family symbols on the board."""
+        totals = defaultdict(float)
+        for (scatters, super_scatters), prob in self.scatter_counts.items():
+            totals[scatters + super_scatters] += prob
+        return dict(sorted(totals.items()))
+
+    def get_bonus_probabilities(self, classify: Callable[[int, int], Optional[str]]) -> Dict[str, float]:
+        """Probability of each bonus type, classify maps (scatters, super scatters) to a bonus type or None."""
+        bonuses = defaultdict(float)
+        for (scatters, super_scatters), prob in self.scatter_counts.items():
+            bonus_type = classify(scatters, super_scatters)
+            if bonus_type is not None:
+                bonuses[bonus_type] += prob
+        return dict(bonuses)
+
+    def get_symbol_rtp(self) -> Dict[str, float]:
+        """Expected first-reveal scatter-pay of each symbol, before symbol multipliers."""
+        return {
+            symbol: sum(prob * self.paytable.get((count, symbol), 0) for count, prob in counts.items())
+            for symbol, counts in self.symbol_counts.items()
+        }
+
+    def get_symbol_hit_rates(self) -> Dict[str, float]:
+        """Probability that each symbol pays on the first reveal."""
+        return {
+            symbol: sum(prob for count, prob in counts.items() if self.paytable.get((count, symbol), 0) > 0)
+            for symbol, counts in self.symbol_counts.items()
+        }
+
+    def get_rtp(self) -> float:
+        return sum(self.get_symbol_rtp().values())
+
+
+def get_reel_windows(reel_strip: List[str], num_rows: int) -> List[Tuple[str, ...]]:
+    """Every window of num_rows consecutive symbols on a circular reel strip, by stop position."""
+    reel_len = len(reel_strip)
+    return [tuple(reel_strip[(start + row) % reel_len] for row in range(num_rows)) for start in range(reel_len)]
+
+
+def _convolve(valid_windows: List[List[Tuple[tuple, bool]]]) -> Dict[tuple, float]:
+    """
+    Distribution of the summed window values over all reels, with windows drawn as create_board_reelstrips does:
+    uniformly from a reel's valid windows, and only from windows without a super scatter once one has been drawn.
+    Each window is given as (value, has super scatter).
+    """
+    states = {(None, False): 1.0}
+    for reel, windows in enumerate(valid_windows):
+        options = Counter(windows)
+        no_super = Counter({key: count for key, count in options.items() if not key[1]})
+        num_options, num_no_super = sum(options.values()), sum(no_super.values())
+        next_states = defaultdict(float)
+        for (total, super_used), prob in states.items():
+            if super_used:
+                if not no_super:
+                    raise RuntimeError(f"Unable to satisfy BS constraint with available reel windows on reel {reel}.")
+                reel_options, reel_count = no_super, num_no_super
+            else:
+                reel_options, reel_count = options, num_options
+            for (value, has_super), count in reel_options.items():
+                new_total = value if total is None else tuple(a + b for a, b in zip(total, value))
+                next_states[(new_total, super_used or has_super)] += prob * count / reel_count
+        states = next_states
+
+    distribution = defaultdict(float)
+    for (total, _), prob in states.items():
+        distribution[total] += prob
+    return dict(distribution)
+
+
+def get_reelstrip_distribution(config: object, reelstrip: List[List[str]]) -> RevealDistribution:
+    """Exact first-reveal distribution of one reelstrip, windows showing more than one scatter are never drawn."""
+    scatter_names = set(config.special_symbols.get("scatter", []))
+    super_names = set(config.special_symbols.get("super_scatter", []))
+    wild_names = set(config.special_symbols.get("wild", []))
+    symbol_aliases = getattr(config, "symbol_aliases", {})
+    pay_symbols = sorted({symbol for _, symbol in config.paytable})
+
+    valid_windows = []
+    for reel in range(config.num_reels):
+        windows = [
+            window
+            for window in get_reel_windows(reelstrip[reel], config.num_rows[reel])
+            if sum(1 for name in window if name in scatter_names or name in super_names) <= 1
+        ]
+        if not windows:
+            raise RuntimeError(f"No valid reel windows available for reel {reel}.")
+        valid_windows.append(windows)
+
+    def has_super(window: tuple) -> bool:
+        return any(name in super_names for name in window)
+
+    scatter_counts = _convolve(
+        [
+            [
+                (
+                    (
+                        sum(1 for name in window if name in scatter_names),
+                        sum(1 for name in window if name in super_names),
+                    ),
+                    has_super(window),
+                )
+                for window in windows
+            ]
+            for windows in valid_windows
+        ]
+    )
+    symbol_counts = {}
+    for symbol in pay_symbols:
+        counts = _convolve(
+            [
+                [
+                    (
+                        (sum(1 for name in window if name in wild_names or symbol_aliases.get(name, name) == symbol),),
+                        has_super(window),
+                    )
+                    for window in windows
+                ]
+                for windows in valid_windows
+            ]
+        )
+        symbol_counts[symbol] = {count[0]: prob for count, prob in sorted(counts.items())}
+
+    return RevealDistribution(dict(sorted(scatter_counts.items())), symbol_counts, config.paytable)
+
+
+def get_reveal_distributions(config: object) -> Dict[str, RevealDistribution]:
+    """Exact first-reveal distribution of every reelstrip in config.reels."""
+    return {
+        reelstrip_id: get_reelstrip_distribution(config, reelstrip) for reelstrip_id, reelstrip in config.reels.items()
+    }
+
+
+def get_mix_distribution(
+    distributions: Dict[str, RevealDistribution], reel_weights: Dict[str, float]
+) -> RevealDistribution:
+    """First-reveal distribution of a reel_weights mix, e.g. conditions["reel_weights"][gametype]."""
+    return RevealDistribution.mix(
+        [(distributions[reelstrip_id], weight) for reelstrip_id, weight in reel_weights.items()]
+    )
@@ -1,9 +1,11 @@
 """Handle win calculation for pay-anywhere games"""
 
-from typing import List, Dict
+from typing import List
 from collections import defaultdict
 from src.calculations.symbol import Symbol
+from src.calculations.position import Position
 from src.config.config import Config
+from src.wins.fixed_point import get_scaled_paytable
 
 
 class Scatter:
@@ -11,14 +13,13 @@ class Scatter:
 
     @staticmethod
     def get_central_scatter_position(
-        rows_for_overlay: List, winning_positions: List[Dict], max_reels: int, max_rows: int
-    ) -> tuple:
+        rows_for_overlay: List, winning_positions: List[Position], max_reels: int, max_rows: int
+    ) -> Position:
         """Return position on screen to display win amount."""
         closest_to_middle = 100
         reel_to_overlay = 0
         row_to_overlay = 0
-        for pos in winning_positions:
-            reel, row = pos["reel"], pos["row"]
+        for reel, row in winning_positions:
             dist_from_middle = (reel - max_reels / 2) ** 2 + (row - max_rows / 2) ** 2
             if (
                 dist_from_middle < closest_to_middle
@@ -29,7 +30,7 @@ class Scatter:
                 reel_to_overlay = reel
                 row_to_overlay = row
 
-        return (reel_to_overlay, row_to_overlay)
+        return Position(reel_to_overlay, row_to_overlay)
 
     @staticmethod
     def get_scatterpay_wins(
@@ -38,16 +39,25 @@ class Scatter:
         wild_key: str = "wild",
         multiplier_key: str = "multiplier",
         global_multiplier: int = 1,
+        win_scale: int = None,
+        return_data: dict = None,
     ) -> dict:
-        """Return win data for all paying symbols"""
-        return_data = {
-            "totalWin": 0,
-            "wins": [],
-        }
+        """
+        Return win data for all paying symbols, as integer units when win_scale is set.
+        Symbols listed in config.symbol_aliases are counted and paid as the symbol they alias.
+        A reset return_data container (e.g. from the gamestate SpinPool) is filled in place of a new dict.
+        """
+        if return_data is None:
+            return_data = {
+                "totalWin": 0,
+                "wins": [],
+            }
         rows_for_overlay = []
         symbols_on_board = defaultdict(list)
         wild_positions = []
-        total_win = 0.0
+        total_win = 0.0 if win_scale is None else 0
+        paytable = get_scaled_paytable(config, win_scale)
+        symbol_aliases = getattr(config, "symbol_aliases", {})
         scatter_symbol_names = set()
         scatter_symbol_names.update(config.special_symbols.get("scatter", []))
         scatter_symbol_names.update(config.special_symbols.get("super_scatter", []))
@@ -55,19 +65,19 @@ class Scatter:
         for reel_idx, reel in enumerate(board):
             for row_idx, symbol in enumerate(reel):
                 if symbol.name not in config.special_symbols[wild_key]:
-                    symbols_on_board[symbol.name].append({"reel": reel_idx, "row": row_idx})
+                    symbols_on_board[symbol_aliases.get(symbol.name, symbol.name)].append(Position(reel_idx, row_idx))
                 else:
-                    wild_positions.append({"reel": reel_idx, "row": row_idx})
+                    wild_positions.append(Position(reel_idx, row_idx))
 
         # Update all symbol positions with wilds, as this symbol is shared
         for sym in symbols_on_board:
             if len(wild_positions) > 0:
                 symbols_on_board[sym].extend(wild_positions)
             win_size = len(symbols_on_board[sym])
-            if (win_size, sym) in config.paytable:
+            if (win_size, sym) in paytable:
                 symbol_mult = 0
-                for p in symbols_on_board[sym]:
-                    board_symbol = board[p["reel"]][p["row"]]
+                for reel_idx, row_idx in symbols_on_board[sym]:
+                    board_symbol = board[reel_idx][row_idx]
                     if board_symbol.check_attribute(multiplier_key):
                         symbol_mult += board_symbol.get_attribute(multiplier_key)
 
@@ -81,16 +91,13 @@ class Scatter:
                 rows_for_overlay.append(overlay_position[1])
                 symbol_win_data = {
                     "symbol": sym,
-                    "win": config.paytable[(win_size, sym)] * global_multiplier * symbol_mult,
+                    "win": paytable[(win_size, sym)] * global_multiplier * symbol_mult,
                     "positions": symbols_on_board[sym],
                     "meta": {
                         "globalMult": global_multiplier,
                         "clusterMult": symbol_mult,
-                        "winWithoutMult": config.paytable[(win_size, sym)],
-                        "overlay": {
-                            "reel": overlay_position[0],
-                            "row": overlay_position[1],
-                        },
+                        "winWithoutMult": paytable[(win_size, sym)],
+                        "overlay": overlay_position,
                     },
                 }
                 total_win += symbol_win_data["win"]
@@ -1,13 +1,17 @@
 import random
+from bisect import bisect_left
 from typing import Union
 
 
-def get_random_outcome(distribution: dict, totalWeight: float = None) -> Union[float, int]:
-    """Returns a value from a distibution passed as a dictionary: {value : weight, ...}"""
+def get_random_outcome(distribution: dict, totalWeight: float = None, rng: random.Random = None) -> Union[float, int]:
+    """
+    Returns a value from a distibution passed as a dictionary: {value : weight, ...}, drawn from rng (default: random
+    module)
+    """
     assert isinstance(distribution, dict), "distribution must be of type: dict "
     if totalWeight is None:
         totalWeight = sum(distribution.values())
-    roll = random.uniform(0, totalWeight)
+    roll = (random if rng is None else rng).uniform(0, totalWeight)
     cumulative = 0.0
     for value, weight in distribution.items():
         cumulative += weight
@@ -17,6 +21,32 @@ def get_random_outcome(distribution: dict, totalWeight: float = None) -> Union[f
     return Exception("error drawing item from distribution")
 
 
+class WeightedSampler:
+    """
+    Precomputed cumulative weights of a {value: weight} distribution, drawn with bisect.
+    Consumes the same random number and returns the same value as get_random_outcome for a given rng state.
+    """
+
+    __slots__ = ("values", "cumulative", "total")
+
+    def __init__(self, distribution: dict):
+        assert isinstance(distribution, dict), "distribution must be of type: dict "
+        self.values = list(distribution.keys())
+        self.total = sum(distribution.values())
+        self.cumulative = []
+        cumulative = 0.0
+        for weight in distribution.values():
+            cumulative += weight
+            self.cumulative.append(cumulative)
+
+    def sample(self, rng: random.Random = None) -> Union[float, int]:
+        roll = (random if rng is None else rng).uniform(0, self.total)
+        idx = bisect_left(self.cumulative, roll)
+        if idx == len(self.values):
+            return Exception("error drawing item from distribution")
+        return self.values[idx]
+
+
 def get_mean_std_median(dist: dict) -> tuple[float, float, float]:
     """Returns mean and standard deviation from an ordered win-distribution."""
     total = 0
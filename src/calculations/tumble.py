@@ -11,6 +11,7 @@ class Tumble(Board):
         self.board_before_tumble = copy(self.board)
         static_board = copy(self.board)
         self.new_symbols_from_tumble = [[] for _ in range(len(static_board))]
+        tumbled_reels = []
 
         for reel, _ in enumerate(static_board):
             exploding_symbols = 0
@@ -36,16 +37,17 @@ class Tumble(Board):
                     f"new reel length must match expected board size:\n expected: {self.config.num_rows[reel]} \n actual: {len(copy_reel)}"
                 )
             static_board[reel] = copy_reel
+            if exploding_symbols > 0:
+                tumbled_reels.append(reel)
 
             if self.config.include_padding and exploding_symbols > 0:
-                padding_name = str(
-                    self.reelstrip[reel][(self.reel_positions[reel] - 1) % len(self.reelstrip[reel])]
-                )
+                padding_name = str(self.reelstrip[reel][(self.reel_positions[reel] - 1) % len(self.reelstrip[reel])])
                 self.top_symbols[reel] = self.create_symbol(padding_name)
                 self.new_symbols_from_tumble[reel].insert(0, self.top_symbols[reel])
 
         self.board = static_board
-        self.get_special_symbols_on_board()
+        for reel in tumbled_reels:
+            self.reindex_reel(reel)
 
     def set_end_tumble_event(self) -> None:
         """Emit wins related to latest cumulative tumble sequence."""
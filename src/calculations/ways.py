@@ -2,7 +2,9 @@
 
 from collections import defaultdict
 from src.calculations.symbol import Symbol
+from src.calculations.position import Position
 from src.config.config import Config
+from src.wins.fixed_point import get_scaled_paytable
 from src.wins.multiplier_strategy import apply_mult
 from src.events.events import (
     win_info_event,
@@ -22,8 +24,13 @@ class Ways:
         global_multiplier: int = 1,
         multiplier_key: str = "multiplier",
         multiplier_strategy: str = "symbol",
+        win_scale: int = None,
     ):
-        """Ways calculation with possibility for global multiplier application."""
+        """
+        Ways calculation with possibility for global multiplier application, wins are integer units when win_scale is
+        set.
+        """
+        paytable = get_scaled_paytable(config, win_scale)
         return_data = {
             "totalWin": 0,
             "wins": [],
@@ -37,14 +44,12 @@ class Ways:
                 sym = board[reel][row]
                 if reel == 0 and sym.name not in potential_wins:
                     potential_wins[sym.name] = [[] for _ in range(len(board))]
-                    potential_wins[sym.name][0] = [{"reel": reel, "row": row}]
+                    potential_wins[sym.name][0] = [Position(reel, row)]
                 elif sym.name in potential_wins:
-                    potential_wins[sym.name][reel].append({"reel": reel, "row": row})
+                    potential_wins[sym.name][reel].append(Position(reel, row))
 
                 if sym.name in config.special_symbols[wild_key]:
-                    wilds[reel].append({"reel": reel, "row": row})
-                    if board[reel][row].check_attribute(multiplier_key):
-                        wilds[reel][-1][multiplier_key] = board[reel][row].get_attribute(multiplier_key)
+                    wilds[reel].append(Position(reel, row))
 
         for symbol in potential_wins:
             kind, ways, cumulative_sym_mult = (0, 1, 0)
@@ -55,7 +60,7 @@ class Ways:
                     # Note that here multipliers on subsequent reels multiply (not add, like in lines games)
                     symbols_have_mult = False
                     for s in potential_wins[symbol][reel]:
-                        if board[s["reel"]][s["row"]].check_attribute(multiplier_key):
+                        if board[s.reel][s.row].check_attribute(multiplier_key):
                             symbols_have_mult = True
 
                     if symbols_have_mult is False:
@@ -63,26 +68,24 @@ class Ways:
                     else:
                         reel_sym_count = 0
                         for s in potential_wins[symbol][reel]:
-                            if (
-                                board[s["reel"]][s["row"]].check_attribute(multiplier_key)
-                                and multiplier_strategy == "symbol"
-                            ):
-                                reel_sym_count += board[s["reel"]][s["row"]].get_attribute(multiplier_key)
+                            if board[s.reel][s.row].check_attribute(multiplier_key) and multiplier_strategy == "symbol":
+                                reel_sym_count += board[s.reel][s.row].get_attribute(multiplier_key)
                             else:
                                 reel_sym_count += 1
                                 if (
-                                    board[s["reel"]][s["row"]].check_attribute(multiplier_key)
+                                    board[s.reel][s.row].check_attribute(multiplier_key)
                                     and multiplier_strategy == "board"
                                 ):
-                                    gm = board[s["reel"]][s["row"]].get_attribute(multiplier_key)
+                                    gm = board[s.reel][s.row].get_attribute(multiplier_key)
                                     board_mult_count += gm * (gm > 1)
 
                     if len(wilds[reel]) > 0:
                         for sym in wilds[reel]:
-                            if board[sym["reel"]][sym["row"]].check_attribute(
-                                multiplier_key
-                            ) and multiplier_strategy in ["board", "symbol"]:
-                                wild_mult_val = board[sym["reel"]][sym["row"]].get_attribute(multiplier_key)
+                            if board[sym.reel][sym.row].check_attribute(multiplier_key) and multiplier_strategy in [
+                                "board",
+                                "symbol",
+                            ]:
+                                wild_mult_val = board[sym.reel][sym.row].get_attribute(multiplier_key)
                                 cumulative_sym_mult += wild_mult_val * (wild_mult_val > 1)
                                 if multiplier_strategy == "board":
                                     reel_sym_count += 1
@@ -105,7 +108,7 @@ class Ways:
                 case "symbol":
                     win_multiplier = 1
 
-            if (kind, symbol) in config.paytable:
+            if (kind, symbol) in paytable:
                 positions = []
                 for reel in range(kind):
                     for pos in potential_wins[symbol][reel]:
@@ -113,7 +116,7 @@ class Ways:
                     for pos in wilds[reel]:
                         positions += [pos]
 
-                win = round(config.paytable[kind, symbol] * ways, 2)
+                win = round(paytable[kind, symbol] * ways, 2)
                 win_amt, multiplier = apply_mult(
                     board=board,
                     strategy="global",
@@ -1,7 +1,10 @@
 """Set standard gamestate configuration with default values."""
 
+from bisect import bisect_right
+
 from src.config.betmode import BetMode
 from src.config.paths import PATH_TO_GAMES
+from src.config.validation import get_validation
 import os
 
 
@@ -33,6 +36,7 @@ class Config:
         self.special_sybol_names = set()
         self.paying_symbol_names = set()
         self.all_valid_sym_names = set()
+        self.symbol_aliases = {}  # symbols which pay as another symbol, e.g. {"BS": "S"}
 
         # Define special Symbols properties - list all possible symbol states during game-play
         self.basegame_type = "basegame"
@@ -50,10 +54,38 @@ class Config:
 
         self.write_event_list = True
 
+        # Random number stream used by the gamestate: "mt" reproduces existing books, "philox" uses per-sim counter
+        # based streams
+        self.rng_mode = "mt"
+        self.rng_seed = 0
+
+        # Abort spin attempts at reveal/tumble/freegame checks once the criteria can no longer be met (changes the rng
+        # draw sequence)
+        self.early_rejection = False
+
+        # Fail a run when a single book needs more attempts or seconds than this, None disables the limit
+        self.repeat_budget = {"attempts": None, "seconds": None}
+
+        # Runtime checks: {"level": "off" | "sampled" | "full", "sample_every": N books}, applied by create_books and
+        # workers
+        self.validation = get_validation()
+
+        # Debug events are counted and summarised once per batch. Categories in "verbose" also print each event,
+        # at most "max_lines" per batch and every "sample_every"-th event, "progress" prints a line every fifth of a
+        # batch
+        self.sim_logging = {"verbose": (), "max_lines": 20, "sample_every": 1, "progress": False}
+
+        # Hold wins as integers in units of 1/win_scale of the bet (e.g. 100 for cents), None keeps float multipliers
+        self.win_scale = None
+
+        # Bank this many outcomes per bonus entry before the books and splice them into books, 0 simulates every bonus
+        self.bonus_bank_size = 0
+
         self.bet_modes = []
         self.opt_params = {None: None}
 
         # Define win-levels for each game-mode, returned during win information events
+        self._win_level_bounds = {}
         self.win_levels = {
             "standard": {
                 1: (0, 0.1),
@@ -82,10 +114,19 @@ class Config:
         }
 
     def get_win_level(self, win_amount: float, winlevel_key: str) -> int:
-        levels = self.win_levels[winlevel_key]
-        for idx, pair in levels.items():
-            if win_amount >= pair[0] and win_amount < pair[1]:
-                return idx
+        """Bisect level lower bounds, sorted once per key on first use."""
+        bounds = self._win_level_bounds.get(winlevel_key)
+        if bounds is None:
+            levels = sorted(self.win_levels[winlevel_key].items(), key=lambda level: level[1][0])
+            bounds = self._win_level_bounds[winlevel_key] = (
+                [pair[0] for _, pair in levels],
+                [pair[1] for _, pair in levels],
+                [idx for idx, _ in levels],
+            )
+        lower, upper, idxs = bounds
+        pos = bisect_right(lower, win_amount) - 1
+        if pos >= 0 and win_amount < upper[pos]:
+            return idxs[pos]
         return RuntimeError(f"winLevel not found: {win_amount}")
 
     def get_special_symbol_names(self) -> None:
@@ -128,11 +169,9 @@ class Config:
                 split_line = line.strip().split(",")
                 for reelIndex in range(len(split_line)):
                     if count == 0:
-                        reelstrips.append(["".join([ch for ch in split_line[reelIndex] if ch.strip().isalnum()])])
+                        reelstrips.append(["".join(filter(str.isalnum, split_line[reelIndex]))])
                     else:
-                        reelstrips[reelIndex].append(
-                            "".join([ch for ch in split_line[reelIndex] if ch.strip().isalnum() and len(ch) > 0])
-                        )
+                        reelstrips[reelIndex].append("".join(filter(str.isalnum, split_line[reelIndex])))
 
                     assert len(reelstrips[reelIndex][-1]) > 0, "Symbol is empty."
                 count += 1
@@ -3,6 +3,8 @@
 from typing import Union
 import json
 
+from src.config.validation import should_validate
+
 
 class Distribution:
     """Setup simulation conditions."""
@@ -20,9 +22,10 @@ class Distribution:
         default_distribution_conditions: dict = {"force_wincap": False, "force_freegame": False},
     ):
 
-        if fixed_amt is None:
-            assert quota > 0, "non-zero quota value must be assigned"
-        assert sum([quota is None, fixed_amt is None]) == 1, "must define either quota or fixed simulation amount"
+        if should_validate():
+            if fixed_amt is None:
+                assert quota > 0, "non-zero quota value must be assigned"
+            assert sum([quota is None, fixed_amt is None]) == 1, "must define either quota or fixed simulation amount"
 
         self._quota = quota
         self._criteria = criteria
@@ -35,8 +38,9 @@ class Distribution:
     def verify_and_set_conditions(self, conditions):
         """Enforce required conditions for distribution setup."""
         condition_keys = list(conditions.keys())
-        for rk in self._required_distribution_conditions:
-            assert rk in condition_keys, f"condition missing required key: {rk}\n condition_keys"
+        if should_validate():
+            for rk in self._required_distribution_conditions:
+                assert rk in condition_keys, f"condition missing required key: {rk}\n condition_keys"
 
         for rk in list(self._default_distribution_conditions.keys()):
             if rk not in condition_keys:
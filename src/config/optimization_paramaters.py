@@ -1,5 +1,7 @@
 """Construct optimization class from GameConfig.bet_mode specifications."""
 
+from src.config.validation import should_validate
+
 
 class OptimizationParameters:
     """Construct optimization parameter class for each bet mode."""
@@ -14,12 +16,15 @@ class OptimizationParameters:
         bet_cost: float = None,
         search_conditions=None,
     ):
+        validate = should_validate()
         if rtp is None or rtp == "x":
-            assert all([av_win is not None, hr is not None]), "if RTP is not specified, hit-rate (hr) "
+            if validate:
+                assert all([av_win is not None, hr is not None]), "if RTP is not specified, hit-rate (hr) "
             rtp = round(av_win / hr, 5)
-        none_count = sum([1 for x in [rtp, av_win, hr] if x is None])
-        assert none_count < 3, "Criteria RTP is ill defined."
-        assert bet_cost is not None, "Define a bet-cost for parameter."
+        if validate:
+            none_count = sum([1 for x in [rtp, av_win, hr] if x is None])
+            assert none_count < 3, "Criteria RTP is ill defined."
+            assert bet_cost is not None, "Define a bet-cost for parameter."
 
         if rtp is None:
             rtp = round(av_win / hr, 5)
@@ -36,7 +41,8 @@ class OptimizationParameters:
             search_range = (search_conditions, search_conditions)
             force_search = {}
         elif isinstance(search_conditions, tuple):
-            assert search_conditions[0] <= search_conditions[1], "Enter (min, max) payout format."
+            if validate:
+                assert search_conditions[0] <= search_conditions[1], "Enter (min, max) payout format."
             search_range = search_conditions
             force_search = {}
         elif isinstance(search_conditions, dict):
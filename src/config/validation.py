@@ -0,0 +1,37 @@
+"""Runtime validation levels shared by the correctness checks on the simulation hot path."""
+
+from typing import Dict
+
+VALIDATION_LEVELS = ("off", "sampled", "full")
+
+_validation = {"level": "full", "sample_every": 100}
+
+
+def set_validation(level: str, sample_every: int = None) -> None:
+    """Set the process-wide validation level, sample_every is the book interval checked at the "sampled" level."""
+    assert level in VALIDATION_LEVELS, f"validation level must be one of {VALIDATION_LEVELS}"
+    _validation["level"] = level
+    if sample_every is not None:
+        assert sample_every > 0, "sample_every must be a positive number of books"
+        _validation["sample_every"] = int(sample_every)
+
+
+def get_validation() -> Dict:
+    """Copy of the current validation settings."""
+    return dict(_validation)
+
+
+def should_validate(sim: int = None, validation: Dict = None) -> bool:
+    """
+    Whether a check should run. "full" runs every check, "off" none.
+    "sampled" runs checks for every sample_every-th book, one-off checks without a sim number always run.
+    validation is a settings dict such as config.validation, the process-wide default is used when it is None.
+    """
+    if validation is None:
+        validation = _validation
+    level = validation["level"]
+    if level == "full":
+        return True
+    if level == "off":
+        return False
+    return sim is None or sim % validation["sample_every"] == 0
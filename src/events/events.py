@@ -1,7 +1,39 @@
 """Defines reusable events"""
 
-from copy import deepcopy
+from functools import wraps
 from src.events.event_constants import EventConstants
+from src.wins.fixed_point import units_to_cents, units_to_multiplier
+from src.calculations.position import position_json, positions_json
+
+
+def skip_in_stats_mode(emitter):
+    """Emitter returns without building its event when the gamestate only collects statistics."""
+
+    @wraps(emitter)
+    def wrapper(gamestate, *args, **kwargs):
+        if getattr(gamestate, "stats_only", False):
+            return None
+        return emitter(gamestate, *args, **kwargs)
+
+    return wrapper
+
+
+def get_event_cents(gamestate, amount, truncate: bool = False) -> int:
+    """
+    Win amount capped at wincap, in cents of the bet for an event.
+    Fixed-point wins convert exactly, float wins keep the legacy rounding (or truncation where events always truncated).
+    """
+    win_scale = getattr(gamestate, "win_scale", None)
+    if win_scale is not None:
+        return units_to_cents(min(amount, gamestate.wincap_win), win_scale)
+    if truncate:
+        return int(min(amount, gamestate.config.wincap) * 100)
+    return int(round(min(amount, gamestate.config.wincap) * 100))
+
+
+def get_event_multiplier(gamestate, amount) -> float:
+    """Bet multiplier of a win amount, for win level lookups."""
+    return units_to_multiplier(amount, getattr(gamestate, "win_scale", None))
 
 
 def json_ready_sym(symbol: object, special_attributes: list = None):
@@ -15,20 +47,24 @@ def json_ready_sym(symbol: object, special_attributes: list = None):
     return print_sym
 
 
-def reveal_event(gamestate):
-    """Display the initial board drawn from reelstrips."""
-    board_client = []
+@skip_in_stats_mode
+def reveal_event(gamestate, board_client: list = None):
+    """
+    Display the initial board drawn from reelstrips, board_client holds pre-serialised reel columns of a fixed board.
+    """
     special_attributes = list(gamestate.config.special_symbols.keys())
-    for reel, _ in enumerate(gamestate.board):
-        board_client.append([])
-        for row in range(len(gamestate.board[reel])):
-            board_client[reel].append(json_ready_sym(gamestate.board[reel][row], special_attributes))
+    if board_client is None:
+        board_client = []
+        for reel, _ in enumerate(gamestate.board):
+            board_client.append([])
+            for row in range(len(gamestate.board[reel])):
+                board_client[reel].append(json_ready_sym(gamestate.board[reel][row], special_attributes))
+    else:
+        board_client = [list(reel) for reel in board_client]
 
     if gamestate.config.include_padding:
         for reel, _ in enumerate(board_client):
-            board_client[reel] = [json_ready_sym(gamestate.top_symbols[reel], special_attributes)] + board_client[
-                reel
-            ]
+            board_client[reel] = [json_ready_sym(gamestate.top_symbols[reel], special_attributes)] + board_client[reel]
             board_client[reel].append(json_ready_sym(gamestate.bottom_symbols[reel], special_attributes))
 
     event = {
@@ -42,6 +78,7 @@ def reveal_event(gamestate):
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def fs_trigger_event(
     gamestate,
     include_padding_index=True,
@@ -51,12 +88,7 @@ def fs_trigger_event(
     """Triggers feature game from the basegame."""
     assert basegame_trigger != freegame_trigger, "must set either basegame_trigger or freeSpinTrigger to = True"
     event = {}
-    scatter_positions = []
-    for reel, _ in enumerate(gamestate.special_syms_on_board["scatter"]):
-        scatter_positions.append(gamestate.special_syms_on_board["scatter"][reel])
-    if include_padding_index:
-        for pos in scatter_positions:
-            pos["row"] += 1
+    scatter_positions = positions_json(gamestate.special_syms_on_board["scatter"], 1 if include_padding_index else 0)
 
     if basegame_trigger:
         event = {
@@ -77,112 +109,93 @@ def fs_trigger_event(
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def set_win_event(gamestate, winlevel_key: str = "standard"):
     """Used for updating cumulative win ticker (for a single outcome)."""
     if not gamestate.wincap_triggered:
         event = {
             "index": len(gamestate.book.events),
             "type": EventConstants.SET_WIN.value,
-            "amount": int(
-                min(
-                    round(gamestate.win_manager.spin_win * 100, 0),
-                    gamestate.config.wincap * 100,
-                )
+            "amount": get_event_cents(gamestate, gamestate.win_manager.spin_win),
+            "winLevel": gamestate.config.get_win_level(
+                get_event_multiplier(gamestate, gamestate.win_manager.spin_win), winlevel_key
             ),
-            "winLevel": gamestate.config.get_win_level(gamestate.win_manager.spin_win, winlevel_key),
         }
         gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def set_total_event(gamestate):
     """Updates win amount for a betting round (including cumulative wins across multiple freespin wins)."""
     event = {
         "index": len(gamestate.book.events),
         "type": EventConstants.SET_TOTAL_WIN.value,
-        "amount": int(
-            round(
-                min(gamestate.win_manager.running_bet_win, gamestate.config.wincap) * 100,
-                0,
-            )
-        ),
+        "amount": get_event_cents(gamestate, gamestate.win_manager.running_bet_win),
     }
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def set_tumble_event(gamestate):
     """Update banner indicating wins from successive tumbles."""
     event = {
         "index": len(gamestate.book.events),
         "type": EventConstants.SET_TUMBLE_WIN.value,
-        "amount": int(round(min(gamestate.tumble_win, gamestate.config.wincap) * 100)),
+        "amount": get_event_cents(gamestate, gamestate.tumble_win),
     }
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def wincap_event(gamestate):
     """Emit to indicate end of spin actions."""
     event = {
         "index": len(gamestate.book.events),
         "type": EventConstants.WINCAP.value,
-        "amount": int(
-            round(
-                min(gamestate.win_manager.running_bet_win, gamestate.config.wincap) * 100,
-                0,
-            )
-        ),
+        "amount": get_event_cents(gamestate, gamestate.win_manager.running_bet_win),
     }
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def win_info_event(gamestate, include_padding_index=True):
     """
     include_padding_index: starts winning-symbol positions at row=1, to account for top/bottom symbol inclusion in board
     """
-    win_data_copy = {}
-    win_data_copy["wins"] = deepcopy(gamestate.win_data["wins"])
-    for idx, w in enumerate(win_data_copy["wins"]):
-        if include_padding_index:
-            new_positions = []
-            for p in w["positions"]:
-                new_positions.append({"reel": p["reel"], "row": p["row"] + 1})
-        else:
-            new_positions = w["positions"]
-
-        win_data_copy["wins"][idx]["win"] = int(
-            round(min(win_data_copy["wins"][idx]["win"], gamestate.config.wincap) * 100, 0)
-        )
-        win_data_copy["wins"][idx]["positions"] = new_positions
-        if "meta" in win_data_copy["wins"][idx]:
-            win_data_copy["wins"][idx]["meta"]["winWithoutMult"] = int(
-                int(
-                    min(
-                        win_data_copy["wins"][idx]["meta"]["winWithoutMult"] * 100,
-                        gamestate.config.wincap * 100,
-                    ),
-                )
-            )
-            if "overlay" in win_data_copy["wins"][idx]["meta"] and include_padding_index:
-                win_data_copy["wins"][idx]["meta"]["overlay"]["row"] += 1
+    row_offset = 1 if include_padding_index else 0
+    wins = []
+    for win in gamestate.win_data["wins"]:
+        win_json = dict(win)
+        win_json["win"] = get_event_cents(gamestate, win["win"])
+        win_json["positions"] = positions_json(win["positions"], row_offset)
+        if "meta" in win:
+            meta = win_json["meta"] = dict(win["meta"])
+            meta["winWithoutMult"] = get_event_cents(gamestate, meta["winWithoutMult"], truncate=True)
+            if "overlay" in meta:
+                meta["overlay"] = position_json(meta["overlay"], row_offset)
+        wins.append(win_json)
 
     event = {
         "index": len(gamestate.book.events),
         "type": EventConstants.WIN_DATA.value,
-        "totalWin": int(round(min(gamestate.win_data["totalWin"], gamestate.config.wincap) * 100, 0)),
-        "wins": win_data_copy["wins"],
+        "totalWin": get_event_cents(gamestate, gamestate.win_data["totalWin"]),
+        "wins": wins,
     }
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def update_tumble_win_event(gamestate):
     """Update a banner to record successive tumble wins."""
     event = {
         "index": len(gamestate.book.events),
         "type": EventConstants.UPDATE_TUMBLE_WIN.value,
-        "amount": int(round(min(gamestate.win_manager.spin_win, gamestate.config.wincap) * 100, 0)),
+        "amount": get_event_cents(gamestate, gamestate.win_manager.spin_win),
     }
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def update_freespin_event(gamestate):
     """Update the current spin number and total freegame"""
     event = {
@@ -194,17 +207,21 @@ def update_freespin_event(gamestate):
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def freespin_end_event(gamestate, winlevel_key="endFeature"):
     """End of feature trigger."""
     event = {
         "index": len(gamestate.book.events),
         "type": EventConstants.FREE_SPIN_END.value,
-        "amount": int(min(gamestate.win_manager.freegame_wins, gamestate.config.wincap) * 100),
-        "winLevel": gamestate.config.get_win_level(gamestate.win_manager.freegame_wins, winlevel_key),
+        "amount": get_event_cents(gamestate, gamestate.win_manager.freegame_wins, truncate=True),
+        "winLevel": gamestate.config.get_win_level(
+            get_event_multiplier(gamestate, gamestate.win_manager.freegame_wins), winlevel_key
+        ),
     }
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def final_win_event(gamestate):
     """Assigns final payout multiplier for a simulation."""
     event = {
@@ -215,6 +232,7 @@ def final_win_event(gamestate):
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def update_global_mult_event(gamestate):
     """Increment global multiplier value."""
     event = {
@@ -226,17 +244,15 @@ def update_global_mult_event(gamestate):
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def tumble_board_event(gamestate):
     """States the symbol positions removed from a board during tumble, and which new symbols should take their place."""
     special_attributes = list(gamestate.config.special_symbols.keys())
 
+    row_offset = 1 if gamestate.config.include_padding else 0
     exploding = []
     for win in gamestate.win_data["wins"]:
-        for pos in win["positions"]:
-            if gamestate.config.include_padding:
-                exploding.append({"reel": pos["reel"], "row": pos["row"] + 1})
-            else:
-                exploding.append({"reel": pos["reel"], "row": pos["row"]})
+        exploding += positions_json(win["positions"], row_offset)
 
     exploding = sorted(exploding, key=lambda x: x["reel"])
 
@@ -254,6 +270,7 @@ def tumble_board_event(gamestate):
     gamestate.book.add_event(event)
 
 
+@skip_in_stats_mode
 def enter_bonus_event(gamestate) -> None:
     "Indicate feature game entry explicitly."
     event = {
@@ -34,7 +34,7 @@ class Executables(Conditions, Tumble):
 
     def evaluate_wincap(self) -> None:
         """Indicate spin functions should stop once wincap is reached."""
-        if self.win_manager.running_bet_win >= self.config.wincap and not (self.wincap_triggered):
+        if self.win_manager.running_bet_win >= self.wincap_win and not (self.wincap_triggered):
             self.wincap_triggered = True
             wincap_event(self)
             return True
@@ -68,7 +68,31 @@ class Executables(Conditions, Tumble):
             }
         )
         self.update_freespin_amount()
-        self.run_freespin()
+        self.run_bonus("freegame")
+
+    def run_bonus(self, bonus_type: str) -> None:
+        """Play a triggered freegame, through the bonus bank when config.bonus_bank_size is set."""
+        bonus_bank = getattr(self, "bonus_bank", None)
+        if bonus_bank is None:
+            self.run_freespin()
+        else:
+            bonus_bank.run(self, bonus_type)
+
+    def get_bank_bonus_entries(self) -> list:
+        """
+        (bonus type, awarded spins) of every run_bonus() call the game can make, simulated ahead by the bonus bank.
+        """
+        max_cap = getattr(self.config, "max_free_spins_per_round", float("inf"))
+        spins = sorted({min(n, max_cap) for n in self.config.freespin_triggers[self.config.basegame_type].values()})
+        return [("freegame", n) for n in spins]
+
+    def start_banked_bonus(self, bonus_type: str, tot_fs: int) -> None:
+        """Trigger state a bonus starts from when the bonus bank plays it from a fresh book."""
+        self.tot_fs = tot_fs
+        self.fs_retrigger_count = 0
+
+    def end_banked_bonus(self, bonus_type: str) -> None:
+        """Undo start_banked_bonus state which outlives the bonus."""
 
     def update_freespin_amount(self, scatter_key: str = "scatter") -> None:
         """Set initial number of spins for a freegame and transmit event."""
@@ -107,7 +131,7 @@ class Executables(Conditions, Tumble):
         update_freespin_event(self)
         self.fs += 1
         self.win_manager.reset_spin_win()
-        self.win_data = {}
+        self.win_data = self.spin_pool.reset_win_data()
 
     def end_freespin(self) -> None:
         """Transmit total amount awarded during freegame."""
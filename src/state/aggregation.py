@@ -0,0 +1,108 @@
+"""Collect per-chunk simulation results returned by worker processes."""
+
+from typing import Dict, List, Tuple
+
+from src.state.early_rejection import new_rejection_stats, merge_rejection_stats, print_rejection_stats
+from src.state.telemetry import merge_criteria_telemetry, print_criteria_telemetry
+from src.state.sim_logging import merge_log_counts, print_log_counts
+
+
+def make_results_message(gamestate: object, betmode: str, thread_index: int, repeat_count: int) -> dict:
+    """Compact summary of a finished simulation chunk, sent back to the parent process."""
+    return {
+        "betmode": betmode,
+        "thread": thread_index,
+        "repeat": repeat_count,
+        "num_sims": len(gamestate.library),
+        "force_keys": sorted(gamestate.mode_force_keys),
+        "recorded_events": [
+            (description, details["timesTriggered"], details["bookIds"])
+            for description, details in gamestate.recorded_events.items()
+        ],
+        "criteria_wins": gamestate.criteria_wins,
+        "rejection_stats": gamestate.rejection_stats,
+        "criteria_telemetry": gamestate.criteria_telemetry,
+        "log_counts": gamestate.sim_log.counts,
+    }
+
+
+class SimulationAggregator:
+    """
+    Merge results messages from all chunks of a betmode.
+    Messages may arrive in any order, they are merged in chunk order so that force-records are deterministic.
+    """
+
+    def __init__(self, betmode: str, threads: int, cost: float = 1.0):
+        self.betmode = betmode
+        self.threads = threads
+        self.cost = cost
+        self.force_keys = set()
+        self.force_results = {}
+        self.criteria_wins = {}
+        self.num_sims = 0
+        self.rejection_stats = new_rejection_stats()
+        self.criteria_telemetry = {}
+        self.log_counts = {}
+        self._pending = {}
+        self._next_chunk = 0
+
+    def chunk_index(self, thread_index: int, repeat_count: int) -> int:
+        """Position of a chunk within the output file order."""
+        return repeat_count * self.threads + thread_index
+
+    def merge(self, message: dict) -> None:
+        """Queue a results message and merge all chunks which are now contiguous."""
+        self._pending[self.chunk_index(message["thread"], message["repeat"])] = message
+        while self._next_chunk in self._pending:
+            self._merge_chunk(self._pending.pop(self._next_chunk))
+            self._next_chunk += 1
+
+    def _merge_chunk(self, message: dict) -> None:
+        self.num_sims += message["num_sims"]
+        self.force_keys.update(message["force_keys"])
+        for description, times_triggered, book_ids in message["recorded_events"]:
+            if description in self.force_results:
+                self.force_results[description]["timesTriggered"] += times_triggered
+                self.force_results[description]["bookIds"] += book_ids
+            else:
+                self.force_results[description] = {
+                    "timesTriggered": times_triggered,
+                    "bookIds": list(book_ids),
+                }
+        for criteria, wins in message["criteria_wins"].items():
+            totals = self.criteria_wins.setdefault(criteria, [0, 0.0, 0.0, 0.0])
+            for idx, val in enumerate(wins):
+                totals[idx] += val
+        if "rejection_stats" in message:
+            merge_rejection_stats(self.rejection_stats, message["rejection_stats"])
+        merge_criteria_telemetry(self.criteria_telemetry, message.get("criteria_telemetry", {}))
+        merge_log_counts(self.log_counts, message.get("log_counts", {}))
+
+    def missing_chunks(self) -> List[int]:
+        """Chunks received out of order which are still waiting on an earlier chunk."""
+        return sorted(self._pending.keys())
+
+    def get_rtp_summary(self) -> Dict[str, Tuple[int, float, float, float]]:
+        """Return {criteria: (sims, rtp, basegame rtp, freegame rtp)} relative to all betmode simulations."""
+        total_bet = max(self.num_sims, 1) * self.cost
+        summary = {}
+        for criteria, (count, total, base, free) in self.criteria_wins.items():
+            summary[criteria] = (count, total / total_bet, base / total_bet, free / total_bet)
+        return summary
+
+    def print_rtp_summary(self) -> None:
+        """Print combined RTP across all threads and batches."""
+        summary = self.get_rtp_summary()
+        total_rtp = sum(x[1] for x in summary.values())
+        base_rtp = sum(x[2] for x in summary.values())
+        free_rtp = sum(x[3] for x in summary.values())
+        print(
+            f"[{self.betmode}] {self.num_sims} sims finished with {round(total_rtp, 3)} RTP.",
+            f"[baseGame: {round(base_rtp, 3)}, freeGame: {round(free_rtp, 3)}]",
+            flush=True,
+        )
+        for criteria, (count, rtp, _, _) in summary.items():
+            print(f"    criteria {criteria}: {count} sims, RTP contribution {round(rtp, 3)}", flush=True)
+        print_rejection_stats(self.betmode, self.rejection_stats)
+        print_criteria_telemetry(self.betmode, self.criteria_telemetry)
+        print_log_counts(self.betmode, self.log_counts)
@@ -0,0 +1,226 @@
+"""Banked freegame outcomes, simulated once per bonus entry before the books and shared by every mode entering it."""
+
+import json
+import hashlib
+from copy import deepcopy
+from warnings import warn
+
+from src.events.event_constants import EventConstants
+from src.events.events import get_event_cents
+from src.wins.win_manager import WinManager
+
+# Bank bonuses use sim ids far above any library book id, so their rng streams never coincide with a book
+BANK_SIM_OFFSET = 1 << 40
+
+
+class BonusOutcome:
+    """Events, wins, force records and end state of one simulated bonus, relative to where it started."""
+
+    __slots__ = (
+        "rng_state",
+        "events",
+        "records",
+        "freegame_wins",
+        "running_win",
+        "spin_win",
+        "fs",
+        "tot_fs",
+        "fs_retrigger_count",
+        "wincap_triggered",
+    )
+
+    def __init__(self, rng_state: object, events: list, records: list, gamestate: object, start_wins: tuple):
+        self.rng_state = rng_state
+        self.events = events
+        self.records = records
+        self.freegame_wins = gamestate.win_manager.freegame_wins - start_wins[0]
+        self.running_win = gamestate.win_manager.running_bet_win - start_wins[1]
+        self.spin_win = gamestate.win_manager.spin_win
+        self.fs = gamestate.fs
+        self.tot_fs = gamestate.tot_fs
+        self.fs_retrigger_count = getattr(gamestate, "fs_retrigger_count", 0)
+        self.wincap_triggered = gamestate.wincap_triggered
+
+
+class BonusBank:
+    """
+    Store of bonus outcomes keyed by bonus type, awarded spins, mode wincap and the distribution conditions which
+    drive the freegame. Modes and criteria entering a bonus under the same key share its outcomes.
+    Each key is simulated once by build() before the books which can draw from it, and is read-only afterwards.
+    """
+
+    # Conditions deciding whether and how a bonus is entered from the base game, not how the freegame plays
+    ENTRY_CONDITIONS = ("scatter_triggers", "force_freegame", "force_super_bonus")
+
+    def __init__(self, size: int):
+        assert size > 0, "bonus bank size must be positive"
+        self.size = size
+        self.store = {}
+        self.entry_keys = {}
+
+    @staticmethod
+    def get_freegame_conditions(config: object, conditions: dict) -> str:
+        """
+        Serialised conditions of the freegame: per-gametype conditions (reel_weights, mult_values, ...) contribute
+        their freegame entry, every other condition outside ENTRY_CONDITIONS contributes as a whole.
+        """
+        gametypes = {config.basegame_type, config.freegame_type}
+        freegame = {}
+        for name, value in conditions.items():
+            if name in BonusBank.ENTRY_CONDITIONS:
+                continue
+            if isinstance(value, dict) and config.freegame_type in value and set(value) <= gametypes:
+                value = value[config.freegame_type]
+            freegame[name] = value
+        return json.dumps(freegame, sort_keys=True, default=str)
+
+    @staticmethod
+    def make_entry_key(gamestate: object) -> tuple:
+        """(mode wincap, freegame conditions) of the current criteria."""
+        context = gamestate.get_criteria_context()
+        return (context.wincap, BonusBank.get_freegame_conditions(gamestate.config, context.conditions))
+
+    def get_entry_key(self, gamestate: object) -> tuple:
+        entry_key = self.entry_keys.get((gamestate.betmode, gamestate.criteria))
+        return self.make_entry_key(gamestate) if entry_key is None else entry_key
+
+    def get_key(self, gamestate: object, bonus_type: str, tot_fs: int = None) -> tuple:
+        return (bonus_type, gamestate.tot_fs if tot_fs is None else tot_fs) + self.get_entry_key(gamestate)
+
+    @staticmethod
+    def get_key_sim(key: tuple) -> int:
+        """First reserved sim id of a key, derived from the key alone so outcomes do not depend on build order."""
+        return BANK_SIM_OFFSET + int(hashlib.sha256(repr(key).encode()).hexdigest()[:12], 16)
+
+    @staticmethod
+    def get_final_win(gamestate: object, running_win: float) -> float:
+        """Payout multiplier update_final_win would give for a running win."""
+        if gamestate.win_scale is None:
+            return round(min(running_win, gamestate.config.wincap), 2)
+        return min(running_win, gamestate.wincap_win) / gamestate.win_scale
+
+    def build(self, gamestate: object, betmode: str, num_sims: int = None) -> None:
+        """
+        Simulate size outcomes of every bonus entry (gamestate.get_bank_bonus_entries()) of every criteria of betmode
+        whose key is not banked yet. Runs in the parent process before any chunk, so books do not depend on the
+        backend or thread layout. Warns when num_sims books share fewer distinct outcomes per key.
+        """
+        bet_mode = gamestate.get_betmode(betmode)
+        gamestate.betmode = betmode
+        gamestate.win_manager = WinManager(
+            gamestate.config.basegame_type,
+            gamestate.config.freegame_type,
+            bet_mode.get_wincap(),
+            gamestate.config.win_scale,
+        )
+        rejection_predicates = gamestate.rejection_predicates
+        gamestate.rejection_predicates = []
+        new_keys = 0
+        try:
+            for distribution in bet_mode.get_distributions():
+                gamestate.criteria = distribution.get_criteria()
+                self.entry_keys[(betmode, gamestate.criteria)] = self.make_entry_key(gamestate)
+                for bonus_type, tot_fs in gamestate.get_bank_bonus_entries():
+                    key = self.get_key(gamestate, bonus_type, tot_fs)
+                    if key in self.store:
+                        continue
+                    first_sim = self.get_key_sim(key)
+                    self.store[key] = [
+                        self.simulate_entry(gamestate, bonus_type, tot_fs, first_sim + idx) for idx in range(self.size)
+                    ]
+                    new_keys += 1
+        finally:
+            gamestate.rejection_predicates = rejection_predicates
+            gamestate.library = {}
+            gamestate.recorded_events = {}
+            gamestate.mode_force_keys = set()
+            gamestate.criteria_wins = {}
+        print(
+            f"Banked {self.size} bonus outcomes for {new_keys} new bonus entries of {betmode},"
+            f" {len(self.store)} in total."
+        )
+        if num_sims is not None and num_sims > self.size:
+            warn(
+                f"{betmode}: bonus rounds of {num_sims} books are drawn from {self.size} banked outcomes per bonus"
+                " entry, books repeat bonus rounds. Raise config.bonus_bank_size for more distinct bonus rounds."
+            )
+
+    def simulate_entry(self, gamestate: object, bonus_type: str, tot_fs: int, sim: int) -> BonusOutcome:
+        """Play one bonus of bonus_type from a fresh book, in the trigger state set by gamestate.start_banked_bonus."""
+        gamestate.reset_seed(sim)
+        gamestate.reset_book()
+        gamestate.start_banked_bonus(bonus_type, tot_fs)
+        try:
+            return self.simulate(gamestate)
+        finally:
+            gamestate.end_banked_bonus(bonus_type)
+
+    def get_outcomes(self, gamestate: object, key: tuple) -> list:
+        """Banked outcomes which can still meet the criteria win from the current base-game win."""
+        outcomes = self.store.get(key, [])
+        win_criteria = gamestate.get_criteria_context().win_criteria
+        if win_criteria is None:
+            return outcomes
+        base_win = gamestate.win_manager.running_bet_win
+        return [o for o in outcomes if self.get_final_win(gamestate, base_win + o.running_win) == win_criteria]
+
+    def run(self, gamestate: object, bonus_type: str) -> None:
+        """Play the bonus which was just triggered from the bank, live when no banked outcome can meet the criteria."""
+        key = self.get_key(gamestate, bonus_type)
+        outcomes = self.get_outcomes(gamestate, key)
+        if not outcomes:
+            gamestate.run_freespin()
+            gamestate.sim_log.event("BonusBankLive", key=key[:2])
+            return
+
+        outcome = outcomes[gamestate.rng.randrange(len(outcomes))]
+        base_win = gamestate.win_manager.running_bet_win
+        if not outcome.wincap_triggered and base_win + outcome.running_win < gamestate.wincap_win:
+            self.splice(gamestate, outcome, get_event_cents(gamestate, base_win))
+        else:
+            # The wincap would be reached at a different point, rerun the same bonus from its banked rng state.
+            gamestate.rng.setstate(outcome.rng_state)
+            gamestate.run_freespin()
+            gamestate.sim_log.event("BonusBankReplay", key=key[:2])
+
+    def simulate(self, gamestate: object) -> BonusOutcome:
+        """Play the bonus live and return it, events are deep copies sharing nothing with the book."""
+        rng_state = gamestate.rng.getstate()
+        start_wins = (gamestate.win_manager.freegame_wins, gamestate.win_manager.running_bet_win)
+        first_event = len(gamestate.book.events)
+        first_record = len(gamestate.temp_wins)
+        gamestate.run_freespin()
+
+        events = []
+        for idx, event in enumerate(gamestate.book.events[first_event:]):
+            event = deepcopy(event)
+            event["index"] = idx
+            events.append(event)
+        records = deepcopy(gamestate.temp_wins[first_record::2])
+        return BonusOutcome(rng_state, events, records, gamestate, start_wins)
+
+    def splice(self, gamestate: object, outcome: BonusOutcome, total_offset_cents: int) -> None:
+        """
+        Append a banked bonus to the current book, Book.add_event stores a deep copy of each event.
+        Running-total events move by the base-game win, which matches a live bonus whenever wins are whole cents.
+        """
+        gamestate.reset_fs_spin()
+        first_event = len(gamestate.book.events)
+        for event in outcome.events:
+            event = dict(event)
+            event["index"] += first_event
+            if total_offset_cents and event["type"] == EventConstants.SET_TOTAL_WIN.value:
+                event["amount"] += total_offset_cents
+            gamestate.book.add_event(event)
+        for description in outcome.records:
+            gamestate.record(dict(description))
+
+        gamestate.win_manager.freegame_wins += outcome.freegame_wins
+        gamestate.win_manager.running_bet_win += outcome.running_win
+        gamestate.win_manager.spin_win = outcome.spin_win
+        gamestate.fs = outcome.fs
+        gamestate.tot_fs = outcome.tot_fs
+        gamestate.fs_retrigger_count = outcome.fs_retrigger_count
+        gamestate.wincap_triggered = outcome.wincap_triggered
+        gamestate.sim_log.event("BonusBankSplice", events=len(outcome.events))
+        gamestate.check_early_rejection("freegame")
@@ -8,9 +8,14 @@ class Book:
 
     def __init__(self, book_id: int, criteria: str):
         "Initialize simulation book"
+        self.events = []
+        self.reset(book_id, criteria)
+
+    def reset(self, book_id: int, criteria: str):
+        "Reuse the book for a new attempt, the event list is cleared rather than replaced."
         self.id = book_id
         self.payout_multiplier = 0.0
-        self.events = []
+        self.events.clear()
         self.criteria = criteria
         self.basegame_wins = 0.0
         self.freegame_wins = 0.0
@@ -35,3 +40,29 @@ class Book:
             "freeGameWins": self.freegame_wins,
         }
         return json_book
+
+    def detach(self):
+        "Return JSON-ready object which outlives the book, the event list is handed over and the book gets a new one."
+        json_book = self.to_json()
+        self.events = []
+        return json_book
+
+
+class StatsBook(Book):
+    "Book for stats-only simulations, keeping payout, criteria and base/free wins but no events."
+
+    def add_event(self, event: dict):
+        "Events are not stored."
+
+    def append_book_items(self, event_id: int, appended_info: dict):
+        "Events are not stored."
+
+    def to_json(self):
+        "Return JSON-ready object without events."
+        return {
+            "id": self.id,
+            "payoutMultiplier": int(round(self.payout_multiplier * 100, 0)),
+            "criteria": self.criteria,
+            "baseGameWins": self.basegame_wins,
+            "freeGameWins": self.freegame_wins,
+        }
@@ -0,0 +1,181 @@
+"""Chunk level checkpoints, allowing an interrupted create_books run to be resumed."""
+
+import os
+import json
+import inspect
+import hashlib
+
+from src.write_data.write_data import read_recorded_wins
+from src.state.early_rejection import new_rejection_stats
+
+
+def get_file_sha256(filename: str, block_size: int = 1 << 20) -> str:
+    """Hash file contents in blocks, temp book files can be large."""
+    sha = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def get_source_files(config_class: type, reels_path: str) -> list:
+    """Config class sources (including parent classes) and every reel csv file of a game, in a stable order."""
+    sources = []
+    for cls in config_class.__mro__:
+        if cls is object:
+            continue
+        source = inspect.getsourcefile(cls)
+        if source is not None and source not in sources:
+            sources.append(source)
+    if os.path.isdir(reels_path):
+        sources += sorted(os.path.join(reels_path, f) for f in os.listdir(reels_path) if f.endswith(".csv"))
+    return sources
+
+
+def get_config_hash(config_class: type, reels_path: str) -> str:
+    """Hash of the config class sources and reel files, changing whenever the game definition does."""
+    sha = hashlib.sha256()
+    for filename in get_source_files(config_class, reels_path):
+        sha.update(os.path.basename(filename).encode())
+        sha.update(get_file_sha256(filename).encode())
+    return sha.hexdigest()
+
+
+def get_run_hash(
+    config: object,
+    betmode: str,
+    threads: int,
+    num_repeats: int,
+    sims_per_thread: int,
+    compress: bool,
+    criteria_assignment: list,
+    simulation_seeds: list,
+    sim_offset: int = 0,
+    stats_only: bool = False,
+) -> str:
+    """
+    Identify a simulation setup, checkpoints are only reused when the config and reel sources, the settings changing
+    book contents and the criteria and seeds assigned to each sim are unchanged.
+    Stats-only runs hash differently, so their chunks (written without books) are never resumed by a full run.
+    """
+    sha = hashlib.sha256()
+    sha.update(get_config_hash(type(config), config.reels_path).encode("UTF-8"))
+    settings = [
+        config.rng_mode,
+        config.rng_seed,
+        config.win_scale,
+        config.early_rejection,
+        config.bonus_bank_size,
+        bool(stats_only),
+        sim_offset,
+    ]
+    sha.update(json.dumps([betmode, threads, num_repeats, sims_per_thread, bool(compress)] + settings).encode("UTF-8"))
+    sha.update(json.dumps(list(criteria_assignment)).encode("UTF-8"))
+    sha.update(json.dumps(list(simulation_seeds)).encode("UTF-8"))
+    return sha.hexdigest()
+
+
+class CheckpointManifest:
+    """
+    Manifest of completed simulation chunks for one betmode, stored alongside the temp files.
+    Each entry holds the sim-id range, the content hash of every temp output and the chunk summary sent to the parent
+    process.
+    """
+
+    def __init__(
+        self,
+        output_files: object,
+        betmode: str,
+        run_hash: str,
+        compress: bool,
+        resume: bool = False,
+        books: bool = True,
+    ):
+        self.output_files = output_files
+        self.books = books
+        self.betmode = betmode
+        self.run_hash = run_hash
+        self.compress = compress
+        self.path = os.path.join(output_files.temp_path, f"checkpoint_{betmode}.json")
+        self.chunks = {}
+        if resume and os.path.isfile(self.path):
+            with open(self.path, "r", encoding="UTF-8") as f:
+                manifest = json.load(f)
+            if manifest.get("run_hash") == run_hash:
+                self.chunks = manifest["chunks"]
+                print(f"Resuming {betmode} from checkpoint with {len(self.chunks)} completed chunks.")
+            else:
+                print(f"Checkpoint for {betmode} does not match current simulation setup, rerunning all chunks.")
+        self.save()
+
+    @staticmethod
+    def chunk_key(thread_index: int, repeat_count: int) -> str:
+        return f"{repeat_count}_{thread_index}"
+
+    def get_chunk_files(self, thread_index: int, repeat_count: int) -> list:
+        """Temp outputs written by a single run_sims call, stats-only runs write no books."""
+        books = [self.output_files.get_temp_multi_thread_name(self.betmode, thread_index, repeat_count, self.compress)]
+        return (books if self.books else []) + [
+            self.output_files.get_temp_lookup_name(self.betmode, thread_index, repeat_count),
+            self.output_files.get_temp_segmented_name(self.betmode, thread_index, repeat_count),
+            self.output_files.get_temp_force_name(self.betmode, thread_index, repeat_count),
+        ]
+
+    def record_chunk(self, message: dict, start_sim: int, end_sim: int) -> None:
+        """Hash temp outputs of a finished chunk and mark it complete."""
+        files = self.get_chunk_files(message["thread"], message["repeat"])
+        self.chunks[self.chunk_key(message["thread"], message["repeat"])] = {
+            "sim_range": [start_sim, end_sim],
+            "files": {os.path.basename(f): get_file_sha256(f) for f in files},
+            "summary": {
+                "num_sims": message["num_sims"],
+                "force_keys": message["force_keys"],
+                "criteria_wins": message["criteria_wins"],
+                "rejection_stats": message["rejection_stats"],
+                "criteria_telemetry": message["criteria_telemetry"],
+                "log_counts": message["log_counts"],
+            },
+        }
+        self.save()
+
+    def is_complete(self, thread_index: int, repeat_count: int) -> bool:
+        """Chunk has been recorded and all of its temp outputs are present and unmodified."""
+        entry = self.chunks.get(self.chunk_key(thread_index, repeat_count))
+        if entry is None:
+            return False
+        for filename in self.get_chunk_files(thread_index, repeat_count):
+            expected = entry["files"].get(os.path.basename(filename))
+            if expected is None or not os.path.isfile(filename) or get_file_sha256(filename) != expected:
+                print(
+                    f"Checkpoint chunk {self.chunk_key(thread_index, repeat_count)} of {self.betmode} is corrupted,"
+                    " rerunning."
+                )
+                return False
+        return True
+
+    def load_message(self, thread_index: int, repeat_count: int) -> dict:
+        """Rebuild the results message of a completed chunk."""
+        summary = self.chunks[self.chunk_key(thread_index, repeat_count)]["summary"]
+        recorded = read_recorded_wins(self.output_files.get_temp_force_name(self.betmode, thread_index, repeat_count))
+        return {
+            "betmode": self.betmode,
+            "thread": thread_index,
+            "repeat": repeat_count,
+            "num_sims": summary["num_sims"],
+            "force_keys": summary["force_keys"],
+            "recorded_events": [
+                (description, details["timesTriggered"], details["bookIds"])
+                for description, details in recorded.items()
+            ],
+            "criteria_wins": summary["criteria_wins"],
+            "rejection_stats": summary.get("rejection_stats", new_rejection_stats()),
+            "criteria_telemetry": summary.get("criteria_telemetry", {}),
+            "log_counts": summary.get("log_counts", {}),
+        }
+
+    def save(self) -> None:
+        """Write manifest atomically so an interruption never leaves a partial file."""
+        temp_name = self.path + ".tmp"
+        with open(temp_name, "w", encoding="UTF-8") as f:
+            json.dump({"betmode": self.betmode, "run_hash": self.run_hash, "chunks": self.chunks}, f)
+        os.replace(temp_name, self.path)
@@ -0,0 +1,143 @@
+"""Measure how well existing books cover optimization fences and win ranges."""
+
+import os
+import json
+import math
+from typing import Dict, List
+
+
+def read_library_outcomes(gamestate: object, betmode: str) -> tuple:
+    """Return per-book (criteria, win) lists indexed by book id, win is the payout multiplier used by the optimizer."""
+    criteria, wins = [], []
+    with open(gamestate.output_files.get_final_segmented_name(betmode), "r", encoding="UTF-8") as f:
+        for line in f:
+            if line.strip():
+                book_id, book_criteria, _ = line.split(",", 2)
+                while len(criteria) <= int(book_id):
+                    criteria.append(None)
+                criteria[int(book_id)] = book_criteria
+    wins = [0.0] * len(criteria)
+    with open(gamestate.output_files.get_final_lookup_name(betmode), "r", encoding="UTF-8") as f:
+        for line in f:
+            if line.strip():
+                book_id, _, payout = line.strip().split(",")
+                wins[int(book_id)] = int(payout) / 100.0
+    return criteria, wins
+
+
+def read_force_records(gamestate: object, betmode: str) -> list:
+    """Load the final force-record file of a mode."""
+    force_record_path = os.path.join(gamestate.output_files.force_path, f"force_record_{betmode}.json")
+    if not os.path.isfile(force_record_path):
+        return []
+    with open(force_record_path, "r", encoding="UTF-8") as f:
+        return json.load(f)
+
+
+def get_fence_books(fence_obj: dict, wins: list, force_records: list, remaining: set) -> set:
+    """
+    Book ids the optimizer assigns to a fence, following sort_wins_by_parameter in optimization_program:
+    * an exact search_range takes the remaining books with that win,
+    * a fence without force_search or search_range takes every remaining book, without removing them,
+    * otherwise remaining books of every force record matching all force_search keys are taken. A (start, end)
+      search_range has no force_search, so it matches every force record, the optimizer does not filter it by win.
+    Books taken by exact-win and force_search fences are removed from remaining, so later fences only see what is left.
+    """
+    start, end = fence_obj["search_range"]
+    if start > -1 and start == end:
+        books = {book_id for book_id in remaining if wins[book_id] == start}
+    elif not fence_obj["force_search"] and start == -1:
+        return set(remaining)
+    else:
+        search = {(str(key), str(val)) for key, val in fence_obj["force_search"].items() if str(val) != "None"}
+        books = set()
+        for record in force_records:
+            if search.issubset({(item["name"], item["value"]) for item in record["search"]}):
+                books.update(book_id for book_id in record["bookIds"] if book_id in remaining)
+    remaining -= books
+    return books
+
+
+def assign_fence_books(conditions: dict, criteria: list, wins: list, force_records: list) -> Dict[str, set]:
+    """
+    {fence: book ids} with fences filled in config order from the books earlier fences left, as the optimizer does.
+    """
+    remaining = {book_id for book_id, book_criteria in enumerate(criteria) if book_criteria is not None}
+    return {
+        fence: get_fence_books(fence_obj, wins, force_records, remaining) for fence, fence_obj in conditions.items()
+    }
+
+
+def measure_coverage(
+    gamestate: object,
+    betmode: str,
+    min_fence_books: int = 1000,
+    min_range_books: int = 100,
+) -> List[dict]:
+    """
+    Count books per fence and per scaling/bias win range of a mode's opt_params.
+    Each row holds the feeding criteria, current count, target and the fraction of that criteria's books landing in the
+    range.
+    """
+    opt_mode = gamestate.config.opt_params[betmode]
+    criteria, wins = read_library_outcomes(gamestate, betmode)
+    force_records = read_force_records(gamestate, betmode)
+    criteria_totals = {}
+    for book_criteria in criteria:
+        criteria_totals[book_criteria] = criteria_totals.get(book_criteria, 0) + 1
+
+    fence_books = assign_fence_books(opt_mode["conditions"], criteria, wins, force_records)
+    rows = []
+    for fence in opt_mode["conditions"]:
+        feeding = sum(1 for book_id in fence_books[fence] if criteria[book_id] == fence)
+        rows.append(
+            {
+                "name": f"fence {fence}",
+                "criteria": fence,
+                "count": len(fence_books[fence]),
+                "target": min_fence_books,
+                "rate": feeding / max(criteria_totals.get(fence, 0), 1),
+                "criteria_books": criteria_totals.get(fence, 0),
+            }
+        )
+
+    win_ranges = [(scale["criteria"], tuple(scale["win_range"])) for scale in opt_mode.get("scaling", [])]
+    win_ranges += [(bias["criteria"], tuple(bias["range"])) for bias in opt_mode.get("distribution_bias", [])]
+    for fence, (low, high) in win_ranges:
+        in_range = [book_id for book_id in fence_books.get(fence, ()) if low <= wins[book_id] <= high]
+        feeding = sum(1 for book_id in in_range if criteria[book_id] == fence)
+        rows.append(
+            {
+                "name": f"{fence} win range ({low}, {high})",
+                "criteria": fence,
+                "count": len(in_range),
+                "target": min_range_books,
+                "rate": feeding / max(criteria_totals.get(fence, 0), 1),
+                "criteria_books": criteria_totals.get(fence, 0),
+            }
+        )
+    return rows
+
+
+def print_coverage(betmode: str, rows: List[dict]) -> None:
+    """Print coverage table for a mode."""
+    print(f"\nCoverage for {betmode}:")
+    for row in rows:
+        status = "ok" if row["count"] >= row["target"] else "SPARSE"
+        print(f"    {row['name']}: {row['count']}/{row['target']} books [{status}]")
+
+
+def get_topup_sims(rows: List[dict], max_sims: int) -> Dict[str, int]:
+    """
+    Extra sims per criteria needed to fill the most under-populated range it feeds.
+    Ranges never observed assume a rate of 1/(criteria books + 1), the estimate is refined on the next round.
+    """
+    topup = {}
+    for row in rows:
+        deficit = row["target"] - row["count"]
+        if deficit <= 0:
+            continue
+        rate = row["rate"] if row["rate"] > 0 else 1.0 / (row["criteria_books"] + 1)
+        needed = min(int(math.ceil(deficit / rate)), max_sims)
+        topup[row["criteria"]] = max(topup.get(row["criteria"], 0), needed)
+    return topup
@@ -0,0 +1,59 @@
+"""Bet mode and criteria information resolved once, instead of scanning config.bet_modes on every lookup."""
+
+from src.calculations.statistics import WeightedSampler
+
+
+class CriteriaContext:
+    """
+    Frozen view of one (betmode, criteria): the BetMode, its Distribution and conditions, wincap, cost and samplers.
+    Samplers for weighted conditions are compiled on first use. Clear gamestate.criteria_contexts if conditions are
+    edited at runtime.
+    """
+
+    __slots__ = (
+        "betmode_name",
+        "criteria",
+        "betmode",
+        "distribution",
+        "conditions",
+        "win_criteria",
+        "wincap",
+        "cost",
+        "_samplers",
+    )
+
+    def __init__(self, betmode: object, distribution: object):
+        self.betmode_name = betmode.get_name()
+        self.criteria = distribution._criteria
+        self.betmode = betmode
+        self.distribution = distribution
+        self.conditions = distribution._conditions
+        self.win_criteria = distribution.get_win_criteria()
+        self.wincap = betmode.get_wincap()
+        self.cost = betmode.get_cost()
+        self._samplers = {}
+
+    def get_sampler(self, condition: str, gametype: str = None) -> WeightedSampler:
+        """Sampler for conditions[condition], or conditions[condition][gametype] for per-gametype weights."""
+        key = (condition, gametype)
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            weights = self.conditions[condition] if gametype is None else self.conditions[condition][gametype]
+            sampler = self._samplers[key] = WeightedSampler(weights)
+        return sampler
+
+
+def get_betmode_lookup(config: object) -> dict:
+    """{name: BetMode}, keeping the first bet mode when names repeat as the linear scan did."""
+    lookup = {}
+    for betmode in config.bet_modes:
+        lookup.setdefault(betmode.get_name(), betmode)
+    return lookup
+
+
+def make_criteria_context(betmode: object, criteria: str) -> CriteriaContext:
+    """Locate the criteria distribution of a bet mode."""
+    for distribution in betmode.get_distributions():
+        if distribution._criteria == criteria:
+            return CriteriaContext(betmode, distribution)
+    raise RuntimeError("Could not locate criteria distribution.")
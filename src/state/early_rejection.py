@@ -0,0 +1,67 @@
+"""Predicates which abort a spin attempt as soon as its criteria can no longer be met."""
+
+from typing import Dict
+
+REJECTION_STAGES = ("reveal", "tumble", "freegame")
+
+
+class SpinRejected(Exception):
+    """Raised inside a spin attempt to move straight to the next repeat."""
+
+    def __init__(self, stage: str, reason: str):
+        super().__init__(f"{reason} at {stage}")
+        self.stage = stage
+        self.reason = reason
+
+
+def win_exceeds_criteria(gamestate: object, stage: str) -> bool:
+    """
+    A fixed win_criteria fails once the capped, rounded running win has passed it.
+    Assumes wins never decrease within an attempt, games which reduce the spin win afterwards should not use this
+    predicate.
+    """
+    win_criteria = gamestate.get_criteria_context().win_criteria
+    if win_criteria is None:
+        return False
+    if gamestate.win_scale is not None:
+        return min(gamestate.win_manager.running_bet_win, gamestate.wincap_win) / gamestate.win_scale > win_criteria
+    return round(min(gamestate.win_manager.running_bet_win, gamestate.config.wincap), 2) > win_criteria
+
+
+DEFAULT_REJECTION_PREDICATES = (win_exceeds_criteria,)
+
+
+def new_rejection_stats() -> Dict:
+    """Per-chunk counters, steps are the stage checks (reveals, tumbles, freespins) played in an attempt."""
+    return {"completed": 0, "completed_steps": 0, "rejected": 0, "rejected_steps": 0, "stages": {}}
+
+
+def merge_rejection_stats(totals: Dict, stats: Dict) -> None:
+    """Add chunk counters into running totals."""
+    for key in ("completed", "completed_steps", "rejected", "rejected_steps"):
+        totals[key] += stats[key]
+    for stage, count in stats["stages"].items():
+        totals["stages"][stage] = totals["stages"].get(stage, 0) + count
+
+
+def get_saved_steps(stats: Dict) -> float:
+    """
+    Estimate steps avoided, assuming a rejected attempt would otherwise have cost as much as an average completed one.
+    """
+    if stats["completed"] == 0:
+        return 0.0
+    return stats["rejected"] * stats["completed_steps"] / stats["completed"] - stats["rejected_steps"]
+
+
+def print_rejection_stats(betmode: str, stats: Dict) -> None:
+    """Print how many attempts were cut short and the estimated work saved."""
+    if stats["rejected"] == 0:
+        return
+    attempts = stats["completed"] + stats["rejected"]
+    saved = get_saved_steps(stats)
+    spent = stats["completed_steps"] + stats["rejected_steps"]
+    print(
+        f"    early rejection: {stats['rejected']}/{attempts} attempts cut short {stats['stages']},",
+        f"~{int(saved)} steps saved ({round(100 * saved / max(saved + spent, 1), 1)}% of estimated work)",
+        flush=True,
+    )
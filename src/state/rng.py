@@ -0,0 +1,80 @@
+"""Random number streams owned by the gamestate, reseeded per simulation."""
+
+import random
+import hashlib
+
+import numpy as np
+
+MASK_64 = (1 << 64) - 1
+RECIP_BPF = 2.0**-53
+RNG_MODES = ("mt", "philox")
+
+
+class PhiloxRandom(random.Random):
+    """
+    random.Random API drawing from a counter-based Philox stream keyed by (stream id, base seed).
+    Switching streams only sets the Philox key, so a new stream per simulation is cheap and independent of the previous
+    one.
+    """
+
+    block_size = 64
+
+    def __init__(self, base_seed: int = 0):
+        self.base_seed = int(base_seed) & MASK_64
+        self._bit_generator = None
+        self._buffer = []
+        super().__init__(0)
+
+    def seed(self, a=None, version=2) -> None:
+        """Start the stream identified by a (an int, or hashed if not), matching random.seed(a) usage."""
+        if a is None:
+            a = 0
+        elif not isinstance(a, int):
+            a = int(hashlib.sha256(str(a).encode()).hexdigest()[:16], 16)
+        self._bit_generator = np.random.Philox(key=[int(a) & MASK_64, self.base_seed])
+        self._buffer = []
+        self.gauss_next = None
+
+    def _next_raw(self) -> int:
+        if not self._buffer:
+            self._buffer = self._bit_generator.random_raw(self.block_size).tolist()
+            self._buffer.reverse()
+        return self._buffer.pop()
+
+    def random(self) -> float:
+        """Float in [0, 1) from the top 53 bits of the next 64 bit output."""
+        return (self._next_raw() >> 11) * RECIP_BPF
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        value, bits = 0, 0
+        while bits < k:
+            value = (value << 64) | self._next_raw()
+            bits += 64
+        return value >> (bits - k)
+
+    def getstate(self) -> tuple:
+        return (self.base_seed, self._bit_generator.state, list(self._buffer), self.gauss_next)
+
+    def setstate(self, state: tuple) -> None:
+        self.base_seed, bit_state, buffer, self.gauss_next = state
+        self._bit_generator = np.random.Philox()
+        self._bit_generator.state = bit_state
+        self._buffer = list(buffer)
+
+    def get_numpy_generator(self) -> np.random.Generator:
+        """NumPy generator on the current stream, for batched sampling."""
+        return np.random.Generator(self._bit_generator)
+
+
+def make_rng(rng_mode: str = "mt", rng_seed: int = 0, shared: bool = True) -> random.Random:
+    """
+    Build the gamestate random stream.
+    "mt" returns the module level Mersenne Twister so that existing games reproduce previous books bit for bit,
+    unless shared=False, where a private Mersenne Twister instance gives the same per-sim streams for thread workers.
+    """
+    assert rng_mode in RNG_MODES, f"rng_mode must be one of {RNG_MODES}"
+    if rng_mode == "mt":
+        return random._inst if shared else random.Random()
+    return PhiloxRandom(rng_seed)
@@ -1,15 +1,25 @@
+import os
+import sys
 import time
 import math
 import random
 import hashlib
-from multiprocessing import Process, Manager
+import queue
+import threading
+from multiprocessing import Process, Queue
 import cProfile
 from warnings import warn
 import shutil
 import asyncio
 from typing import Dict
 
-from src.write_data.write_data import output_lookup_and_force_files
+from src.write_data.write_data import output_lookup_and_force_files, append_lookup_and_force_files, get_max_book_id
+from src.state.aggregation import SimulationAggregator
+from src.state.checkpoint import CheckpointManifest, get_run_hash
+from src.state.coverage import measure_coverage, print_coverage, get_topup_sims
+from src.state.rng import make_rng
+
+BACKENDS = ("process", "thread")
 
 
 def create_books(
@@ -20,13 +30,24 @@ def create_books(
     threads: int,
     compress: bool,
     profiling: bool,
+    resume: bool = False,
+    max_retries: int = 2,
+    concurrent_modes: bool = False,
+    backend: str = "process",
+    stats_only: bool = False,
 ):
-    """Main run-function for simulating game outcomes and outputting all files."""
+    """
+    Main run-function for simulating game outcomes and outputting all files.
+    With resume=True, chunks recorded in the checkpoint manifest of a previous interrupted run are verified and skipped.
+    With concurrent_modes=True, chunks of all modes share one worker pool and each mode is finalised as soon as it
+    completes.
+    backend selects worker processes ("process") or threads sharing the config ("thread", for free-threaded CPython).
+    With stats_only=True events are not built and no books are written, lookup tables and force records are still
+    produced.
+    """
     for key, ns in num_sim_args.items():
         if all([ns > 0, ns > batch_size * batch_size]):
-            assert (
-                ns % (threads * batch_size) == 0
-            ), "mode-sims/(batch * threads) must be divisible with no remainder"
+            assert ns % (threads * batch_size) == 0, "mode-sims/(batch * threads) must be divisible with no remainder"
         num_sim_args[key] = int(ns)
 
     if not compress and sum(num_sim_args.values()) > 1e4:
@@ -34,9 +55,16 @@ def create_books(
 
     if profiling and threads > 1:
         raise RuntimeError("Multithread profiling not supported, threads must = 1 with profiling enabled")
+    if profiling and concurrent_modes:
+        raise RuntimeError("Profiling is not supported with concurrent_modes enabled")
+    assert backend in BACKENDS, f"backend must be one of {BACKENDS}"
+    if backend == "thread" and concurrent_modes:
+        raise RuntimeError("concurrent_modes is only supported with the process backend")
 
+    gamestate.stats_only = stats_only
     startTime = time.time()
-    print("\nCreating books...")
+    print("\nCreating books..." if not stats_only else "\nRunning stats-only simulations...")
+    mode_sims = {}
     for betmode_name in num_sim_args:
         sim_counter = 0
         for bm in config.bet_modes:
@@ -48,10 +76,12 @@ def create_books(
         if sim_counter > 0:
             set_sim_amount = True
 
-        if num_sim_args[betmode_name] > 0:
+        if num_sim_args[betmode_name] > 0 and concurrent_modes:
+            mode_sims[betmode_name] = (max(num_sim_args[betmode_name], sim_counter), set_sim_amount)
+        elif num_sim_args[betmode_name] > 0:
             gamestate.betmode = betmode_name
             nsims = max(num_sim_args[betmode_name], sim_counter)
-            run_multi_process_sims(
+            aggregator = run_multi_process_sims(
                 threads,
                 batch_size,
                 config.game_id,
@@ -62,6 +92,9 @@ def create_books(
                 write_event_list=config.write_event_list,
                 profiling=profiling,
                 set_sim_amount=set_sim_amount,
+                resume=resume,
+                max_retries=max_retries,
+                backend=backend,
             )
 
             output_lookup_and_force_files(
@@ -72,22 +105,136 @@ def create_books(
                 gamestate,
                 num_sims=nsims,
                 compress=compress,
+                force_results=aggregator.force_results,
             )
+            aggregator.print_rtp_summary()
+
+    if mode_sims:
+        run_concurrent_mode_sims(
+            threads,
+            batch_size,
+            config.game_id,
+            gamestate,
+            mode_sims,
+            compress=compress,
+            write_event_list=config.write_event_list,
+            resume=resume,
+            max_retries=max_retries,
+        )
     shutil.rmtree(gamestate.output_files.temp_path)
     print("\nFinished creating books in", time.time() - startTime, "seconds.\n")
 
 
-def get_sim_splits(gamestate: object, num_sims: int, betmode_name: str) -> Dict[str, int]:
+def append_books(
+    gamestate: object,
+    config: object,
+    num_sim_args: dict,
+    batch_size: int,
+    threads: int,
+    compress: bool,
+    criteria_sims: Dict[str, Dict[str, int]] = None,
+    max_retries: int = 2,
+):
+    """
+    Simulate additional books for existing modes and merge them into the current library outputs.
+    New sim ids start after the largest id in each mode lookup table, seeds follow the same sim-id scheme as
+    create_books.
+    criteria_sims optionally sets {mode: {criteria: num_sims}}, otherwise num_sim_args are split by distribution quotas.
+    """
+    criteria_sims = {} if criteria_sims is None else criteria_sims
+    gamestate.output_files.check_folder_exists(gamestate.output_files.temp_path)
+    startTime = time.time()
+    print("\nAppending books...")
+    for betmode_name in set(num_sim_args) | set(criteria_sims):
+        num_sims_criteria = criteria_sims.get(betmode_name)
+        nsims = sum(num_sims_criteria.values()) if num_sims_criteria else int(num_sim_args.get(betmode_name, 0))
+        if nsims <= 0:
+            continue
+        # every thread in every batch runs the same number of sims, pad the final batch rather than dropping sims
+        padding = 0
+        while (nsims + padding) % (threads * max(int(round((nsims + padding) / threads / batch_size, 0)), 1)) != 0:
+            padding += 1
+        if padding > 0 and num_sims_criteria:
+            num_sims_criteria = dict(num_sims_criteria)
+            num_sims_criteria[max(num_sims_criteria, key=num_sims_criteria.get)] += padding
+        nsims += padding
+
+        sim_offset = get_max_book_id(gamestate.output_files.get_final_lookup_name(betmode_name)) + 1
+        print(f"Appending {nsims} sims to {betmode_name} from book id {sim_offset}")
+        gamestate.betmode = betmode_name
+        aggregator = run_multi_process_sims(
+            threads,
+            batch_size,
+            config.game_id,
+            betmode_name,
+            gamestate,
+            num_sims=nsims,
+            compress=compress,
+            write_event_list=config.write_event_list,
+            max_retries=max_retries,
+            sim_offset=sim_offset,
+            num_sims_criteria=num_sims_criteria,
+        )
+        append_lookup_and_force_files(
+            threads,
+            batch_size,
+            config.game_id,
+            betmode_name,
+            gamestate,
+            num_sims=nsims,
+            compress=compress,
+            force_results=aggregator.force_results,
+        )
+        aggregator.print_rtp_summary()
+    if os.path.isdir(gamestate.output_files.temp_path):
+        shutil.rmtree(gamestate.output_files.temp_path)
+    print("\nFinished appending books in", time.time() - startTime, "seconds.\n")
+
+
+def top_up_coverage(
+    gamestate: object,
+    config: object,
+    batch_size: int,
+    threads: int,
+    compress: bool,
+    modes: list = None,
+    min_fence_books: int = 1000,
+    min_range_books: int = 100,
+    max_rounds: int = 5,
+    max_sims_per_round: int = 1000000,
+) -> dict:
+    """
+    Append books only for criteria feeding under-populated optimization fences and win ranges, until targets are met.
+    Returns the final coverage rows for each mode.
+    """
+    modes = [m for m in config.opt_params if m is not None] if modes is None else modes
+    coverage = {}
+    for betmode_name in modes:
+        for round_index in range(max_rounds + 1):
+            coverage[betmode_name] = measure_coverage(gamestate, betmode_name, min_fence_books, min_range_books)
+            print_coverage(betmode_name, coverage[betmode_name])
+            topup = get_topup_sims(coverage[betmode_name], max_sims_per_round)
+            if not topup:
+                break
+            if round_index == max_rounds:
+                warn(f"{betmode_name} coverage targets not met after {max_rounds} top-up rounds.")
+                break
+            print(f"Top-up round {round_index + 1} for {betmode_name}: {topup}")
+            append_books(gamestate, config, {}, batch_size, threads, compress, criteria_sims={betmode_name: topup})
+    return coverage
+
+
+def get_sim_splits(gamestate: object, num_sims: int, betmode_name: str, rng: random.Random = None) -> Dict[str, int]:
     """Ensure assignment of criteria to all simulations numbers."""
+    rng = random.Random(0) if rng is None else rng
     betmode_distributions = gamestate.get_betmode(betmode_name).get_distributions()
     num_sims_criteria = {d._criteria: max(int(num_sims * d._quota), 1) for d in betmode_distributions}
     total_sims = sum(num_sims_criteria.values())
     reduce_sims = total_sims > num_sims
     listedCriteria = [d._criteria for d in betmode_distributions]
     criteria_weights = [d._quota for d in betmode_distributions]
-    random.seed(0)
     while sum(num_sims_criteria.values()) != num_sims:
-        c = random.choices(listedCriteria, criteria_weights)[0]
+        c = rng.choices(listedCriteria, criteria_weights)[0]
         if reduce_sims and num_sims_criteria[c] > 1:
             num_sims_criteria[c] -= 1
         elif not reduce_sims:
@@ -96,10 +243,10 @@ def get_sim_splits(gamestate: object, num_sims: int, betmode_name: str) -> Dict[
     return num_sims_criteria
 
 
-def assign_sim_criteria(num_sims_criteria: Dict[str, int], sims: int) -> Dict[int, str]:
+def assign_sim_criteria(num_sims_criteria: Dict[str, int], sims: int, rng: random.Random = random) -> Dict[int, str]:
     """Assign criteria randomly to simulations based on quota defined in config."""
     sim_allocation = [criteria for criteria, count in num_sims_criteria.items() for _ in range(count)]
-    random.shuffle(sim_allocation)
+    rng.shuffle(sim_allocation)
     return {i: sim_allocation[i] for i in range(min(sims, len(sim_allocation)))}
 
 
@@ -112,7 +259,7 @@ def string_to_int(s: str) -> int:
 async def profile_and_visualize(
     game_id,
     gamestate,
-    all_betmode_configs,
+    result_queue,
     betmode,
     sim_allocation,
     threads,
@@ -122,11 +269,13 @@ async def profile_and_visualize(
     compress,
     write_event_list,
     simulation_seeds,
+    sim_offset=0,
 ):
     """Create flame-graph, automatically opens output on localhost."""
     output_string = f"games/{game_id}/simulationProfile_{betmode}.prof"
     cProfile.runctx(
-        "gamestate.run_sims(all_betmode_configs, betmode, sim_allocation, threads, num_repeats, sims_per_thread, 0, repeat, compress, write_event_list, simulation_seeds)",
+        "gamestate.run_sims(result_queue, betmode, sim_allocation, threads, num_repeats, sims_per_thread, 0, repeat,"
+        " compress, write_event_list, simulation_seeds, sim_offset)",
         globals(),
         locals(),
         output_string,
@@ -134,26 +283,53 @@ async def profile_and_visualize(
     await asyncio.create_subprocess_exec("snakeviz", output_string)
 
 
-def run_multi_process_sims(
+def collect_thread_results(processes: list, result_queue: object) -> list:
+    """Gather results messages from worker processes as they arrive, until every process has reported or exited."""
+    messages = []
+    while len(messages) < len(processes):
+        try:
+            messages.append(result_queue.get(timeout=1.0))
+        except queue.Empty:
+            if any(process.is_alive() for process in processes):
+                continue
+            try:
+                while len(messages) < len(processes):
+                    messages.append(result_queue.get_nowait())
+            except queue.Empty:
+                break
+    return messages
+
+
+def plan_mode_sims(
     threads: int,
     batching_size: int,
-    game_id: str,
     betmode: str,
     gamestate: object,
-    num_sims: int = 1000000,
+    num_sims: int,
     compress: bool = True,
-    write_event_list: bool = False,
-    profiling: bool = False,
     set_sim_amount=False,
-):
-    """Setup multiprocessing manager for running all game-mode simulations."""
-    print("\nCreating books for", game_id, "in", betmode)
+    resume: bool = False,
+    sim_offset: int = 0,
+    num_sims_criteria: Dict[str, int] = None,
+) -> dict:
+    """
+    Assign criteria and seeds to all simulations of a betmode, and setup its checkpoint and results aggregation.
+    With config.bonus_bank_size set, bonus entries of the mode not banked yet are simulated here, before any chunk runs.
+    """
     num_repeats = max(int(round(num_sims / threads / batching_size, 0)), 1)
     sims_per_thread = int(num_sims / threads / num_repeats)
+    if gamestate.config.rng_mode == "mt":
+        # module random as before: reseeded for quota splits, fixed-amount modes continue from its current state
+        criteria_rng = random
+        if not set_sim_amount:
+            random.seed(0 if num_sims_criteria is None else sim_offset)
+    else:
+        criteria_rng = random.Random(0 if num_sims_criteria is None else sim_offset)
     if not set_sim_amount:
-        num_sims_criteria = get_sim_splits(gamestate, num_sims, betmode)
-        sim_criteria = assign_sim_criteria(num_sims_criteria, num_sims)
-        simulation_seeds = [i for i in range(len(sim_criteria))]
+        if num_sims_criteria is None:
+            num_sims_criteria = get_sim_splits(gamestate, num_sims, betmode, criteria_rng)
+        sim_criteria = assign_sim_criteria(num_sims_criteria, num_sims, criteria_rng)
+        simulation_seeds = [sim_offset + i for i in range(len(sim_criteria))]
         criteria_assignment = list(sim_criteria.values())
     else:
         for bm in gamestate.config.bet_modes:
@@ -185,9 +361,9 @@ def run_multi_process_sims(
                                 criteria_assignment.append(dist_criteria)
                                 counter += 1
                     while len(criteria_assignment) < num_sims:
-                        criteria_assignment.append(random.choices(quota_assignment, quota_probs, k=1)[0])
+                        criteria_assignment.append(criteria_rng.choices(quota_assignment, quota_probs, k=1)[0])
 
-                    random.shuffle(criteria_assignment)
+                    criteria_rng.shuffle(criteria_assignment)
                 break
 
         unique_criteria = set(criteria_assignment)
@@ -202,17 +378,198 @@ def run_multi_process_sims(
             criteria_counter[c] += 1
             simulation_seeds.append(offset_val)
 
+    if gamestate.bonus_bank is not None:
+        gamestate.bonus_bank.build(gamestate, betmode, num_sims)
+    return {
+        "betmode": betmode,
+        "num_sims": num_sims,
+        "num_repeats": num_repeats,
+        "sims_per_thread": sims_per_thread,
+        "criteria_assignment": criteria_assignment,
+        "simulation_seeds": simulation_seeds,
+        "sim_offset": sim_offset,
+        "aggregator": SimulationAggregator(betmode, threads, gamestate.get_betmode(betmode).get_cost()),
+        "checkpoint": CheckpointManifest(
+            gamestate.output_files,
+            betmode,
+            get_run_hash(
+                gamestate.config,
+                betmode,
+                threads,
+                num_repeats,
+                sims_per_thread,
+                compress,
+                criteria_assignment,
+                simulation_seeds,
+                sim_offset=sim_offset,
+                stats_only=gamestate.stats_only,
+            ),
+            compress,
+            resume=resume,
+            books=not gamestate.stats_only,
+        ),
+    }
+
+
+def check_chunk_error(message: dict, workers: list = ()) -> None:
+    """Stop remaining workers and fail fast when a chunk reports an error, such as an exceeded repeat budget."""
+    if "error" not in message:
+        return
+    for worker in workers:
+        if hasattr(worker, "terminate") and worker.is_alive():
+            worker.terminate()
+    raise RuntimeError(message["error"])
+
+
+def record_chunk_result(plan: dict, threads: int, message: dict) -> None:
+    """Mark a finished chunk in the mode checkpoint and merge its results."""
+    check_chunk_error(message)
+    start_sim = (
+        plan["sim_offset"]
+        + message["thread"] * plan["sims_per_thread"]
+        + (threads * plan["sims_per_thread"]) * message["repeat"]
+    )
+    plan["checkpoint"].record_chunk(message, start_sim, start_sim + plan["sims_per_thread"])
+    plan["aggregator"].merge(message)
+
+
+def make_chunk_process(
+    gamestate: object,
+    plan: dict,
+    threads: int,
+    thread: int,
+    repeat: int,
+    result_queue: object,
+    compress: bool,
+    write_event_list: bool,
+) -> Process:
+    """Worker process simulating one (thread, batch) chunk of a betmode."""
+    return Process(
+        target=gamestate.run_sims,
+        args=(
+            result_queue,
+            plan["betmode"],
+            plan["criteria_assignment"],
+            threads,
+            plan["num_repeats"],
+            plan["sims_per_thread"],
+            thread,
+            repeat,
+            compress,
+            write_event_list,
+            plan["simulation_seeds"],
+            plan["sim_offset"],
+        ),
+    )
+
+
+def make_thread_gamestate(gamestate: object) -> object:
+    """Independent gamestate and rng for a worker thread, sharing the read-only config and bonus bank."""
+    worker = type(gamestate)(gamestate.config)
+    worker.rng = make_rng(gamestate.config.rng_mode, gamestate.config.rng_seed, shared=False)
+    worker.betmode = gamestate.betmode
+    worker.stats_only = gamestate.stats_only
+    worker.bonus_bank = gamestate.bonus_bank
+    return worker
+
+
+def make_chunk_thread(
+    worker: object,
+    plan: dict,
+    threads: int,
+    thread: int,
+    repeat: int,
+    result_queue: object,
+    compress: bool,
+    write_event_list: bool,
+) -> threading.Thread:
+    """Worker thread simulating one (thread, batch) chunk of a betmode on its own gamestate."""
+    return threading.Thread(
+        target=worker.run_sims,
+        args=(
+            result_queue,
+            plan["betmode"],
+            plan["criteria_assignment"],
+            threads,
+            plan["num_repeats"],
+            plan["sims_per_thread"],
+            thread,
+            repeat,
+            compress,
+            write_event_list,
+            plan["simulation_seeds"],
+            plan["sim_offset"],
+        ),
+        daemon=True,
+    )
+
+
+def run_multi_process_sims(
+    threads: int,
+    batching_size: int,
+    game_id: str,
+    betmode: str,
+    gamestate: object,
+    num_sims: int = 1000000,
+    compress: bool = True,
+    write_event_list: bool = False,
+    profiling: bool = False,
+    set_sim_amount=False,
+    resume: bool = False,
+    max_retries: int = 2,
+    sim_offset: int = 0,
+    num_sims_criteria: Dict[str, int] = None,
+    backend: str = "process",
+) -> SimulationAggregator:
+    """
+    Setup worker processes (or threads) for running all game-mode simulations, returns the merged thread results.
+    The thread backend gives each thread its own gamestate and rng, sharing the read-only config.
+    """
+    print("\nCreating books for", game_id, "in", betmode)
+    plan = plan_mode_sims(
+        threads,
+        batching_size,
+        betmode,
+        gamestate,
+        num_sims,
+        compress=compress,
+        set_sim_amount=set_sim_amount,
+        resume=resume,
+        sim_offset=sim_offset,
+        num_sims_criteria=num_sims_criteria,
+    )
+    aggregator, checkpoint = plan["aggregator"], plan["checkpoint"]
+    num_repeats, sims_per_thread = plan["num_repeats"], plan["sims_per_thread"]
+    criteria_assignment, simulation_seeds = plan["criteria_assignment"], plan["simulation_seeds"]
+
+    def record_result(message):
+        record_chunk_result(plan, threads, message)
+
+    thread_gamestates = {}
+    if backend == "thread" and threads > 1 and not profiling:
+        if getattr(sys, "_is_gil_enabled", lambda: True)():
+            warn("Thread backend is running with the GIL enabled, simulations will not run in parallel.")
+        thread_gamestates = {thread: make_thread_gamestate(gamestate) for thread in range(threads)}
+
     for repeat in range(num_repeats):
         print("Batch", repeat + 1, "of", num_repeats)
-        processes = []
-        manager = Manager()
-        all_betmode_configs = manager.list()
+        pending = []
+        for thread in range(threads):
+            if resume and checkpoint.is_complete(thread, repeat):
+                aggregator.merge(checkpoint.load_message(thread, repeat))
+            else:
+                pending.append(thread)
+        if not pending:
+            print("Batch already complete in checkpoint, skipping.")
+            continue
+
         if profiling:
+            result_queue = queue.SimpleQueue()
             asyncio.run(
                 profile_and_visualize(
                     game_id=game_id,
                     gamestate=gamestate,
-                    all_betmode_configs=all_betmode_configs,
+                    result_queue=result_queue,
                     betmode=betmode,
                     sim_allocation=criteria_assignment,
                     threads=threads,
@@ -222,11 +579,14 @@ def run_multi_process_sims(
                     compress=compress,
                     write_event_list=write_event_list,
                     simulation_seeds=simulation_seeds,
+                    sim_offset=sim_offset,
                 )
             )
+            record_result(result_queue.get())
         elif threads == 1:
+            result_queue = queue.SimpleQueue()
             gamestate.run_sims(
-                betmode_copy_list=all_betmode_configs,
+                result_queue=result_queue,
                 betmode=betmode,
                 sim_to_criteria=criteria_assignment,
                 total_threads=threads,
@@ -237,32 +597,175 @@ def run_multi_process_sims(
                 compress=compress,
                 write_event_list=write_event_list,
                 simulation_seeds=simulation_seeds,
+                sim_offset=sim_offset,
             )
+            record_result(result_queue.get())
         else:
+            attempt = 0
+            while pending:
+                result_queue = queue.Queue() if thread_gamestates else Queue()
+                processes = []
+                for thread in pending:
+                    if thread_gamestates:
+                        process = make_chunk_thread(
+                            thread_gamestates[thread],
+                            plan,
+                            threads,
+                            thread,
+                            repeat,
+                            result_queue,
+                            compress,
+                            write_event_list,
+                        )
+                    else:
+                        process = make_chunk_process(
+                            gamestate, plan, threads, thread, repeat, result_queue, compress, write_event_list
+                        )
+                    print("Started thread", thread)
+                    process.start()
+                    processes += [process]
+                print("All threads are online.")
+                for message in collect_thread_results(processes, result_queue):
+                    check_chunk_error(message, processes)
+                    record_result(message)
+                    pending.remove(message["thread"])
+                for process in processes:
+                    process.join()
+                print("Finished joining threads.")
+                if not thread_gamestates:
+                    result_queue.close()
+
+                if pending:
+                    attempt += 1
+                    if attempt > max_retries:
+                        raise RuntimeError(
+                            f"Threads {pending} of batch {repeat + 1} in {betmode} failed after {max_retries} retries. "
+                            "Completed chunks are kept, rerun with resume=True to continue."
+                        )
+                    print(f"Threads {pending} of batch {repeat + 1} failed, retry {attempt} of {max_retries}.")
+
+    gamestate.combine(sorted(aggregator.force_keys), betmode)
+    gamestate.get_betmode(betmode).lock_force_keys()
+    return aggregator
+
+
+def finalise_mode(
+    threads: int, batching_size: int, game_id: str, plan: dict, gamestate: object, compress: bool
+) -> None:
+    """Merge temp files of a finished betmode into its final books, lookup tables and force files."""
+    output_lookup_and_force_files(
+        threads,
+        batching_size,
+        game_id,
+        plan["betmode"],
+        gamestate,
+        num_sims=plan["num_sims"],
+        compress=compress,
+        force_results=plan["aggregator"].force_results,
+    )
+
+
+def run_concurrent_mode_sims(
+    threads: int,
+    batching_size: int,
+    game_id: str,
+    gamestate: object,
+    mode_sims: Dict[str, tuple],
+    compress: bool = True,
+    write_event_list: bool = False,
+    resume: bool = False,
+    max_retries: int = 2,
+) -> Dict[str, SimulationAggregator]:
+    """
+    Run chunks of all betmodes {betmode: (num_sims, set_sim_amount)} through one set of worker slots.
+    Chunks are queued mode by mode, each mode is finalised in its own process as soon as its last chunk is merged,
+    overlapping with simulation of the remaining modes.
+    """
+    plans, remaining, tasks = {}, {}, []
+    for betmode, (num_sims, set_sim_amount) in mode_sims.items():
+        print("\nCreating books for", game_id, "in", betmode)
+        plan = plan_mode_sims(
+            threads,
+            batching_size,
+            betmode,
+            gamestate,
+            num_sims,
+            compress=compress,
+            set_sim_amount=set_sim_amount,
+            resume=resume,
+        )
+        plans[betmode] = plan
+        remaining[betmode] = set()
+        for repeat in range(plan["num_repeats"]):
             for thread in range(threads):
-                process = Process(
-                    target=gamestate.run_sims,
-                    args=(
-                        all_betmode_configs,
-                        betmode,
-                        criteria_assignment,
-                        threads,
-                        num_repeats,
-                        sims_per_thread,
-                        thread,
-                        repeat,
-                        compress,
-                        write_event_list,
-                        simulation_seeds,
-                    ),
-                )
-                print("Started thread", thread)
-                process.start()
-                processes += [process]
-            print("All threads are online.")
-            for process in processes:
+                if resume and plan["checkpoint"].is_complete(thread, repeat):
+                    plan["aggregator"].merge(plan["checkpoint"].load_message(thread, repeat))
+                else:
+                    remaining[betmode].add((thread, repeat))
+                    tasks.append((betmode, thread, repeat))
+
+    result_queue = Queue()
+    running, attempts = {}, {}
+    to_finalise = [betmode for betmode in plans if not remaining[betmode]]
+    finaliser, finalising = None, None
+
+    while tasks or running or to_finalise or finaliser is not None:
+        while tasks and len(running) < threads:
+            betmode, thread, repeat = tasks.pop(0)
+            process = make_chunk_process(
+                gamestate, plans[betmode], threads, thread, repeat, result_queue, compress, write_event_list
+            )
+            process.start()
+            running[(betmode, thread, repeat)] = process
+
+        if finaliser is None and to_finalise:
+            finalising = to_finalise.pop(0)
+            gamestate.combine(sorted(plans[finalising]["aggregator"].force_keys), finalising)
+            gamestate.get_betmode(finalising).lock_force_keys()
+            print(f"Finalising {finalising} while remaining modes simulate.")
+            finaliser = Process(
+                target=finalise_mode,
+                args=(threads, batching_size, game_id, plans[finalising], gamestate, compress),
+            )
+            finaliser.start()
+
+        try:
+            message = result_queue.get(timeout=0.5)
+            check_chunk_error(message, list(running.values()))
+            betmode, chunk = message["betmode"], (message["thread"], message["repeat"])
+            if chunk in remaining[betmode]:
+                record_chunk_result(plans[betmode], threads, message)
+                remaining[betmode].discard(chunk)
+                if not remaining[betmode]:
+                    to_finalise.append(betmode)
+            process = running.pop((betmode, *chunk), None)
+            if process is not None:
                 process.join()
-            print("Finished joining threads.")
-            gamestate.combine(all_betmode_configs, betmode)
-            gamestate.get_betmode(betmode).lock_force_keys()
-            manager.shutdown()
+        except queue.Empty:
+            pass
+
+        for key, process in list(running.items()):
+            if process.is_alive() or process.exitcode == 0:
+                continue
+            running.pop(key)
+            attempts[key] = attempts.get(key, 0) + 1
+            if attempts[key] > max_retries:
+                raise RuntimeError(
+                    f"Chunk (thread {key[1]}, batch {key[2] + 1}) of {key[0]} failed after {max_retries} retries. "
+                    "Completed chunks are kept, rerun with resume=True to continue."
+                )
+            print(
+                f"Chunk (thread {key[1]}, batch {key[2] + 1}) of {key[0]} failed,"
+                f" retry {attempts[key]} of {max_retries}."
+            )
+            tasks.insert(0, key)
+
+        if finaliser is not None and not finaliser.is_alive():
+            finaliser.join()
+            if finaliser.exitcode != 0:
+                raise RuntimeError(f"Finalising {finalising} failed with exit code {finaliser.exitcode}.")
+            plans[finalising]["aggregator"].print_rtp_summary()
+            finaliser, finalising = None, None
+
+    result_queue.close()
+    return {betmode: plan["aggregator"] for betmode, plan in plans.items()}
@@ -0,0 +1,55 @@
+"""Per-category simulation event counters, with opt-in rate-limited per-event lines and once-per-batch summaries."""
+
+from typing import Dict, Iterable
+
+
+class SimLogger:
+    """
+    Counts debug events by category instead of printing a line for each one.
+    Categories listed in verbose also print the event, at most max_lines per category per batch and only every
+    sample_every-th event.
+    """
+
+    def __init__(self, verbose: Iterable[str] = (), max_lines: int = 20, sample_every: int = 1, progress: bool = False):
+        self.verbose = set(verbose)
+        self.max_lines = max_lines
+        self.sample_every = max(1, int(sample_every))
+        self.progress = progress
+        self.counts = {}
+        self.printed = {}
+
+    def event(self, category: str, **fields) -> None:
+        """Count an event, the line is only formatted when it is printed."""
+        count = self.counts.get(category, 0) + 1
+        self.counts[category] = count
+        if category not in self.verbose or (count - 1) % self.sample_every != 0:
+            return
+        printed = self.printed.get(category, 0)
+        if printed >= self.max_lines:
+            return
+        self.printed[category] = printed + 1
+        print(f"[{category}] " + " ".join(f"{key}={val}" for key, val in fields.items()), flush=True)
+
+    def reset(self) -> None:
+        """Start counting a new batch."""
+        self.counts = {}
+        self.printed = {}
+
+    def print_batch_summary(self, label: str, num_sims: int) -> None:
+        """One line per batch with the event counts."""
+        events = ", ".join(f"{category}={count}" for category, count in sorted(self.counts.items()))
+        print(f"{label}: {num_sims} spins finished" + (f", events [{events}]" if events else ""), flush=True)
+
+
+def merge_log_counts(totals: Dict, counts: Dict) -> None:
+    """Add batch event counts into running totals."""
+    for category, count in counts.items():
+        totals[category] = totals.get(category, 0) + count
+
+
+def print_log_counts(betmode: str, counts: Dict) -> None:
+    """Print the event counts of a betmode across all batches."""
+    if not counts:
+        return
+    events = ", ".join(f"{category}={count}" for category, count in sorted(counts.items()))
+    print(f"    events: {events}", flush=True)
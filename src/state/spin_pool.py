@@ -0,0 +1,50 @@
+"""Containers reused across spin attempts instead of being reallocated on every repeat."""
+
+from typing import List
+
+
+class SpinPool:
+    """
+    Board, anticipation, win-data and Book containers owned by one gamestate and reset in place.
+    Anything which has to outlive the attempt must be detached (Book.detach) or copied before the next reset.
+    """
+
+    __slots__ = ("num_rows", "board", "anticipation", "win_data", "books")
+
+    def __init__(self, num_reels: int, num_rows: List[int]):
+        self.num_rows = list(num_rows)
+        self.board = [[None] * self.num_rows[reel] for reel in range(num_reels)]
+        self.anticipation = [0] * num_reels
+        self.win_data = {"totalWin": 0, "wins": []}
+        self.books = {}
+
+    def get_board(self) -> list:
+        """Board buffer with each reel back at its row count, cells are overwritten by the caller."""
+        for reel, row in enumerate(self.board):
+            num_rows = self.num_rows[reel]
+            if len(row) > num_rows:
+                del row[num_rows:]
+            elif len(row) < num_rows:
+                row.extend([None] * (num_rows - len(row)))
+        return self.board
+
+    def reset_anticipation(self) -> list:
+        anticipation = self.anticipation
+        for reel in range(len(anticipation)):
+            anticipation[reel] = 0
+        return anticipation
+
+    def reset_win_data(self) -> dict:
+        win_data = self.win_data
+        win_data["totalWin"] = 0
+        win_data["wins"].clear()
+        return win_data
+
+    def get_book(self, book_class: type, book_id: int, criteria: str) -> object:
+        """Reset and return the pooled book of a class, creating it on first use."""
+        book = self.books.get(book_class)
+        if book is None:
+            book = self.books[book_class] = book_class(book_id, criteria)
+        else:
+            book.reset(book_id, criteria)
+        return book
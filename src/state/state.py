@@ -1,13 +1,23 @@
-from copy import copy, deepcopy
+from copy import deepcopy
 from abc import ABC, abstractmethod
 from warnings import warn
-import random
+from time import perf_counter
 
 # from src.config.config import BetMode
 from src.wins.win_manager import WinManager
+from src.wins.fixed_point import to_units
 from src.calculations.symbol import SymbolStorage
 from src.config.output_filenames import OutputFiles
-from src.state.books import Book
+from src.state.books import Book, StatsBook
+from src.state.aggregation import make_results_message
+from src.state.rng import make_rng
+from src.state.sim_logging import SimLogger
+from src.state.spin_pool import SpinPool
+from src.state.bonus_bank import BonusBank
+from src.config.validation import should_validate
+from src.state.early_rejection import DEFAULT_REJECTION_PREDICATES, SpinRejected, new_rejection_stats
+from src.state.criteria_context import CriteriaContext, get_betmode_lookup, make_criteria_context
+from src.state.telemetry import RepeatBudgetExceeded, update_criteria_telemetry, get_budget_diagnostic
 from src.write_data.write_data import (
     print_recorded_wins,
     make_lookup_tables,
@@ -22,16 +32,34 @@ class GeneralGameState(ABC):
 
     def __init__(self, config):
         self.config = config
+        self.rng = make_rng(self.config.rng_mode, self.config.rng_seed)
         self.output_files = OutputFiles(self.config)
-        self.win_manager = WinManager(self.config.basegame_type, self.config.freegame_type, config.wincap)
+        self.betmode_lookup = get_betmode_lookup(self.config)
+        self.criteria_contexts = {}
+        self.criteria_context = None
+        self.win_scale = config.win_scale
+        self.wincap_win = config.wincap if self.win_scale is None else to_units(config.wincap, self.win_scale)
+        self.win_manager = WinManager(
+            self.config.basegame_type, self.config.freegame_type, config.wincap, self.win_scale
+        )
         self.library = {}
         self.recorded_events = {}
+        self.mode_force_keys = set()
+        self.criteria_wins = {}
+        self.rejection_predicates = list(DEFAULT_REJECTION_PREDICATES)
+        self.rejection_stats = new_rejection_stats()
+        self.attempt_steps = 0
+        self.criteria_telemetry = {}
+        self.sim_log = SimLogger(**self.config.sim_logging)
+        self.spin_pool = SpinPool(self.config.num_reels, self.config.num_rows)
+        self.bonus_bank = BonusBank(config.bonus_bank_size) if config.bonus_bank_size else None
         self.special_symbol_functions = {}
         self.temp_wins = []
         self.create_symbol_map()
         self.assign_special_sym_function()
         self.sim = 0
         self.criteria = ""
+        self.stats_only = False
         self.book = Book(self.sim, self.criteria)
         self.repeat = True
         self.repeat_count = 0
@@ -63,16 +91,16 @@ class GeneralGameState(ABC):
 
     def reset_book(self) -> None:
         """Reset global simulation variables."""
+        self.attempt_start_time = perf_counter()
         self.temp_wins = []
-        self.board = [[[] for _ in range(self.config.num_rows[x])] for x in range(self.config.num_reels)]
+        self.board = self.spin_pool.get_board()
         self.top_symbols = None
         self.bottom_symbols = None
         self.book_id = self.sim
-        self.book = Book(self.book_id, self.criteria)
-        self.win_data = {
-            "totalWin": 0,
-            "wins": [],
-        }
+        self.book = self.spin_pool.get_book(
+            StatsBook if getattr(self, "stats_only", False) else Book, self.book_id, self.criteria
+        )
+        self.win_data = self.spin_pool.reset_win_data()
         self.win_manager.reset_end_round_wins()
         self.global_multiplier = 1
         self.final_win = 0
@@ -82,16 +110,18 @@ class GeneralGameState(ABC):
         self.triggered_freegame = False
         self.gametype = self.config.basegame_type
         self.repeat = False
-        self.anticipation = [0] * self.config.num_reels
+        self.attempt_steps = 0
+        self.anticipation = self.spin_pool.reset_anticipation()
 
     def reset_seed(self, sim: int = 0, seed_override=None) -> None:
-        """Reset rng seed to simulation number for reproducibility."""
+        """Reset rng stream to simulation number for reproducibility."""
         if seed_override is not None:
-            random.seed(seed_override + 1)
+            self.rng.seed(seed_override + 1)
         else:
-            random.seed(sim + 1)
+            self.rng.seed(sim + 1)
         self.sim = sim
         self.repeat_count = 0
+        self.spin_start_time = perf_counter()
 
     def reset_fs_spin(self) -> None:
         """Use if using repeat during freespin games."""
@@ -105,31 +135,34 @@ class GeneralGameState(ABC):
 
     def get_betmode(self, mode_name) -> object:
         """Return all current betmode information."""
-        for betmode in self.config.bet_modes:
-            if betmode.get_name() == mode_name:
-                return betmode
-        print("\nWarning: betmode couldn't be retrieved\n")
+        betmode = self.betmode_lookup.get(mode_name)
+        if betmode is None:
+            print("\nWarning: betmode couldn't be retrieved\n")
+        return betmode
 
     def get_current_betmode(self) -> object:
         """Get current betmode information."""
-        for betmode in self.config.bet_modes:
-            if betmode.get_name() == self.betmode:
-                return betmode
+        return self.betmode_lookup.get(self.betmode)
+
+    def get_criteria_context(self) -> CriteriaContext:
+        """Bet mode, distribution and conditions of the current criteria, resolved once per (betmode, criteria)."""
+        context = self.criteria_context
+        if context is not None and context.criteria == self.criteria and context.betmode_name == self.betmode:
+            return context
+        context = self.criteria_contexts.get((self.betmode, self.criteria))
+        if context is None:
+            context = make_criteria_context(self.get_betmode(self.betmode), self.criteria)
+            self.criteria_contexts[(self.betmode, self.criteria)] = context
+        self.criteria_context = context
+        return context
 
     def get_current_betmode_distributions(self) -> object:
         """Return current betmode criteria information."""
-        dist = self.get_current_betmode().get_distributions()
-        for c in dist:
-            if c._criteria == self.criteria:
-                return c
-        raise RuntimeError("Could not locate criteria distribution.")
+        return self.get_criteria_context().distribution
 
     def get_current_distribution_conditions(self) -> dict:
         """Return requirements for criteria setup/acceptance."""
-        for d in self.get_betmode(self.betmode).get_distributions():
-            if d._criteria == self.criteria:
-                return d._conditions
-        return RuntimeError("Could not locate betmode conditions")
+        return self.get_criteria_context().conditions
 
     def check_current_repeat_count(self, warn_after_count: int = 1000):
         """Alert user to high repeat count."""
@@ -137,6 +170,14 @@ class GeneralGameState(ABC):
             warn(
                 f"\nHigh repeat count:\n Current Count: {self.repeat_count} \n Criteria: {self.criteria} \n Simulation: {self.sim}"
             )
+        budget = self.config.repeat_budget
+        if self.repeat and (
+            (budget["attempts"] is not None and self.repeat_count >= budget["attempts"])
+            or (budget["seconds"] is not None and perf_counter() - self.spin_start_time > budget["seconds"])
+        ):
+            raise RepeatBudgetExceeded(
+                get_budget_diagnostic(self, perf_counter() - self.spin_start_time, self.criteria_telemetry)
+            )
 
     def record(self, description: dict) -> None:
         """
@@ -151,31 +192,33 @@ class GeneralGameState(ABC):
         self.temp_wins.append(self.book_id)
 
     def check_force_keys(self, description) -> None:
-        """Check and append unique force-key parameters."""
-        current_mode_force_keys = self.get_current_betmode().get_force_keys()  # type:ignore
+        """
+        Check and append unique force-key parameters, these are returned to the parent process with the thread results.
+        """
         for keyValue in description:
-            if keyValue[0] not in current_mode_force_keys:
-                self.get_current_betmode().add_force_key(keyValue[0])  # type:ignore
-
-    def combine(self, modes, betmode_name) -> None:
-        """Retrieve unique force record keys."""
-        for modeConfig in modes:
-            for betmode in modeConfig:
-                if betmode.get_name() == betmode_name:
-                    break
-            force_keys = betmode.get_force_keys()  # type:ignore
-            for key in force_keys:
-                if key not in self.get_betmode(betmode_name).get_force_keys():  # type:ignore
-                    self.get_betmode(betmode_name).add_force_key(key)  # type:ignore
+            self.mode_force_keys.add(str(keyValue[0]))
+
+    def combine(self, force_keys, betmode_name) -> None:
+        """Add unique force record keys collected across all threads to the betmode."""
+        betmode = self.get_betmode(betmode_name)
+        for key in force_keys:
+            if key not in betmode.get_force_keys():  # type: ignore
+                betmode.add_force_key(key)  # type: ignore
+
+    def update_criteria_wins(self) -> None:
+        """Accumulate accepted simulation payouts for the active criteria."""
+        totals = self.criteria_wins.setdefault(self.criteria, [0, 0.0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += self.book.payout_multiplier
+        totals[2] += self.book.basegame_wins
+        totals[3] += self.book.freegame_wins
 
     def imprint_wins(self) -> None:
         """Record all events to library if criteria conditions are satisfied."""
         for temp_win_index in range(int(len(self.temp_wins) / 2)):
             description = tuple(sorted(self.temp_wins[2 * temp_win_index].items()))
             book_id = self.temp_wins[2 * temp_win_index + 1]
-            if description in self.recorded_events and (
-                book_id not in self.recorded_events[description]["bookIds"]
-            ):
+            if description in self.recorded_events and (book_id not in self.recorded_events[description]["bookIds"]):
                 self.recorded_events[description]["timesTriggered"] += 1
                 self.recorded_events[description]["bookIds"] += [book_id]
             elif description not in self.recorded_events:
@@ -185,11 +228,14 @@ class GeneralGameState(ABC):
                     "bookIds": [book_id],
                 }
         self.temp_wins = []
-        self.library[self.sim + 1] = copy(self.book.to_json())
+        self.library[self.sim + 1] = self.book.detach()
         self.win_manager.update_end_round_wins()
 
     def update_final_win(self) -> None:
         """Separate base and freegame wins, verify the sum of there are equal to the final simulation payout."""
+        if self.win_scale is not None:
+            self.update_final_win_units()
+            return
         final = round(min(self.win_manager.running_bet_win, self.config.wincap), 2)
         basewin = round(min(self.win_manager.basegame_wins, self.config.wincap), 2)
         freewin = round(min(self.win_manager.freegame_wins, self.config.wincap), 2)
@@ -199,12 +245,12 @@ class GeneralGameState(ABC):
         self.book.basegame_wins = basewin
         self.book.freegame_wins = freewin
 
+        if not should_validate(self.sim, self.config.validation):
+            return
         assert min(
             round(self.win_manager.basegame_wins + self.win_manager.freegame_wins, 2),
             self.config.wincap,
-        ) == round(
-            min(self.win_manager.running_bet_win, self.config.wincap), 2
-        ), "Base + Free game payout mismatch!"
+        ) == round(min(self.win_manager.running_bet_win, self.config.wincap), 2), "Base + Free game payout mismatch!"
         assert min(
             round(self.book.basegame_wins + self.book.freegame_wins, 2),
             self.config.wincap,
@@ -212,16 +258,59 @@ class GeneralGameState(ABC):
             round(self.book.payout_multiplier, 2), round(self.config.wincap, 2)
         ), "Base + Free game payout mismatch!"
 
+    def update_final_win_units(self) -> None:
+        """
+        Fixed-point version of update_final_win, integer wins are capped and checked exactly then converted to
+        multipliers once.
+        """
+        scale = self.win_scale
+        final = min(self.win_manager.running_bet_win, self.wincap_win)
+        basewin = min(self.win_manager.basegame_wins, self.wincap_win)
+        freewin = min(self.win_manager.freegame_wins, self.wincap_win)
+        if should_validate(self.sim, self.config.validation):
+            assert isinstance(final, int), f"non-integer win {final!r} in fixed-point mode"
+            assert min(basewin + freewin, self.wincap_win) == final, "Base + Free game payout mismatch!"
+
+        self.final_win = final / scale
+        self.book.payout_multiplier = self.final_win
+        self.book.basegame_wins = basewin / scale
+        self.book.freegame_wins = freewin / scale
+
     def check_repeat(self) -> None:
         """Checks if the spin failed a criteria constraint at any point."""
         if self.repeat is False:
-            win_criteria = self.get_current_betmode_distributions().get_win_criteria()
-            if win_criteria is not None and self.final_win != win_criteria:
+            context = self.get_criteria_context()
+            if context.win_criteria is not None and self.final_win != context.win_criteria:
                 self.repeat = True
 
-            if self.get_current_distribution_conditions()["force_freegame"] and not (self.triggered_freegame):
+            if context.conditions["force_freegame"] and not (self.triggered_freegame):
                 self.repeat = True
 
+        if self.config.early_rejection:
+            self.rejection_stats["completed"] += 1
+            self.rejection_stats["completed_steps"] += self.attempt_steps
+        self.repeat_count += 1
+        self.check_current_repeat_count()
+
+    def check_early_rejection(self, stage: str) -> None:
+        """
+        Called by the spin loop at reveal, tumble and freegame boundaries when config.early_rejection is set.
+        Raises SpinRejected if any of self.rejection_predicates shows the criteria can no longer be met.
+        """
+        if not self.config.early_rejection:
+            return
+        self.attempt_steps += 1
+        for predicate in self.rejection_predicates:
+            if predicate(self, stage):
+                raise SpinRejected(stage, predicate.__name__)
+
+    def reject_attempt(self, rejection: SpinRejected) -> None:
+        """Mark an aborted attempt for repeat, skipping the remainder of the spin."""
+        self.repeat = True
+        self.rejection_stats["rejected"] += 1
+        self.rejection_stats["rejected_steps"] += self.attempt_steps
+        stages = self.rejection_stats["stages"]
+        stages[rejection.stage] = stages.get(rejection.stage, 0) + 1
         self.repeat_count += 1
         self.check_current_repeat_count()
 
@@ -237,7 +326,7 @@ class GeneralGameState(ABC):
 
     def run_sims(
         self,
-        betmode_copy_list,
+        result_queue,
         betmode,
         sim_to_criteria,
         total_threads,
@@ -248,51 +337,70 @@ class GeneralGameState(ABC):
         compress=True,
         write_event_list=True,
         simulation_seeds=[],
+        sim_offset=0,
     ) -> None:
-        """Assigns criteria and runs individual simulations. Results are stored in temporary file to be combined when all threads are finished."""
+        """
+        Assigns criteria and runs individual simulations. Results are stored in temporary file to be combined when all
+        threads are finished.
+        A compact summary of force-keys, recorded events, criteria wins and telemetry is put on result_queue for the
+        parent process,
+        or an error message if a criteria exceeds config.repeat_budget.
+        sim_offset shifts book ids, used when appending to an existing library.
+        """
         mode_max_win = None
         for bm in self.config.bet_modes:
             if bm._name.lower() == betmode.lower():
                 mode_max_win = bm._wincap
         assert mode_max_win is not None
 
-        self.win_manager = WinManager(self.config.basegame_type, self.config.freegame_type, mode_max_win)
+        self.win_manager = WinManager(
+            self.config.basegame_type, self.config.freegame_type, mode_max_win, self.config.win_scale
+        )
         self.library = {}
         self.recorded_events = {}
+        self.mode_force_keys = set()
+        self.criteria_wins = {}
+        self.rejection_stats = new_rejection_stats()
+        self.criteria_telemetry = {}
+        self.sim_log.reset()
         self.betmode = betmode
         self.num_sims = num_sims
         start_sim = thread_index * num_sims + (total_threads * num_sims) * repeat_count
         end_sim = (thread_index + 1) * num_sims + (total_threads * num_sims) * repeat_count
         for sim in range(start_sim, end_sim):
             self.criteria = sim_to_criteria[sim]
-            self.run_spin(sim, simulation_seeds[sim])
-            local_idx = sim - start_sim + 1
-            if local_idx % max(1, num_sims // 5) == 0 or local_idx == num_sims:
-                print(
-                    f"[{betmode}] thread {thread_index} progress: {local_idx}/{num_sims} spins",
-                    flush=True,
+            self.get_criteria_context()
+            try:
+                self.run_spin(sim + sim_offset, simulation_seeds[sim])
+            except RepeatBudgetExceeded as err:
+                result_queue.put(
+                    {"betmode": betmode, "thread": thread_index, "repeat": repeat_count, "error": str(err)}
                 )
-        mode_cost = self.get_current_betmode().get_cost()
-
-        print(
-            "Thread " + str(thread_index),
-            "finished with",
-            round(self.win_manager.total_cumulative_wins / (num_sims * mode_cost), 3),
-            "RTP.",
-            f"[baseGame: {round(self.win_manager.cumulative_base_wins/(num_sims*mode_cost), 3)}, freeGame: {round(self.win_manager.cumulative_free_wins/(num_sims*mode_cost), 3)}]",
-            flush=True,
-        )
-
-        write_json(
-            self,
-            self.output_files.get_temp_multi_thread_name(
-                betmode, thread_index, repeat_count, (compress) * True + (not compress) * False
-            ),
-        )
+                return
+            update_criteria_telemetry(
+                self.criteria_telemetry,
+                self.criteria,
+                self.repeat_count,
+                perf_counter() - self.spin_start_time,
+                self.attempt_start_time - self.spin_start_time,
+            )
+            self.update_criteria_wins()
+            local_idx = sim - start_sim + 1
+            if self.sim_log.progress and local_idx % max(1, num_sims // 5) == 0 and local_idx != num_sims:
+                print(f"[{betmode}] thread {thread_index} progress: {local_idx}/{num_sims} spins", flush=True)
+        self.sim_log.print_batch_summary(f"[{betmode}] thread {thread_index} batch {repeat_count}", num_sims)
+
+        if not self.stats_only:
+            write_json(
+                self,
+                self.output_files.get_temp_multi_thread_name(
+                    betmode, thread_index, repeat_count, (compress) * True + (not compress) * False
+                ),
+            )
         print_recorded_wins(self, self.output_files.get_temp_force_name(betmode, thread_index, repeat_count))
         make_lookup_tables(self, self.output_files.get_temp_lookup_name(betmode, thread_index, repeat_count))
         make_lookup_pay_split(self, self.output_files.get_temp_segmented_name(betmode, thread_index, repeat_count))
 
-        if write_event_list:
+        if write_event_list and not self.stats_only:
             write_library_events(self, list(self.library.values()), betmode)
-        betmode_copy_list.append(self.config.bet_modes)
+        result_queue.put(make_results_message(self, betmode, thread_index, repeat_count))
@@ -0,0 +1,75 @@
+"""Per-criteria rejection-sampling telemetry and the repeat budget watchdog."""
+
+from typing import Dict
+
+
+class RepeatBudgetExceeded(RuntimeError):
+    """A criteria needed more attempts or time than config.repeat_budget allows for a single book."""
+
+
+def new_criteria_telemetry() -> Dict:
+    """Counters for one criteria, the histogram counts books by power-of-two bucket of attempts needed."""
+    return {"books": 0, "attempts": 0, "max_attempts": 0, "seconds": 0.0, "rejected_seconds": 0.0, "histogram": {}}
+
+
+def get_attempt_bucket(attempts: int) -> str:
+    """Lower bound of the power-of-two bucket, as a str so telemetry survives json checkpoints."""
+    return str(1 << (max(attempts, 1).bit_length() - 1))
+
+
+def update_criteria_telemetry(
+    telemetry: Dict, criteria: str, attempts: int, seconds: float, rejected_seconds: float
+) -> None:
+    """Add one accepted book to the criteria counters."""
+    stats = telemetry.setdefault(criteria, new_criteria_telemetry())
+    stats["books"] += 1
+    stats["attempts"] += attempts
+    stats["max_attempts"] = max(stats["max_attempts"], attempts)
+    stats["seconds"] += seconds
+    stats["rejected_seconds"] += rejected_seconds
+    bucket = get_attempt_bucket(attempts)
+    stats["histogram"][bucket] = stats["histogram"].get(bucket, 0) + 1
+
+
+def merge_criteria_telemetry(totals: Dict, telemetry: Dict) -> None:
+    """Add chunk telemetry into running totals."""
+    for criteria, stats in telemetry.items():
+        total = totals.setdefault(criteria, new_criteria_telemetry())
+        for key in ("books", "attempts", "seconds", "rejected_seconds"):
+            total[key] += stats[key]
+        total["max_attempts"] = max(total["max_attempts"], stats["max_attempts"])
+        for bucket, count in stats["histogram"].items():
+            total["histogram"][bucket] = total["histogram"].get(bucket, 0) + count
+
+
+def print_criteria_telemetry(betmode: str, telemetry: Dict) -> None:
+    """Print acceptance rate, time in rejected attempts and the repeat histogram of each criteria."""
+    for criteria, stats in telemetry.items():
+        books = max(stats["books"], 1)
+        histogram = ", ".join(
+            f"{bucket}+: {count}" for bucket, count in sorted(stats["histogram"].items(), key=lambda x: int(x[0]))
+        )
+        print(
+            f"    criteria {criteria} repeats: {round(stats['attempts'] / books, 2)} attempts/book"
+            f" (max {stats['max_attempts']}),",
+            f"{round(stats['rejected_seconds'], 2)}s of {round(stats['seconds'], 2)}s in rejected attempts,",
+            f"histogram [{histogram}]",
+            flush=True,
+        )
+
+
+def get_budget_diagnostic(gamestate: object, elapsed: float, telemetry: Dict) -> str:
+    """Explain which criteria blew the repeat budget and how it has behaved so far in this chunk."""
+    distribution = gamestate.get_current_betmode_distributions()
+    conditions = gamestate.get_current_distribution_conditions()
+    stats = telemetry.get(gamestate.criteria, new_criteria_telemetry())
+    forced = {key: val for key, val in conditions.items() if key.startswith("force_") and val}
+    return (
+        f"Repeat budget {gamestate.config.repeat_budget} exceeded in {gamestate.betmode},"
+        f" criteria {gamestate.criteria}, "
+        f"sim {gamestate.sim}: {gamestate.repeat_count} attempts in {round(elapsed, 2)}s. "
+        f"win_criteria={distribution.get_win_criteria()}, forced conditions={forced}. "
+        f"Previous books of this criteria in the chunk: {stats['books']}, "
+        f"{round(stats['attempts'] / max(stats['books'], 1), 2)} attempts/book. "
+        "Check the criteria is reachable with the current reels, multipliers and wincap."
+    )
@@ -0,0 +1,44 @@
+"""Fixed-point win accounting, wins held as integer units of 1/win_scale of the bet."""
+
+from typing import Union
+
+
+def to_units(multiplier: float, win_scale: int) -> int:
+    """Convert a bet multiplier to integer units, done once when config values are read."""
+    return int(round(multiplier * win_scale))
+
+
+def round_half_even_div(numerator: int, denominator: int) -> int:
+    """Exact integer division, rounding halves to the even result."""
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
+
+
+def units_to_cents(units: int, win_scale: int) -> int:
+    """Convert integer units to cents of the bet, exact when win_scale is a multiple of 100."""
+    return round_half_even_div(units * 100, win_scale)
+
+
+def units_to_multiplier(units: Union[int, float], win_scale: Union[int, None]) -> float:
+    """Bet multiplier of an accounting value, float wins are already multipliers."""
+    return units if win_scale is None else units / win_scale
+
+
+def get_scaled_paytable(config: object, win_scale: Union[int, None]) -> dict:
+    """
+    config.paytable in integer units, cached on the config. Payouts which are not a whole number of units are rejected.
+    """
+    if win_scale is None:
+        return config.paytable
+    cache = config.__dict__.setdefault("_scaled_paytables", {})
+    if win_scale not in cache:
+        scaled = {}
+        for key, payout in config.paytable.items():
+            scaled[key] = to_units(payout, win_scale)
+            assert (
+                abs(payout * win_scale - scaled[key]) < 1e-6
+            ), f"paytable value {payout} for {key} is not a multiple of 1/{win_scale}"
+        cache[win_scale] = scaled
+    return cache[win_scale]
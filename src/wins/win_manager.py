@@ -1,30 +1,37 @@
 """Payout wallet manager"""
 
+from src.wins.fixed_point import to_units
+
 
 class WinManager:
     """ "stores all simulation win info, at a cumulative and individual spin level"""
 
-    def __init__(self, base_game_mode: str, free_game_mode: str, mode_max_win: float):
-        """Initialize total simulation win values."""
+    def __init__(self, base_game_mode: str, free_game_mode: str, mode_max_win: float, win_scale: int = None):
+        """
+        Initialize total simulation win values.
+        With win_scale set, all wins are integers in units of 1/win_scale of the bet, otherwise float bet multipliers.
+        """
         self.base_game_mode = base_game_mode
         self.free_game_mode = free_game_mode
+        self.win_scale = win_scale
+        self.zero_win = 0.0 if win_scale is None else 0
 
         # Updates win amounts across all simulations
-        self.max_allowed_win = mode_max_win
+        self.max_allowed_win = mode_max_win if win_scale is None else to_units(mode_max_win, win_scale)
         self.total_cumulative_wins = 0
         self.cumulative_base_wins = 0
         self.cumulative_free_wins = 0
 
         # Base-game and free-game wins for a specific simulation
-        self.running_bet_win = 0.0
+        self.running_bet_win = self.zero_win
 
         # Controls wins for a specific simulation number
-        self.basegame_wins = 0.0
-        self.freegame_wins = 0.0
+        self.basegame_wins = self.zero_win
+        self.freegame_wins = self.zero_win
 
         # Controls wins for all actions within a 'reveal' event
-        self.spin_win = 0.0
-        self.tumble_win = 0.0
+        self.spin_win = self.zero_win
+        self.tumble_win = self.zero_win
 
     def update_spinwin(self, win_amount: float):
         """Update win-value associated with a given reveal."""
@@ -39,7 +46,7 @@ class WinManager:
 
     def reset_spin_win(self):
         """Reset wins for a given reveal."""
-        self.spin_win = 0.0
+        self.spin_win = self.zero_win
 
     def update_gametype_wins(self, gametype: str):
         """Assigns wins to a specific gametype."""
@@ -60,9 +67,9 @@ class WinManager:
 
     def reset_end_round_wins(self):
         """Reset wins at end of gameround/simulation."""
-        self.basegame_wins = 0.0
-        self.freegame_wins = 0.0
+        self.basegame_wins = self.zero_win
+        self.freegame_wins = self.zero_win
 
-        self.running_bet_win = 0.0
-        self.spin_win = 0.0
-        self.tumble_win = 0.0
+        self.running_bet_win = self.zero_win
+        self.spin_win = self.zero_win
+        self.tumble_win = self.zero_win
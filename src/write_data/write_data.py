@@ -7,18 +7,27 @@ import shutil
 import os
 import hashlib
 import json
-import ast
+import threading
 import zstandard as zstd
 
+from src.wins.fixed_point import round_half_even_div
 
-def quantize_payout_cents(multiplier: float) -> int:
+EVENT_LIST_LOCK = threading.Lock()
+
+
+def quantize_cents(cents: int) -> int:
     """
-    Snap a payout multiplier (x bet) to the nearest 0.10x expressed in cents.
+    Snap integer cents to the nearest 10 cents (0.10x), halves round to even.
     RGS requires lookup payouts to be multiples of 0.10x, i.e. payout % 10 == 0.
     """
-    raw_cents = multiplier * 100.0
-    snapped_cents = int(math.floor(raw_cents / 10.0 + 0.5)) * 10
-    return snapped_cents
+    return round_half_even_div(int(cents), 10) * 10
+
+
+def quantize_payout_cents(multiplier: float) -> int:
+    """
+    Snap a payout multiplier (x bet) to the nearest 0.10x expressed in cents, via whole cents so snapping is exact.
+    """
+    return quantize_cents(int(round(multiplier * 100.0)))
 
 
 def get_sha_256(file_to_hash: str):
@@ -91,8 +100,7 @@ def make_lookup_tables(gamestate: object, name: str):
     sims = list(gamestate.library.keys())
     sims.sort()
     for sim in sims:
-        multiplier = gamestate.library[sim]["payoutMultiplier"] / 100.0
-        payout_cents = quantize_payout_cents(multiplier)
+        payout_cents = quantize_cents(gamestate.library[sim]["payoutMultiplier"])
         gamestate.library[sim]["payoutMultiplier"] = payout_cents
         file.write(f"{gamestate.library[sim]['id']},1,{payout_cents}\n")
     file.close()
@@ -130,7 +138,7 @@ def write_library_events(gamestate: object, library: list, gametype: str):
                 dict_details = {key: instance[key] for key in item_keys if key != "index"}
                 event_items[lib_event] = dict_details
     json_object = json.dumps(event_items, indent=4)
-    with open(
+    with EVENT_LIST_LOCK, open(
         os.path.join(gamestate.output_files.config_path, f"event_config_{gametype}.json"),
         "w",
         encoding="UTF-8",
@@ -146,18 +154,23 @@ def output_lookup_and_force_files(
     gamestate: object,
     num_sims: int = 1000000,
     compress: bool = True,
+    force_results: dict = None,
 ):
-    """Combine temporary lookup tables and force files into a single output."""
-    print("Saving books for ", game_id, "in", betmode)
+    """
+    Combine temporary lookup tables and force files into a single output.
+    force_results are the recorded events already merged from thread results, if None the temporary force files are
+    read.
+    """
     num_repeats = max(int(round(num_sims / threads / batching_size, 0)), 1)
     file_list = []
     for repeat_index in range(num_repeats):
         for thread in range(threads):
-            file_list.append(
-                gamestate.output_files.get_temp_multi_thread_name(betmode, thread, repeat_index, compress)
-            )
+            file_list.append(gamestate.output_files.get_temp_multi_thread_name(betmode, thread, repeat_index, compress))
 
-    if compress:
+    if gamestate.stats_only:
+        print("Stats-only run, no books written for", game_id, "in", betmode)
+    elif compress:
+        print("Saving books for ", game_id, "in", betmode)
         temp_book_output_path = os.path.join(gamestate.output_files.book_path, "temp_book_output.json")
         with open(temp_book_output_path, "w", encoding="UTF-8") as outfile:
             for fname in file_list:
@@ -171,6 +184,7 @@ def output_lookup_and_force_files(
 
         os.remove(temp_book_output_path)
     else:
+        print("Saving books for ", game_id, "in", betmode)
         with open(
             gamestate.output_files.get_final_book_name(betmode, False),
             "w",
@@ -192,22 +206,21 @@ def output_lookup_and_force_files(
                             outfile.write("," + file_data[1::])  # dont write first '[', write last ']'
 
     print("Saving force files for", game_id, "in", betmode)
-    force_results_dict = {}
-    file_list = []
-    for repeat_index in range(num_repeats):
-        for thread in range(threads):
-            file_list.append(
-                gamestate.output_files.get_temp_force_name(betmode, thread, repeat_index),
-            )
-
-    for filename in file_list:
-        force_chunk = ast.literal_eval(json.load(open(filename, "r", encoding="UTF-8")))
-        for key in force_chunk:
-            if force_results_dict.get(key) is not None:
-                force_results_dict[key]["timesTriggered"] += force_chunk[key]["timesTriggered"]
-                force_results_dict[key]["bookIds"] += force_chunk[key]["bookIds"]
-            else:
-                force_results_dict[key] = force_chunk[key]
+    if force_results is not None:
+        force_results_dict = force_results
+    else:
+        force_results_dict = {}
+        for repeat_index in range(num_repeats):
+            for thread in range(threads):
+                force_chunk = read_recorded_wins(
+                    gamestate.output_files.get_temp_force_name(betmode, thread, repeat_index)
+                )
+                for key in force_chunk:
+                    if force_results_dict.get(key) is not None:
+                        force_results_dict[key]["timesTriggered"] += force_chunk[key]["timesTriggered"]
+                        force_results_dict[key]["bookIds"] += force_chunk[key]["bookIds"]
+                    else:
+                        force_results_dict[key] = force_chunk[key]
 
     force_results_dict_just_for_rob = []
     for force_combination in force_results_dict:
@@ -233,7 +246,7 @@ def output_lookup_and_force_files(
             data = json.load(file)
     except FileNotFoundError:
         data = {}
-    data[gamestate.get_current_betmode().get_name()] = forceResultKeys
+    data[betmode] = forceResultKeys
     json_object = json.dumps(data, indent=4)
     with open(json_file_path, "w", encoding="UTF-8") as file:
         file.write(json_object)
@@ -243,12 +256,8 @@ def output_lookup_and_force_files(
     print("Saving LUTs for", game_id, "in", betmode)
     for repeat_index in range(num_repeats):
         for thread in range(threads):
-            weights_plus_wins_file_list += [
-                gamestate.output_files.get_temp_lookup_name(betmode, thread, repeat_index)
-            ]
-            segmented_lut_file_list += [
-                gamestate.output_files.get_temp_segmented_name(betmode, thread, repeat_index)
-            ]
+            weights_plus_wins_file_list += [gamestate.output_files.get_temp_lookup_name(betmode, thread, repeat_index)]
+            segmented_lut_file_list += [gamestate.output_files.get_temp_segmented_name(betmode, thread, repeat_index)]
 
     with open(
         gamestate.output_files.get_final_lookup_name(betmode),
@@ -275,12 +284,139 @@ def output_lookup_and_force_files(
                 outfile.write(infile.read())
 
 
+def get_max_book_id(lookup_name: str) -> int:
+    """Largest book id in an existing lookup table, -1 if the table is missing or empty."""
+    max_id = -1
+    if not os.path.isfile(lookup_name):
+        return max_id
+    with open(lookup_name, "r", encoding="UTF-8") as f:
+        for line in f:
+            if line.strip():
+                max_id = max(max_id, int(line.split(",", 1)[0]))
+    return max_id
+
+
+def append_lookup_and_force_files(
+    threads: int,
+    batching_size: int,
+    game_id: str,
+    betmode: str,
+    gamestate: object,
+    num_sims: int,
+    compress: bool = True,
+    force_results: dict = None,
+):
+    """
+    Merge temporary files from an appended simulation run into existing mode outputs.
+    Books and lookup tables are appended to in place, compressed books gain additional zstd frames.
+    """
+    num_repeats = max(int(round(num_sims / threads / batching_size, 0)), 1)
+    chunks = [(thread, repeat_index) for repeat_index in range(num_repeats) for thread in range(threads)]
+
+    final_book = gamestate.output_files.get_final_book_name(betmode, compress)
+    temp_books = [gamestate.output_files.get_temp_multi_thread_name(betmode, t, r, compress) for t, r in chunks]
+    if gamestate.stats_only:
+        print("Stats-only run, no books appended for", game_id, "in", betmode)
+    elif compress or final_book.endswith(".jsonl"):
+        print("Appending books for", game_id, "in", betmode)
+        with open(final_book, "ab") as outfile:
+            for fname in temp_books:
+                with open(fname, "rb") as infile:
+                    shutil.copyfileobj(infile, outfile)
+    else:
+        print("Appending books for", game_id, "in", betmode)
+        with open(final_book, "rb+") as outfile:
+            outfile.seek(0, os.SEEK_END)
+            position = outfile.tell()
+            while position > 0:
+                outfile.seek(position - 1)
+                if outfile.read(1) not in b" \n\r\t":
+                    break
+                position -= 1
+            outfile.seek(position - 1)  # overwrite closing ']'
+            outfile.truncate()
+            outfile.seek(position - 2)
+            separator = b"" if outfile.read(1) == b"[" else b","
+            for fname in temp_books:
+                with open(fname, "rb") as infile:
+                    body = infile.read().strip()[1:-1]
+                if body:
+                    outfile.write(separator + body)
+                    separator = b","
+            outfile.write(b"]")
+
+    print("Appending force files for", game_id, "in", betmode)
+    if force_results is None:
+        force_results = {}
+        for thread, repeat_index in chunks:
+            for key, val in read_recorded_wins(
+                gamestate.output_files.get_temp_force_name(betmode, thread, repeat_index)
+            ).items():
+                if key in force_results:
+                    force_results[key]["timesTriggered"] += val["timesTriggered"]
+                    force_results[key]["bookIds"] += val["bookIds"]
+                else:
+                    force_results[key] = val
+
+    force_record_path = os.path.join(gamestate.output_files.force_path, f"force_record_{betmode}.json")
+    existing_records = []
+    if os.path.isfile(force_record_path):
+        with open(force_record_path, "r", encoding="UTF-8") as file:
+            existing_records = json.load(file)
+    record_index = {
+        tuple((item["name"], item["value"]) for item in record["search"]): record for record in existing_records
+    }
+    for force_combination, details in force_results.items():
+        search_key = tuple((str(key), str(val)) for key, val in force_combination)
+        if search_key in record_index:
+            record_index[search_key]["timesTriggered"] += details["timesTriggered"]
+            record_index[search_key]["bookIds"] += details["bookIds"]
+        else:
+            record = {
+                "search": [{"name": key, "value": val} for key, val in search_key],
+                "timesTriggered": details["timesTriggered"],
+                "bookIds": list(details["bookIds"]),
+            }
+            existing_records.append(record)
+            record_index[search_key] = record
+    with open(force_record_path, "w", encoding="UTF-8") as file:
+        file.write(json.dumps(existing_records, indent=4))
+
+    json_file_path = os.path.join(gamestate.output_files.force_path, "force.json")
+    try:
+        with open(json_file_path, "r", encoding="UTF-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        data = {}
+    mode_options = data.setdefault(betmode, {})
+    for key, values in get_force_options(force_results).items():
+        options = mode_options.setdefault(key, [])
+        options += [val for val in values if val not in options]
+    with open(json_file_path, "w", encoding="UTF-8") as file:
+        file.write(json.dumps(data, indent=4))
+
+    print("Appending LUTs for", game_id, "in", betmode)
+    lookup_targets = [
+        (gamestate.output_files.get_final_lookup_name(betmode), gamestate.output_files.get_temp_lookup_name),
+        (gamestate.output_files.get_final_segmented_name(betmode), gamestate.output_files.get_temp_segmented_name),
+    ]
+    if os.path.exists(gamestate.output_files.get_optimized_lookup_name(betmode)):
+        warn(f"Appended books to {betmode} with weight 1 in optimized lookup table, rerun optimization for this mode.")
+        lookup_targets.append(
+            (gamestate.output_files.get_optimized_lookup_name(betmode), gamestate.output_files.get_temp_lookup_name)
+        )
+    for final_name, temp_name_fn in lookup_targets:
+        with open(final_name, "a", encoding="UTF-8") as outfile:
+            for thread, repeat_index in chunks:
+                with open(temp_name_fn(betmode, thread, repeat_index), "r", encoding="UTF-8") as infile:
+                    outfile.write(infile.read())
+
+
 def write_json(gamestate, filename: str):
     """Convert the list of dictionaries to a JSON-encoded string and compress it in chunks."""
     json_objects = []
     for item in gamestate.library.values():
-        payout_multiplier = item["payoutMultiplier"] / 100.0
-        item["payoutMultiplier"] = quantize_payout_cents(payout_multiplier)
+        item["payoutMultiplier"] = quantize_cents(item["payoutMultiplier"])
         json_objects.append(json.dumps(item))
     combined_data = "\n".join(json_objects) + "\n"
 
@@ -300,7 +436,27 @@ def write_json(gamestate, filename: str):
 
 def print_recorded_wins(gamestate: object, name: str = ""):
     """Temporary file generation for wins/recorded results."""
-    json_object = json.dumps(str(gamestate.recorded_events), indent=4)
-    file = open(name, "w", encoding="UTF-8")
-    file.write(json_object)
-    file.close()
+    recorded = []
+    for description, details in gamestate.recorded_events.items():
+        recorded.append(
+            {
+                "search": [list(item) for item in description],
+                "timesTriggered": details["timesTriggered"],
+                "bookIds": details["bookIds"],
+            }
+        )
+    with open(name, "w", encoding="UTF-8") as file:
+        json.dump(recorded, file)
+
+
+def read_recorded_wins(name: str) -> dict:
+    """Load a temporary force file into {description: {"timesTriggered": int, "bookIds": list}}."""
+    with open(name, "r", encoding="UTF-8") as file:
+        recorded = json.load(file)
+    return {
+        tuple(tuple(item) for item in entry["search"]): {
+            "timesTriggered": entry["timesTriggered"],
+            "bookIds": entry["bookIds"],
+        }
+        for entry in recorded
+    }
@@ -10,6 +10,7 @@ if str(GAME_DIR) not in sys.path:
     sys.path.insert(0, str(GAME_DIR))
 
 buy_templates = import_module("games.0_0_scatter.buy_templates")
+BuyTemplateBank = import_module("games.0_0_scatter.buy_template_bank").BuyTemplateBank
 REGULAR_BUY_REVEAL_TEMPLATES = buy_templates.REGULAR_BUY_REVEAL_TEMPLATES
 SUPER_BUY_REVEAL_TEMPLATES = buy_templates.SUPER_BUY_REVEAL_TEMPLATES
 
@@ -22,6 +23,8 @@ GameState = gamestate_module.GameState
 events_module = import_module("src.events.events")
 
 from src.calculations.scatter import Scatter
+from src.state.bonus_bank import BonusBank
+from src.wins.win_manager import WinManager
 from src.write_data.write_data import quantize_payout_cents
 
 
@@ -105,6 +108,33 @@ def test_retrigger_counts_regular_scatters_only(gamestate):
     assert gamestate.grant_bonus_retrigger_if_needed() is False
 
 
+def test_set_board_symbol_keeps_special_index_in_sync(gamestate):
+    gamestate.gametype = gamestate.config.basegame_type
+    gamestate.refresh_special_syms()
+    gamestate.board = [
+        [gamestate.create_symbol("L1") for _ in range(gamestate.config.num_rows[reel_idx])]
+        for reel_idx in range(gamestate.config.num_reels)
+    ]
+
+    gamestate.set_board_symbol(2, 1, gamestate.create_symbol("S"))
+    gamestate.set_board_symbol(0, 3, gamestate.create_symbol("S"))
+    gamestate.set_board_symbol(1, 0, gamestate.create_symbol("M"))
+    gamestate.set_board_symbol(2, 1, gamestate.create_symbol("BS"))
+    indexed = {key: list(positions) for key, positions in gamestate.special_syms_on_board.items()}
+    gamestate.get_special_symbols_on_board()
+    assert indexed == gamestate.special_syms_on_board
+    assert indexed["scatter"] == [(0, 3)]
+    assert indexed["super_scatter"] == [(2, 1)]
+
+    gamestate.board[1][0] = gamestate.create_symbol("L1")
+    gamestate.board[1][2] = gamestate.create_symbol("S")
+    gamestate.reindex_reel(1)
+    indexed = {key: list(positions) for key, positions in gamestate.special_syms_on_board.items()}
+    gamestate.get_special_symbols_on_board()
+    assert indexed == gamestate.special_syms_on_board
+    assert indexed["scatter"] == [(0, 3), (1, 2)]
+
+
 def _assert_template_properties(config, template, expected_scatter_count, expected_bs_count):
     gamestate = GameState(config)
     scatter_total = 0
@@ -146,6 +176,192 @@ def test_super_buy_templates_are_safe(game_config):
         _assert_template_properties(game_config, template, expected_scatter_count=3, expected_bs_count=1)
 
 
+def test_buy_template_bank_rejects_invalid_templates(gamestate):
+    with pytest.raises(ValueError, match="scatters"):
+        BuyTemplateBank(gamestate, {"regular_buy": SUPER_BUY_REVEAL_TEMPLATES})
+
+    winning = [["H1"] * gamestate.config.num_rows[reel] for reel in range(gamestate.config.num_reels)]
+    with pytest.raises(ValueError, match="payout"):
+        BuyTemplateBank(gamestate, {"bonus_hunt": [winning]})
+
+
+def test_buy_template_bank_prebuilds_reveal(gamestate):
+    bank = gamestate.buy_template_bank
+    template = bank.templates["super_buy"][0]
+    assert [[bank.symbol_names[code] for code in reel] for reel in template.board] == SUPER_BUY_REVEAL_TEMPLATES[0]
+    board = bank.get_board(template)
+    assert [[symbol.name for symbol in reel] for reel in board] == SUPER_BUY_REVEAL_TEMPLATES[0]
+    assert board[0] is not bank.get_board(template)[0]
+
+    gamestate.board = board
+    gamestate.get_special_symbols_on_board()
+    assert gamestate.special_syms_on_board == template.get_special_symbols()
+    assert [[symbol["name"] for symbol in reel] for reel in template.reveal_board] == SUPER_BUY_REVEAL_TEMPLATES[0]
+
+
+def test_buy_entry_reveal_shows_template_with_drawn_stops(monkeypatch, gamestate):
+    monkeypatch.setattr(GameState, "draw_board", lambda *_, **__: pytest.fail("buy entry must not draw a board"))
+    monkeypatch.setattr(GameState, "run_freespin_from_base", lambda self: None)
+    gamestate.betmode = "regular_buy"
+    gamestate.criteria = "freegame"
+    gamestate.reset_seed(5)
+    gamestate._run_buy_entry_spin("regular_buy")
+
+    template = next(
+        t
+        for t in gamestate.buy_template_bank.templates["regular_buy"]
+        if gamestate.buy_template_bank.get_board(t) == gamestate.board
+    )
+    reveal = gamestate.library[gamestate.sim + 1]["events"][0]
+    strips = gamestate.config.reels[gamestate.reelstrip_id]
+    for reel, column in enumerate(reveal["board"]):
+        stop = reveal["paddingPositions"][reel]
+        assert column[1:-1] == template.reveal_board[reel]
+        assert column[0]["name"] == strips[reel][(stop - 1) % len(strips[reel])]
+        assert column[-1]["name"] == strips[reel][(stop + len(template.board[reel])) % len(strips[reel])]
+    assert reveal["anticipation"] == template.anticipation
+
+
+def test_template_anticipation_matches_drawn_board(gamestate):
+    config = gamestate.config
+    trigger = config.anticipation_triggers[config.basegame_type]
+    positions = [(0, 1), (2, 0), (3, 4), (5, 2)]
+    anticipation = BuyTemplateBank.get_anticipation(config, positions)
+    first = positions[trigger - 1][0] + 1
+    assert anticipation == [0] * first + list(range(1, config.num_reels - first + 1))
+    assert BuyTemplateBank.get_anticipation(config, positions[: trigger - 1]) == [0] * config.num_reels
+
+
+def make_bank_gamestate(betmode: str, size: int = 1):
+    config = GameConfig()
+    config.bonus_bank_size = size
+    gamestate = GameState(config)
+    gamestate.bonus_bank.build(gamestate, betmode)
+    gamestate.criteria = "freegame"
+    return gamestate
+
+
+def play_banked_bonus(betmode: str, bonus_type: str, sim: int) -> list:
+    """Events of a bonus played from a fresh book without a bonus bank, as the bank simulates it."""
+    gamestate = GameState(GameConfig())
+    gamestate.betmode = betmode
+    gamestate.criteria = "freegame"
+    gamestate.win_manager = make_win_manager(gamestate)
+    gamestate.reset_seed(sim)
+    gamestate.reset_book()
+    gamestate.start_banked_bonus(bonus_type, 10)
+    gamestate.run_freespin()
+    return gamestate.book.events
+
+
+def make_win_manager(gamestate):
+    config = gamestate.config
+    return WinManager(config.basegame_type, config.freegame_type, config.wincap, config.win_scale)
+
+
+def strip_index(events: list) -> list:
+    return [{k: v for k, v in event.items() if k != "index"} for event in events]
+
+
+def test_bonus_bank_splices_banked_bonus():
+    gamestate = make_bank_gamestate("regular_buy")
+    key = gamestate.bonus_bank.get_key(gamestate, "freegame", 10)
+    (outcome,) = gamestate.bonus_bank.store[key]
+    gamestate.run_spin(2)
+    spliced = gamestate.library[3]
+    assert spliced["payoutMultiplier"] == round(outcome.running_win * 100)
+    # The book reveals a buy template and triggers, the bonus after the trigger is the banked one.
+    assert [event["type"] for event in spliced["events"][:2]] == ["reveal", "freeSpinTrigger"]
+    assert strip_index(spliced["events"][2:-1]) == strip_index(outcome.events)
+    assert [event["index"] for event in spliced["events"]] == list(range(len(spliced["events"])))
+    assert outcome.events == play_banked_bonus("regular_buy", "freegame", BonusBank.get_key_sim(key))
+    assert gamestate.sim_log.counts["BonusBankSplice"] == 1
+
+
+def test_bonus_bank_shares_entries_across_modes_with_the_same_freegame():
+    gamestate = make_bank_gamestate("regular_buy", size=2)
+    bank = gamestate.bonus_bank
+    regular_keys = set(bank.store)
+    assert {key[:2] for key in regular_keys} == {("freegame", 10), ("super", 10)}
+
+    # base and bonus_hunt criteria enter the same freegame as regular_buy, nothing new is simulated
+    bank.build(gamestate, "base")
+    bank.build(gamestate, "bonus_hunt")
+    assert set(bank.store) == regular_keys
+    gamestate.betmode, gamestate.criteria = "base", "0"
+    assert bank.get_key(gamestate, "freegame", 10) in regular_keys
+
+    # super_buy plays SUPER freegame reels, its entries are banked separately
+    bank.build(gamestate, "super_buy")
+    assert len(bank.store) == 4
+    gamestate.betmode, gamestate.criteria = "super_buy", "freegame"
+    assert bank.get_key(gamestate, "super", 10) not in regular_keys
+
+
+def test_bonus_bank_key_follows_freegame_conditions(game_config):
+    conditions = game_config.bet_modes[2].get_distributions()[0]._conditions
+    key = BonusBank.get_freegame_conditions(game_config, conditions)
+    entry_only = dict(conditions, scatter_triggers={4: 1}, force_freegame=False)
+    assert BonusBank.get_freegame_conditions(game_config, entry_only) == key
+    base_reels = dict(conditions, reel_weights={**conditions["reel_weights"], game_config.basegame_type: {"REG": 1}})
+    assert BonusBank.get_freegame_conditions(game_config, base_reels) == key
+    mult_values = {game_config.basegame_type: {2: 1}, game_config.freegame_type: {3: 1}}
+    assert BonusBank.get_freegame_conditions(game_config, dict(conditions, mult_values=mult_values)) != key
+    assert BonusBank.get_freegame_conditions(game_config, dict(conditions, force_wincap=True)) != key
+
+
+def test_bonus_bank_warns_when_books_outnumber_outcomes():
+    config = GameConfig()
+    config.bonus_bank_size = 1
+    gamestate = GameState(config)
+    with pytest.warns(UserWarning, match="banked outcomes per bonus entry"):
+        gamestate.bonus_bank.build(gamestate, "regular_buy", num_sims=10)
+
+
+def test_bonus_bank_outcomes_share_nothing_with_books():
+    gamestate = make_bank_gamestate("regular_buy")
+    (outcome,) = gamestate.bonus_bank.store[gamestate.bonus_bank.get_key(gamestate, "freegame", 10)]
+    banked = [event for event in outcome.events if isinstance(event.get("board"), list)]
+    assert banked
+    snapshot = [dict(event, board=[list(reel) for reel in event["board"]]) for event in banked]
+    gamestate.run_spin(2)
+    for event in gamestate.library[3]["events"]:
+        if isinstance(event.get("board"), list):
+            event["board"][0].clear()
+    assert [dict(event, board=[list(reel) for reel in event["board"]]) for event in banked] == snapshot
+
+
+def test_bonus_bank_plays_live_unless_an_outcome_meets_win_criteria(monkeypatch):
+    gamestate = make_bank_gamestate("regular_buy", size=2)
+    context = gamestate.get_criteria_context()
+    monkeypatch.setattr(context, "win_criteria", 123456.0)
+    gamestate.run_spin(5)
+    assert gamestate.sim_log.counts["BonusBankLive"] == 1
+    assert "BonusBankSplice" not in gamestate.sim_log.counts
+    live = GameState(GameConfig())
+    live.betmode, live.criteria = "regular_buy", "freegame"
+    live.run_spin(5)
+    assert gamestate.library[6]["events"] == live.library[6]["events"]
+
+    outcome = gamestate.bonus_bank.store[gamestate.bonus_bank.get_key(gamestate, "freegame", 10)][1]
+    monkeypatch.setattr(context, "win_criteria", gamestate.bonus_bank.get_final_win(gamestate, outcome.running_win))
+    gamestate.run_spin(6)
+    assert gamestate.sim_log.counts["BonusBankSplice"] == 1
+    assert gamestate.final_win == context.win_criteria
+
+
+def test_bonus_bank_replays_wincap_outcomes_from_rng_state():
+    gamestate = make_bank_gamestate("regular_buy")
+    (outcome,) = gamestate.bonus_bank.store[gamestate.bonus_bank.get_key(gamestate, "freegame", 10)]
+    # an outcome which reaches the wincap is replayed rather than spliced
+    outcome.wincap_triggered = True
+    gamestate.run_spin(7)
+    assert gamestate.sim_log.counts["BonusBankReplay"] == 1
+    replayed = strip_index(gamestate.library[8]["events"][2:])
+    assert replayed[-1]["type"] == "finalWin"
+    assert replayed[:-1] == strip_index(outcome.events)
+
+
 def test_regular_buy_flow_uses_templates(monkeypatch, gamestate):
     triggered = {"regular": False}
 
@@ -153,8 +369,7 @@ def test_regular_buy_flow_uses_templates(monkeypatch, gamestate):
         triggered["regular"] = True
 
     monkeypatch.setattr(GameState, "run_freespin_from_base", fake_run_freespin)
-    monkeypatch.setattr(GameState, "draw_board", lambda self, *_, **__: None)
-    monkeypatch.setattr(gamestate_module, "reveal_event", lambda *_: None)
+    monkeypatch.setattr(gamestate_module, "reveal_event", lambda *_, **__: None)
     monkeypatch.setattr(
         GameState,
         "get_current_distribution_conditions",
@@ -173,8 +388,7 @@ def test_super_buy_flow_uses_templates(monkeypatch, gamestate):
         triggered["super"] = True
 
     monkeypatch.setattr(GameState, "run_super_bonus_from_base", fake_run_super)
-    monkeypatch.setattr(GameState, "draw_board", lambda self, *_, **__: None)
-    monkeypatch.setattr(gamestate_module, "reveal_event", lambda *_: None)
+    monkeypatch.setattr(gamestate_module, "reveal_event", lambda *_, **__: None)
     monkeypatch.setattr(
         GameState,
         "get_current_distribution_conditions",
@@ -184,4 +398,3 @@ def test_super_buy_flow_uses_templates(monkeypatch, gamestate):
     gamestate.criteria = "freegame"
     gamestate._run_buy_entry_spin("super_buy")
     assert triggered["super"] is True
-
@@ -0,0 +1,56 @@
+"""Monte Carlo service determinism and adaptive forcing counts of the sample scatter game."""
+
+import sys
+from importlib import import_module
+from pathlib import Path
+
+GAME_DIR = Path(__file__).resolve().parents[2] / "games" / "0_0_scatter"
+if str(GAME_DIR) not in sys.path:
+    sys.path.insert(0, str(GAME_DIR))
+
+sim_utils = import_module("sim_utils")
+
+
+def run_service(processes: int) -> dict:
+    with sim_utils.MonteCarloService(processes=processes, spin_chunk=50, seed=7, sync_lag=2) as service:
+        return service.run_spins(200, "base")
+
+
+def test_run_spins_does_not_depend_on_process_count():
+    two, three = run_service(2), run_service(3)
+    assert two["num_spins"] == 200
+    assert two == three
+
+
+def test_adaptive_forcing_shared_sync_counts():
+    shared = sim_utils.mp.Array("q", [10, 1, 0])
+    first = sim_utils.AdaptiveForcingController(shared=shared, sync_every=3)
+    second = sim_utils.AdaptiveForcingController(shared=shared, sync_every=3)
+    first.record("regular")
+    first.record(None)
+    second.record("super")
+    assert first.get_forced_context() == {"total_spins": 13, "actual_regular_count": 2, "actual_super_count": 0}
+    assert shared[:] == [10, 1, 0]
+
+    # the third spin reaches sync_every, pending counts move into the shared counters
+    first.record(None)
+    assert shared[:] == [13, 2, 0]
+    assert first.pending == [0, 0, 0]
+    second.sync()
+    assert shared[:] == [14, 2, 1]
+    assert second.get_forced_context() == {"total_spins": 15, "actual_regular_count": 2, "actual_super_count": 1}
+    # first only sees second's spin after its own next sync
+    assert first.get_forced_context()["actual_super_count"] == 0
+    first.sync()
+    assert first.get_forced_context() == second.get_forced_context()
+
+
+def test_adaptive_forcing_local_counts():
+    results = [
+        {"num_spins": 50, "actual_regular_triggers": 2, "actual_super_triggers": 0},
+        {"num_spins": 30, "actual_regular_triggers": 1, "actual_super_triggers": 1},
+    ]
+    controller = sim_utils.AdaptiveForcingController(base=sim_utils._forcing_totals(results), sync_every=1)
+    controller.record("super")
+    controller.sync()
+    assert controller.get_forced_context() == {"total_spins": 82, "actual_regular_count": 3, "actual_super_count": 2}
@@ -0,0 +1,67 @@
+"""Deterministic reel layouts and the annealing reel designer of the sample scatter game."""
+
+import hashlib
+import random
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "games" / "0_0_scatter" / "scripts"
+for path in (SCRIPTS_DIR.parent, SCRIPTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+build_reels = import_module("build_reels")
+design_reels = import_module("design_reels")
+
+# sha256 of the csv rows written by build_reels.py before build_columns was split out of build_mode
+LAYOUT_HASHES = {
+    "BASE": "61b7d3fdae2347dc02b9aeb907f285ed1e8e4067e45c0daec7dc00ebf3580c0b",
+    "REG": "b50add43ad1c97747b22003bffd36a972d4ed077e21cf88bfe0f8bafeae62b46",
+    "SUPER": "768d485609b4757c514ea2a395a741141512a8c4066d3f67f96cfaf94849cb71",
+}
+
+
+def test_build_columns_matches_previous_layouts():
+    for mode_name, config in build_reels.MODES.items():
+        columns = build_reels.build_columns(mode_name, config)
+        rows = "\n".join(",".join(column[row] for column in columns) for row in range(len(columns[0])))
+        assert hashlib.sha256(rows.encode()).hexdigest() == LAYOUT_HASHES[mode_name], mode_name
+
+
+def test_build_reels_dry_run_does_not_write(monkeypatch, capsys):
+    written = []
+    monkeypatch.setattr(build_reels, "write_reel_file", lambda mode, columns: written.append(mode))
+    build_reels.main(["--mode", "REG", "--dry-run"])
+    assert written == []
+    assert capsys.readouterr().out.startswith("REG: ")
+    build_reels.main([])
+    assert written == list(build_reels.MODES)
+
+
+def test_anneal_smoke():
+    config = design_reels.GameConfig()
+    targets = {"regular_rate": 1 / 200, "super_rate": 1 / 2000, "tumble_rtp": 0.5}
+    start = build_reels.build_columns("BASE", build_reels.MODES["BASE"])
+
+    def anneal():
+        evaluator = design_reels.ReelEvaluator(config, targets, num_boards=50, seed=0)
+        return design_reels.anneal(start, evaluator, 4, random.Random(3), report_every=100)
+
+    best, best_stats = anneal()
+    build_reels.validate_columns(best, allow_super_scatter=True, mode_name="best")
+    assert (
+        best_stats["score"]
+        <= design_reels.ReelEvaluator(config, targets, num_boards=50, seed=0).evaluate(start)["score"]
+    )
+    assert anneal() == (best, best_stats)
+
+
+def test_tumble_estimate_rejects_multiplier_symbols():
+    config = design_reels.GameConfig()
+    evaluator = design_reels.ReelEvaluator(config, {}, num_boards=5, seed=0)
+    columns = build_reels.build_columns("REG", build_reels.MODES["REG"])
+    with pytest.raises(ValueError, match="multipliers"):
+        evaluator.estimate_tumble_rtp(columns)
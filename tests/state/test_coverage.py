@@ -0,0 +1,62 @@
+"""Fence assignment of coverage measurement, mirroring the optimizer's ordered removal."""
+
+import json
+from types import SimpleNamespace
+
+from src.state.coverage import assign_fence_books, measure_coverage
+
+CRITERIA = ["0", "basegame", "freegame", "freegame", "basegame", "wincap"]
+WINS = [0.0, 2.0, 0.0, 50.0, 5.0, 50.0]
+FORCE_RECORDS = [
+    {"search": [{"name": "symbol", "value": "scatter"}], "bookIds": [2, 3]},
+    {"search": [{"name": "symbol", "value": "bomb"}], "bookIds": [1, 3]},
+]
+
+
+def fence(search_range=(-1, -1), force_search=None):
+    return {"search_range": search_range, "force_search": {} if force_search is None else force_search}
+
+
+def test_overlapping_fences_take_remaining_books_in_order():
+    conditions = {
+        "wincap": fence((50.0, 50.0)),
+        "0": fence((0, 0)),
+        "freegame": fence(force_search={"symbol": "scatter"}),
+        "range": fence((1, 10)),
+        "basegame": fence(),
+    }
+    fence_books = assign_fence_books(conditions, CRITERIA, WINS, FORCE_RECORDS)
+    # book 2 won nothing and book 3 hit the wincap, so both scatter books were taken before the freegame fence
+    assert fence_books == {"wincap": {3, 5}, "0": {0, 2}, "freegame": set(), "range": {1}, "basegame": {4}}
+
+    reordered = {"freegame": conditions["freegame"], "0": conditions["0"], "basegame": conditions["basegame"]}
+    assert assign_fence_books(reordered, CRITERIA, WINS, FORCE_RECORDS) == {
+        "freegame": {2, 3},
+        "0": {0},
+        "basegame": {1, 4, 5},
+    }
+
+
+def test_measure_coverage_counts_assigned_books(tmp_path):
+    with open(tmp_path / "segmented.csv", "w", encoding="UTF-8") as f:
+        f.writelines(f"{book_id},{criteria},0,0\n" for book_id, criteria in enumerate(CRITERIA))
+    with open(tmp_path / "lookup.csv", "w", encoding="UTF-8") as f:
+        f.writelines(f"{book_id},1,{int(win * 100)}\n" for book_id, win in enumerate(WINS))
+    with open(tmp_path / "force_record_base.json", "w", encoding="UTF-8") as f:
+        json.dump(FORCE_RECORDS, f)
+    conditions = {"0": fence((0, 0)), "freegame": fence(force_search={"symbol": "scatter"}), "basegame": fence()}
+    gamestate = SimpleNamespace(
+        config=SimpleNamespace(
+            opt_params={"base": {"conditions": conditions, "scaling": [{"criteria": "basegame", "win_range": (1, 10)}]}}
+        ),
+        output_files=SimpleNamespace(
+            get_final_segmented_name=lambda betmode: str(tmp_path / "segmented.csv"),
+            get_final_lookup_name=lambda betmode: str(tmp_path / "lookup.csv"),
+            force_path=str(tmp_path),
+        ),
+    )
+    rows = {row["name"]: row for row in measure_coverage(gamestate, "base", min_fence_books=2, min_range_books=2)}
+    assert rows["fence 0"]["count"] == 2
+    assert rows["fence freegame"]["count"] == 1 and rows["fence freegame"]["rate"] == 0.5
+    assert rows["fence basegame"]["count"] == 3
+    assert rows["basegame win range (1, 10)"]["count"] == 2
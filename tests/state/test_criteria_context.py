@@ -0,0 +1,22 @@
+"""Test compiled samplers and win level lookups."""
+
+import random
+
+from src.calculations.statistics import WeightedSampler, get_random_outcome
+from src.config.config import Config
+
+
+def test_weighted_sampler_matches_get_random_outcome():
+    distribution = {"BR0": 3, "FR0": 0, "WCAP": 1.5, 7: 10}
+    sampler = WeightedSampler(distribution)
+    rng_a, rng_b = random.Random(5), random.Random(5)
+    for _ in range(2000):
+        assert sampler.sample(rng_a) == get_random_outcome(distribution, rng=rng_b)
+
+
+def test_get_win_level_bisect():
+    config = Config()
+    levels = config.win_levels["standard"]
+    for win in [0, 0.05, 0.1, 1.0, 4.99, 99.9, 3000.0, 1e9]:
+        expected = next((idx for idx, pair in levels.items() if pair[0] <= win < pair[1]), None)
+        assert config.get_win_level(win, "standard") == expected
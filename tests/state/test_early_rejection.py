@@ -0,0 +1,41 @@
+"""Test early criteria rejection predicates and statistics."""
+
+from types import SimpleNamespace
+
+from src.state.early_rejection import (
+    win_exceeds_criteria,
+    new_rejection_stats,
+    merge_rejection_stats,
+    get_saved_steps,
+)
+
+
+def make_gamestate(win_criteria, running_win, wincap=5000, win_scale=None):
+    context = SimpleNamespace(win_criteria=win_criteria)
+    return SimpleNamespace(
+        get_criteria_context=lambda: context,
+        win_manager=SimpleNamespace(running_bet_win=running_win),
+        config=SimpleNamespace(wincap=wincap),
+        win_scale=win_scale,
+        wincap_win=wincap if win_scale is None else wincap * win_scale,
+    )
+
+
+def test_win_exceeds_criteria():
+    assert win_exceeds_criteria(make_gamestate(0.0, 0.2), "reveal")
+    assert not win_exceeds_criteria(make_gamestate(0.0, 0.0), "reveal")
+    assert not win_exceeds_criteria(make_gamestate(None, 10.0), "tumble")
+    assert win_exceeds_criteria(make_gamestate(0.0, 20, win_scale=100), "reveal")
+    assert not win_exceeds_criteria(make_gamestate(5000.0, 900000, win_scale=100), "tumble")
+    assert not win_exceeds_criteria(make_gamestate(5000, 6000.0), "freegame")
+
+
+def test_merge_rejection_stats():
+    totals = new_rejection_stats()
+    for _ in range(2):
+        merge_rejection_stats(
+            totals,
+            {"completed": 2, "completed_steps": 10, "rejected": 3, "rejected_steps": 3, "stages": {"reveal": 3}},
+        )
+    assert totals["rejected"] == 6 and totals["stages"] == {"reveal": 6}
+    assert get_saved_steps(totals) == 6 * 5 - 6
@@ -0,0 +1,34 @@
+"""Fixed-point win conversions and payout quantisation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.wins.fixed_point import get_scaled_paytable, round_half_even_div, units_to_cents
+from src.write_data.write_data import quantize_cents
+
+
+def test_round_half_even_div():
+    assert round_half_even_div(25, 10) == 2
+    assert round_half_even_div(35, 10) == 4
+    assert round_half_even_div(36, 10) == 4
+    assert round_half_even_div(-25, 10) == -2
+
+
+def test_units_to_cents():
+    assert units_to_cents(3930, 100) == 3930
+    assert units_to_cents(39300, 1000) == 3930
+
+
+def test_quantize_cents():
+    assert quantize_cents(2505) == 2500
+    assert quantize_cents(2515) == 2520
+    assert quantize_cents(9999) == 10000
+
+
+def test_scaled_paytable():
+    config = SimpleNamespace(paytable={(8, "H1"): 10.0, (8, "L1"): 0.25})
+    assert get_scaled_paytable(config, 100) == {(8, "H1"): 1000, (8, "L1"): 25}
+    assert get_scaled_paytable(config, None) is config.paytable
+    with pytest.raises(AssertionError):
+        get_scaled_paytable(config, 10)
@@ -0,0 +1,44 @@
+"""Test gamestate random number streams."""
+
+import random
+
+from src.state.rng import PhiloxRandom, make_rng
+
+
+def test_mt_mode_uses_module_random():
+    rng = make_rng("mt")
+    rng.seed(11)
+    drawn = [rng.random() for _ in range(5)]
+    random.seed(11)
+    assert drawn == [random.random() for _ in range(5)]
+
+
+def test_philox_streams_reproducible_by_sim_id():
+    rng = PhiloxRandom(3)
+    rng.seed(42)
+    first = [rng.randint(0, 100) for _ in range(200)]
+    rng.seed(7)
+    rng.shuffle(list(range(50)))
+    rng.seed(42)
+    assert first == [rng.randint(0, 100) for _ in range(200)]
+
+
+def test_philox_streams_differ_by_key():
+    def draws(base_seed, sim):
+        rng = PhiloxRandom(base_seed)
+        rng.seed(sim)
+        return [rng.getrandbits(64) for _ in range(10)]
+
+    assert draws(0, 5) != draws(1, 5)
+    assert draws(0, 5) != draws(0, 6)
+
+
+def test_philox_state_roundtrip():
+    rng = PhiloxRandom()
+    rng.seed(9)
+    rng.random()
+    state = rng.getstate()
+    drawn = [rng.choice("abcdef") for _ in range(100)]
+    rng.setstate(state)
+    assert drawn == [rng.choice("abcdef") for _ in range(100)]
+    assert all(0.0 <= rng.random() < 1.0 for _ in range(1000))
@@ -0,0 +1,191 @@
+"""End-to-end create_books and append_books runs on the sample scatter game, written under tmp_path."""
+
+import os
+import sys
+import json
+import inspect
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+import zstandard as zstd
+
+GAME_DIR = Path(__file__).resolve().parents[2] / "games" / "0_0_scatter"
+if str(GAME_DIR) not in sys.path:
+    sys.path.insert(0, str(GAME_DIR))
+
+GameConfig = import_module("games.0_0_scatter.game_config").GameConfig
+GameState = import_module("games.0_0_scatter.gamestate").GameState
+
+import src.config.output_filenames as output_filenames
+from src.config.validation import get_validation
+from src.state.run_sims import create_books, append_books
+
+RUN_SIMS = GameState.run_sims
+NUM_SIMS = {"base": 40, "regular_buy": 8}
+BATCH_SIZE = 10
+
+
+def simulate(root: Path, threads: int = 1, bonus_bank_size: int = 0, validation: dict = None, **kwargs) -> GameState:
+    """create_books for NUM_SIMS with every library file written under root."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(output_filenames, "PATH_TO_GAMES", str(root))
+        config = GameConfig()
+        config.bonus_bank_size = bonus_bank_size
+        if validation is not None:
+            config.validation = validation
+        gamestate = GameState(config)
+        create_books(gamestate, config, dict(NUM_SIMS), BATCH_SIZE, threads, True, False, **kwargs)
+    return gamestate
+
+
+def read_outputs(gamestate: GameState) -> dict:
+    """{relative path: bytes} of the lookup tables and books of a run."""
+    outputs = {}
+    for folder in (gamestate.output_files.lookup_path, gamestate.output_files.publish_path):
+        for filename in sorted(os.listdir(folder)):
+            with open(os.path.join(folder, filename), "rb") as f:
+                outputs[os.path.join(os.path.basename(folder), filename)] = f.read()
+    return outputs
+
+
+def read_book_frames(filename: str) -> list:
+    """Books of each zstd frame of a compressed books file."""
+    with open(filename, "rb") as f:
+        data = f.read()
+    frames = []
+    while data:
+        decompressor = zstd.ZstdDecompressor().decompressobj()
+        frames.append([json.loads(line) for line in decompressor.decompress(data).decode("UTF-8").splitlines()])
+        data = decompressor.unused_data
+    return frames
+
+
+def read_lookup(filename: str) -> list:
+    with open(filename, "r", encoding="UTF-8") as f:
+        return [[int(value) for value in line.split(",")] for line in f if line.strip()]
+
+
+@pytest.fixture(scope="module")
+def sequential_outputs(tmp_path_factory):
+    return read_outputs(simulate(tmp_path_factory.mktemp("sequential")))
+
+
+def test_worker_processes_match_sequential(tmp_path, sequential_outputs):
+    outputs = read_outputs(simulate(tmp_path, threads=2))
+    assert "lookup_tables/lookUpTable_base.csv" in outputs
+    assert outputs == sequential_outputs
+
+
+def test_sampled_validation_stays_on_the_config(tmp_path, sequential_outputs):
+    outputs = read_outputs(simulate(tmp_path, validation={"level": "sampled", "sample_every": 7}))
+    assert outputs == sequential_outputs
+    assert get_validation()["level"] == "full"
+
+
+def test_append_books_continues_ids_in_new_frames(tmp_path, monkeypatch):
+    gamestate = simulate(tmp_path)
+    monkeypatch.setattr(output_filenames, "PATH_TO_GAMES", str(tmp_path))
+    book_file = gamestate.output_files.get_final_book_name("base", True)
+    frames = read_book_frames(book_file)
+    assert [len(frame) for frame in frames] == [40]
+
+    with pytest.warns(UserWarning, match="rerun optimization"):
+        append_books(gamestate, gamestate.config, {"base": 20}, BATCH_SIZE, 1, True)
+    appended = read_book_frames(book_file)
+    # existing frame untouched, one new frame per appended chunk
+    assert appended[0] == frames[0]
+    assert [len(frame) for frame in appended] == [40, 10, 10]
+    books = [book for frame in appended for book in frame]
+    assert [book["id"] for book in books] == list(range(60))
+    for lookup_name in (
+        gamestate.output_files.get_final_lookup_name("base"),
+        gamestate.output_files.get_optimized_lookup_name("base"),
+    ):
+        assert [(row[0], row[2]) for row in read_lookup(lookup_name)] == [
+            (book["id"], book["payoutMultiplier"]) for book in books
+        ]
+
+
+def test_concurrent_modes_match_sequential(tmp_path, sequential_outputs):
+    assert read_outputs(simulate(tmp_path, threads=2, concurrent_modes=True)) == sequential_outputs
+
+
+@pytest.mark.filterwarnings("ignore:Thread backend is running with the GIL enabled")
+def test_thread_backend_matches_sequential(tmp_path, sequential_outputs):
+    assert read_outputs(simulate(tmp_path, threads=2, backend="thread")) == sequential_outputs
+
+
+def test_stats_only_writes_lookups_without_books(tmp_path, sequential_outputs):
+    gamestate = simulate(tmp_path, stats_only=True)
+    outputs = read_outputs(gamestate)
+    assert not [name for name in outputs if "books" in name]
+    assert not os.listdir(gamestate.output_files.book_path)
+    assert outputs == {name: data for name, data in sequential_outputs.items() if "books" not in name}
+
+
+def fail_chunks(monkeypatch, should_fail):
+    """
+    Patch GameState.run_sims to raise for chunks where should_fail(betmode, thread, repeat), returns the chunks started.
+    """
+    original = RUN_SIMS
+    parameters = inspect.signature(original)
+    started = []
+
+    def run_sims(self, *args, **kwargs):
+        arguments = parameters.bind(self, *args, **kwargs).arguments
+        chunk = (arguments["betmode"], arguments["thread_index"], arguments["repeat_count"])
+        started.append(chunk)
+        if should_fail(*chunk):
+            raise RuntimeError(f"chunk {chunk} interrupted")
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(GameState, "run_sims", run_sims)
+    return started
+
+
+def test_resume_skips_complete_chunks_and_reruns_corrupted(tmp_path, monkeypatch, sequential_outputs):
+    fail_chunks(monkeypatch, lambda betmode, thread, repeat: betmode == "base" and repeat == 2)
+    with pytest.raises(RuntimeError, match="interrupted"):
+        simulate(tmp_path)
+
+    monkeypatch.setattr(output_filenames, "PATH_TO_GAMES", str(tmp_path))
+    with open(GameState(GameConfig()).output_files.get_temp_lookup_name("base", 0, 1), "a", encoding="UTF-8") as f:
+        f.write("0,1,0\n")
+    started = fail_chunks(monkeypatch, lambda *chunk: False)
+    outputs = read_outputs(simulate(tmp_path, resume=True))
+    assert started == [("base", 0, 1), ("base", 0, 2), ("base", 0, 3), ("regular_buy", 0, 0)]
+    assert outputs == sequential_outputs
+
+
+def test_stats_only_checkpoint_is_not_resumed_with_books(tmp_path, monkeypatch, sequential_outputs):
+    fail_chunks(monkeypatch, lambda betmode, thread, repeat: repeat == 3)
+    with pytest.raises(RuntimeError, match="interrupted"):
+        simulate(tmp_path, stats_only=True)
+
+    started = fail_chunks(monkeypatch, lambda *chunk: False)
+    outputs = read_outputs(simulate(tmp_path, resume=True))
+    assert started[:4] == [("base", 0, repeat) for repeat in range(4)]
+    assert outputs == sequential_outputs
+
+
+def test_failed_worker_is_retried(tmp_path, monkeypatch, sequential_outputs):
+    marker = tmp_path / "failed_once"
+
+    def fail_once(betmode, thread, repeat):
+        if betmode == "base" and (thread, repeat) == (1, 0) and not marker.exists():
+            marker.touch()
+            return True
+        return False
+
+    fail_chunks(monkeypatch, fail_once)
+    assert read_outputs(simulate(tmp_path, threads=2)) == sequential_outputs
+    assert marker.exists()
+
+
+@pytest.mark.filterwarnings("ignore:Thread backend is running with the GIL enabled")
+@pytest.mark.filterwarnings("ignore:.*banked outcomes per bonus entry")
+def test_bonus_bank_books_do_not_depend_on_workers(tmp_path):
+    sequential = read_outputs(simulate(tmp_path / "sequential", bonus_bank_size=2))
+    assert read_outputs(simulate(tmp_path / "processes", threads=2, bonus_bank_size=2)) == sequential
+    assert read_outputs(simulate(tmp_path / "threads", threads=2, backend="thread", bonus_bank_size=2)) == sequential
@@ -0,0 +1,26 @@
+"""Rate-limited simulation event logging."""
+
+from src.state.sim_logging import SimLogger, merge_log_counts
+
+
+def test_events_are_counted_silently(capsys):
+    log = SimLogger()
+    for _ in range(5):
+        log.event("BuyEntry", scatters=4)
+    assert log.counts == {"BuyEntry": 5}
+    assert capsys.readouterr().out == ""
+
+
+def test_verbose_events_are_sampled_and_limited(capsys):
+    log = SimLogger(verbose=("BuyEntry",), max_lines=2, sample_every=2)
+    for idx in range(10):
+        log.event("BuyEntry", idx=idx)
+    assert capsys.readouterr().out.splitlines() == ["[BuyEntry] idx=0", "[BuyEntry] idx=2"]
+    log.reset()
+    assert log.counts == {}
+
+
+def test_merge_log_counts():
+    totals = {"BuyEntry": 2}
+    merge_log_counts(totals, {"BuyEntry": 3, "RetriggerCheck": 1})
+    assert totals == {"BuyEntry": 5, "RetriggerCheck": 1}
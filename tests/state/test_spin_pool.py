@@ -0,0 +1,30 @@
+"""Pooled spin containers."""
+
+from src.state.books import Book, StatsBook
+from src.state.spin_pool import SpinPool
+
+
+def test_pooled_book_is_reset_and_detached():
+    pool = SpinPool(3, [2, 2, 2])
+    book = pool.get_book(Book, 1, "basegame")
+    book.add_event({"index": 0})
+    detached = book.detach()
+    book.add_event({"index": 1})
+    assert pool.get_book(Book, 2, "freegame") is book
+    assert book.events == [] and book.id == 2 and book.criteria == "freegame"
+    assert detached["events"] == [{"index": 0}]
+    assert pool.get_book(StatsBook, 3, "0") is not book
+
+
+def test_board_and_win_data_are_reset_in_place():
+    pool = SpinPool(2, [3, 2])
+    board = pool.get_board()
+    board[0].insert(0, "S")
+    assert pool.get_board() is board
+    assert [len(reel) for reel in board] == [3, 2]
+    win_data = pool.reset_win_data()
+    win_data["wins"].append({"win": 1})
+    win_data["totalWin"] = 1
+    assert pool.reset_win_data() == {"totalWin": 0, "wins": []}
+    pool.anticipation[1] = 2
+    assert pool.reset_anticipation() == [0, 0]
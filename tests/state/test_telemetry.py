@@ -0,0 +1,20 @@
+"""Test per-criteria repeat telemetry."""
+
+from src.state.telemetry import get_attempt_bucket, update_criteria_telemetry, merge_criteria_telemetry
+
+
+def test_attempt_buckets():
+    assert [get_attempt_bucket(n) for n in (0, 1, 2, 3, 4, 7, 8, 1000)] == ["1", "1", "2", "2", "4", "4", "8", "512"]
+
+
+def test_merge_criteria_telemetry():
+    chunks = [{}, {}]
+    update_criteria_telemetry(chunks[0], "0", 5, 1.0, 0.8)
+    update_criteria_telemetry(chunks[1], "0", 1, 0.1, 0.0)
+    update_criteria_telemetry(chunks[1], "basegame", 1, 0.1, 0.0)
+    totals = {}
+    for chunk in chunks:
+        merge_criteria_telemetry(totals, chunk)
+    assert totals["0"]["books"] == 2 and totals["0"]["attempts"] == 6 and totals["0"]["max_attempts"] == 5
+    assert totals["0"]["histogram"] == {"4": 1, "1": 1}
+    assert totals["basegame"]["books"] == 1
@@ -0,0 +1,35 @@
+"""Validation level selection."""
+
+import pytest
+
+from src.config.validation import get_validation, set_validation, should_validate
+
+
+@pytest.fixture
+def restore_validation():
+    settings = get_validation()
+    yield
+    set_validation(**settings)
+
+
+def test_full_by_default():
+    assert get_validation()["level"] == "full"
+    assert should_validate(7)
+
+
+def test_sampled_and_off(restore_validation):
+    set_validation("sampled", sample_every=10)
+    assert should_validate(20)
+    assert not should_validate(21)
+    assert should_validate()
+    set_validation("off")
+    assert not should_validate(20)
+    assert not should_validate()
+    with pytest.raises(AssertionError):
+        set_validation("sometimes")
+
+
+def test_settings_dict_overrides_process_level():
+    assert not should_validate(21, {"level": "sampled", "sample_every": 10})
+    assert not should_validate(20, {"level": "off", "sample_every": 10})
+    assert should_validate(21)
@@ -0,0 +1,17 @@
+"""Test compact positions and their event format."""
+
+from src.calculations.position import Position, position_json, positions_json
+
+
+def test_position_is_a_tuple():
+    pos = Position(2, 3)
+    assert pos == (2, 3)
+    assert (pos.reel, pos.row) == (2, 3)
+    assert pos in {(2, 3)}
+
+
+def test_positions_json_applies_padding_offset():
+    positions = [Position(0, 0), Position(4, 2)]
+    assert positions_json(positions) == [{"reel": 0, "row": 0}, {"reel": 4, "row": 2}]
+    assert positions_json(positions, 1) == [{"reel": 0, "row": 1}, {"reel": 4, "row": 3}]
+    assert position_json(Position(1, 1), 1) == {"reel": 1, "row": 2}
@@ -0,0 +1,72 @@
+"""Test exact first-reveal distributions against a full enumeration of reel stops."""
+
+import pytest
+from src.calculations.reveal_distribution import get_reel_windows, get_reveal_distributions, get_mix_distribution
+
+
+class GameRevealConfig:
+    """Small board with stacked scatters and a super scatter on several reels."""
+
+    def __init__(self):
+        self.num_reels = 3
+        self.num_rows = [2] * self.num_reels
+        self.paytable = {(3, "H1"): 5.0, (4, "H1"): 10.0, (2, "S"): 1.0, (3, "S"): 4.0}
+        self.special_symbols = {"wild": ["W"], "scatter": ["S"], "super_scatter": ["BS"]}
+        self.symbol_aliases = {"BS": "S"}
+        self.reels = {
+            "A": [["H1", "S", "S", "L1"], ["BS", "H1", "W", "L1"], ["BS", "L1", "H1", "S"]],
+            "B": [["L1", "H1", "H1"], ["S", "L1", "L1"], ["H1", "L1", "BS"]],
+        }
+
+
+def enumerate_reveals(config, reelstrip):
+    """Every board create_board_reelstrips can draw, with its probability."""
+    scatter_names = {"S", "BS"}
+    valid = []
+    for reel in range(config.num_reels):
+        windows = get_reel_windows(reelstrip[reel], config.num_rows[reel])
+        valid.append([w for w in windows if sum(1 for name in w if name in scatter_names) <= 1])
+
+    boards = [([], False, 1.0)]
+    for reel in range(config.num_reels):
+        next_boards = []
+        for board, bs_used, prob in boards:
+            options = [w for w in valid[reel] if "BS" not in w] if bs_used else valid[reel]
+            for window in options:
+                next_boards.append((board + [window], bs_used or "BS" in window, prob / len(options)))
+        boards = next_boards
+    return [(board, prob) for board, _, prob in boards]
+
+
+def test_reveal_distribution_matches_enumeration():
+    config = GameRevealConfig()
+    distributions = get_reveal_distributions(config)
+    for reelstrip_id, reelstrip in config.reels.items():
+        scatter_counts, symbol_rtp = {}, {"H1": 0.0, "S": 0.0}
+        for board, prob in enumerate_reveals(config, reelstrip):
+            names = [name for window in board for name in window]
+            key = (names.count("S"), names.count("BS"))
+            scatter_counts[key] = scatter_counts.get(key, 0) + prob
+            wilds = names.count("W")
+            symbol_rtp["H1"] += prob * config.paytable.get((names.count("H1") + wilds, "H1"), 0)
+            symbol_rtp["S"] += prob * config.paytable.get((names.count("S") + names.count("BS") + wilds, "S"), 0)
+
+        distribution = distributions[reelstrip_id]
+        assert set(distribution.scatter_counts) == set(scatter_counts)
+        for key, prob in scatter_counts.items():
+            assert distribution.scatter_counts[key] == pytest.approx(prob)
+        for symbol, rtp in distribution.get_symbol_rtp().items():
+            assert rtp == pytest.approx(symbol_rtp[symbol])
+
+
+def test_reveal_distribution_mix_and_bonus_probabilities():
+    config = GameRevealConfig()
+    distributions = get_reveal_distributions(config)
+    mix = get_mix_distribution(distributions, {"A": 3, "B": 1})
+    assert sum(mix.scatter_counts.values()) == pytest.approx(1.0)
+    assert mix.get_rtp() == pytest.approx(0.75 * distributions["A"].get_rtp() + 0.25 * distributions["B"].get_rtp())
+
+    classify = lambda scatters, super_scatters: "super" if super_scatters == 1 and scatters >= 1 else None
+    expected = sum(prob for (s, bs), prob in mix.scatter_counts.items() if bs == 1 and s >= 1)
+    assert mix.get_bonus_probabilities(classify) == pytest.approx({"super": expected})
+    assert max(bs for _, bs in mix.scatter_counts) == 1
@@ -103,3 +103,19 @@ def test_scatterpay_wilds(gamestate):
             assert wd["win"] == 3
 
     assert windata["totalWin"] == 53
+
+
+def test_scatterpay_symbol_aliases(gamestate):
+    """Aliased symbols pay as their target symbol without renaming board symbols."""
+    gamestate.config.symbol_aliases = {"H2": "H1"}
+    for idx, _ in enumerate(gamestate.board):
+        for idy, _ in enumerate(gamestate.board[idx]):
+            gamestate.board[idx][idy] = gamestate.create_symbol("H2" if idx == 0 else "H1")
+
+    windata = Scatter.get_scatterpay_wins(gamestate.config, gamestate.board, global_multiplier=1)
+
+    assert len(windata["wins"]) == 1
+    assert windata["wins"][0]["symbol"] == "H1"
+    assert len(windata["wins"][0]["positions"]) == 25
+    assert windata["totalWin"] == 80
+    assert all(symbol.name == "H2" for symbol in gamestate.board[0])